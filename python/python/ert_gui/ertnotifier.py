@@ -1,20 +1,46 @@
 import sys
 
+from collections import Counter
+
 try:
-  from PyQt4.QtCore import QObject, pyqtSignal, pyqtSlot
+  from PyQt4.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, QCoreApplication
 except ImportError:
-  from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+  from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer, QCoreApplication
 
 from res.enkf import EnKFMain
 
 
 class ErtNotifier(QObject):
+    """
+    Broadcasts changes to ERT. Changes reported with emitErtChange() are
+    collected and emitted together when control returns to the event loop,
+    so a burst of changes from one user action is emitted once. Each kind of
+    change has its own signal, and ertChanged is emitted once for any change.
+    caseDataChanged is emitted with an empty case name if all cases may have
+    changed.
+    """
+    CASE_LIST = 1
+    CURRENT_CASE = 2
+    CASE_DATA = 4
+    CONFIG = 8
+    ALL = CASE_LIST | CURRENT_CASE | CASE_DATA | CONFIG
+
     ertChanged = pyqtSignal()
+    caseListChanged = pyqtSignal()
+    currentCaseChanged = pyqtSignal()
+    caseDataChanged = pyqtSignal(str)
+    configChanged = pyqtSignal()
 
     def __init__(self, ert, config_file, parent=None):
         QObject.__init__(self, parent)
         self._ert = ert
         self._config_file = config_file
+        self._generation = 0
+
+        self._pending_changes = 0
+        self._pending_cases = []
+        self._flush_scheduled = False
+        self._counters = Counter()
 
     def _checkErt(self):
         if self._ert is None:
@@ -33,12 +59,78 @@ class ErtNotifier(QObject):
         self._checkErt()
         return self._config_file
 
-    pyqtSlot()
-    def emitErtChange(self):
+    @property
+    def generation(self):
+        """ Incremented on every emitErtChange(), lets caches detect changes without listening. @rtype: int """
+        return self._generation
+
+    def emitErtChange(self, changes=ALL, case=None):
+        """
+        Reports a change. The signals are emitted from the event loop, or
+        immediately if there is no application.
+        @type changes: int a combination of CASE_LIST, CURRENT_CASE, CASE_DATA and CONFIG
+        @type case: str or None the case with changed data, None means all cases
+        """
         self._checkErt()
+        self._generation += 1
+        self._counters["changes"] += 1
+
+        self._pending_changes |= changes
+        if changes & ErtNotifier.CASE_DATA:
+            if case is None:
+                self._pending_cases = [None]
+            elif not None in self._pending_cases and not str(case) in self._pending_cases:
+                self._pending_cases.append(str(case))
+
+        if QCoreApplication.instance() is None:
+            self.flushErtChanges()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flushErtChanges)
+
+    @pyqtSlot()
+    def flushErtChanges(self):
+        """ Emits the changes reported since the last flush. """
+        self._flush_scheduled = False
+        changes = self._pending_changes
+        cases = self._pending_cases
+        self._pending_changes = 0
+        self._pending_cases = []
+
+        if changes == 0:
+            return
+
+        self._counters["flushes"] += 1
+
+        if changes & ErtNotifier.CONFIG:
+            self.configChanged.emit()
+
+        if changes & ErtNotifier.CASE_LIST:
+            self.caseListChanged.emit()
+
+        if changes & ErtNotifier.CURRENT_CASE:
+            self.currentCaseChanged.emit()
+
+        if changes & ErtNotifier.CASE_DATA:
+            for case in cases:
+                self.caseDataChanged.emit("" if case is None else case)
+
         self.ertChanged.emit()
 
-    pyqtSignal()
+    def countRepopulate(self, name):
+        """ Widgets and models call this when they rebuild their content from scratch. """
+        self._counters["repopulate:%s" % name] += 1
+
+    def counters(self):
+        """
+        The number of reported changes, emitted batches and repopulates per widget since the last reset.
+        @rtype: dict[str, int]
+        """
+        return dict(self._counters)
+
+    def resetCounters(self):
+        self._counters.clear()
+
     def reloadERT(self, config_file):
         import sys
         import os
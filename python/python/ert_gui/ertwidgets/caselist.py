@@ -88,7 +88,7 @@ class CaseList(QWidget):
 
         self.setLayout(layout)
 
-        ERT.ertChanged.connect(self.updateList)
+        ERT.caseListChanged.connect(self.updateList)
         self.updateList()
 
     def setSelectable(self, selectable):
@@ -111,6 +111,7 @@ class CaseList(QWidget):
 
     def updateList(self):
         """Retrieves data from the model and inserts it into the list"""
+        ERT.countRepopulate("CaseList")
         case_list = getAllCases()
 
         self._list.clear()
@@ -24,7 +24,11 @@ class CaseSelector(QComboBox):
         self.populate()
 
         self.currentIndexChanged[int].connect(self.selectionChanged)
-        ERT.ertChanged.connect(self.populate)
+        ERT.caseListChanged.connect(self.populate)
+        ERT.currentCaseChanged.connect(self.populate)
+
+        if self._show_only_initialized:
+            ERT.caseDataChanged.connect(self._caseDataChanged)
 
     def _getAllCases(self):
         if self._show_only_initialized:
@@ -39,15 +43,22 @@ class CaseSelector(QComboBox):
             item = self._getAllCases()[index]
             selectOrCreateNewCase(item)
 
+    def _caseDataChanged(self, case_name):
+        self.populate()
+
     def populate(self):
         block = self.signalsBlocked()
         self.blockSignals(True)
 
         case_list = self._getAllCases()
-        self.clear()
+        items = [str(self.itemText(index)) for index in range(self.count())]
+
+        if items != case_list:
+            ERT.countRepopulate("CaseSelector")
+            self.clear()
 
-        for case in case_list:
-            self.addItem(case)
+            for case in case_list:
+                self.addItem(case)
 
         current_index = 0
         current_case = getCurrentCaseName()
@@ -0,0 +1,156 @@
+import json
+import os
+from collections import Counter
+
+from res.enkf import RealizationStateEnum
+
+
+class CaseIndex(object):
+    """
+    A small summary of a case stored next to the case data, so that the
+    state of historic cases can be shown without mounting their storage.
+
+    The index is written to <ENSPATH>/<case>/case_index.json and contains
+    the realization states, the stored summary keys, the span of the time
+    map and a stamp of the files these are read from. An index is only used
+    while the stamp matches the files on disk.
+
+    Reading the summary keys mounts the case, so indexes are only created
+    where a case has just been written (at the end of a run, after an update
+    and after initialization). Readers only load existing indexes, and read
+    the case the usual way when there is none.
+    """
+    FILE_NAME = "case_index.json"
+    VERSION = 2
+    STAMPED_FILES = ("state-map", "time-map", "summary-key-set")
+
+    def __init__(self, case, states, initialized, summary_keys, time_span, report_step_count, stamp):
+        """
+        @type case: str
+        @type states: tuple of RealizationStateEnum
+        @type initialized: bool
+        @type summary_keys: list of str
+        @type time_span: tuple of (str, str) or None
+        @type report_step_count: int
+        @type stamp: list of [float, int]
+        """
+        super(CaseIndex, self).__init__()
+        self.case = case
+        self.states = tuple(states)
+        self.initialized = initialized
+        self.summary_keys = list(summary_keys)
+        self.time_span = time_span
+        self.report_step_count = report_step_count
+        self.stamp = stamp
+
+    @property
+    def state_counts(self):
+        """ @rtype: Counter """
+        return Counter(self.states)
+
+    def hasData(self):
+        """ @rtype: bool """
+        return RealizationStateEnum.STATE_HAS_DATA in self.states
+
+    @staticmethod
+    def indexPath(ens_path, case):
+        """ @rtype: str """
+        return os.path.join(ens_path, case, CaseIndex.FILE_NAME)
+
+    @staticmethod
+    def caseStamp(ens_path, case):
+        """
+        The modification time and size of the state map, the time map and the
+        summary key set of the case, [0, 0] for a missing file. The index is
+        made from these files, so only they are checked.
+        @rtype: list of [float, int]
+        """
+        files_path = os.path.join(ens_path, case, "files")
+
+        stamp = []
+        for file_name in CaseIndex.STAMPED_FILES:
+            try:
+                stat = os.stat(os.path.join(files_path, file_name))
+                stamp.append([stat.st_mtime, stat.st_size])
+            except OSError:
+                stamp.append([0, 0])
+
+        return stamp
+
+    @classmethod
+    def load(cls, ens_path, case):
+        """
+        Returns the index of the case, or None if there is no index or the
+        case has been modified after the index was written.
+        @rtype: CaseIndex or None
+        """
+        path = cls.indexPath(ens_path, case)
+
+        if not os.path.isfile(path):
+            return None
+
+        try:
+            with open(path, "r") as index_file:
+                content = json.load(index_file)
+
+            if content["version"] != cls.VERSION or cls.caseStamp(ens_path, case) != content["stamp"]:
+                return None
+
+            states_by_value = {int(state): state for state in RealizationStateEnum.enums()}
+            states = [states_by_value[value] for value in content["states"]]
+
+            time_span = content["time_span"]
+            if time_span is not None:
+                time_span = tuple(time_span)
+
+            return cls(case, states, content["initialized"], content["summary_keys"], time_span, content["report_step_count"], content["stamp"])
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, ens_path):
+        """ Writes the index. Failing to write (e.g. read only storage) is not an error. """
+        content = {"version": self.VERSION,
+                   "case": self.case,
+                   "states": [int(state) for state in self.states],
+                   "initialized": self.initialized,
+                   "summary_keys": self.summary_keys,
+                   "time_span": self.time_span,
+                   "report_step_count": self.report_step_count,
+                   "stamp": self.stamp}
+
+        path = self.indexPath(ens_path, self.case)
+        try:
+            with open(path + ".tmp", "w") as index_file:
+                json.dump(content, index_file)
+
+            os.rename(path + ".tmp", path)
+        except (IOError, OSError):
+            pass
+
+    @classmethod
+    def create(cls, ert, case, states=None, initialized=None):
+        """
+        Reads the case from storage and writes its index. This mounts the
+        case, so it should only be called for a case that has just been
+        written. The states and the initialized flag can be passed in if they
+        have already been read.
+        @type ert: res.enkf.EnKFMain
+        @rtype: CaseIndex
+        """
+        fs_manager = ert.getEnkfFsManager()
+        ens_path = ert.getModelConfig().getEnspath()
+
+        if states is None:
+            states = tuple(fs_manager.getStateMapForCase(case))
+
+        if initialized is None:
+            initialized = fs_manager.isCaseInitialized(case)
+
+        summary_keys = sorted(fs_manager.getFileSystem(case).getSummaryKeySet().keys())
+
+        time_map = [str(time) for time in fs_manager.getTimeMapForCase(case)]
+        time_span = (time_map[0], time_map[-1]) if len(time_map) > 0 else None
+
+        index = cls(case, states, initialized, summary_keys, time_span, len(time_map), cls.caseStamp(ens_path, case))
+        index.save(ens_path)
+        return index
@@ -0,0 +1,160 @@
+from collections import Counter, OrderedDict
+from threading import RLock
+
+from res.enkf import RealizationStateEnum
+from ert_gui import ERT
+from ert_gui.ertwidgets.models.case_index import CaseIndex
+
+
+class CaseMetadata(object):
+    """ A snapshot of the state of a case as stored in the EnkfFsManager. """
+
+    def __init__(self, name, hidden, running, initialized, states):
+        """
+        @type name: str
+        @type hidden: bool
+        @type running: bool
+        @type initialized: bool
+        @type states: tuple of RealizationStateEnum
+        """
+        super(CaseMetadata, self).__init__()
+        self.name = name
+        self.hidden = hidden
+        self.running = running
+        self.initialized = initialized
+        self.states = states
+        self.state_counts = Counter(states)
+
+    def hasData(self):
+        """ @rtype: bool """
+        return self.state_counts[RealizationStateEnum.STATE_HAS_DATA] > 0
+
+    def __repr__(self):
+        return "CaseMetadata(%s, hidden=%s, running=%s, initialized=%s)" % (self.name, self.hidden, self.running, self.initialized)
+
+
+class CaseRegistry(object):
+    """
+    Keeps the metadata of all cases so that case lists and selectors do not
+    have to rescan the EnkfFsManager and every state map on each call.
+
+    The registry is refreshed lazily on the first access after ERT has
+    emitted a change, so a burst of changes only causes one refresh. A
+    refresh always reads the case list, but only reloads the cases that are
+    new, current, running (or were running), or reported as changed.
+    Tools writing to a case other than the current one must report it with
+    ERT.emitErtChange(ErtNotifier.CASE_DATA, case). The case is reloaded when
+    the notifier emits caseDataChanged, and all cases are reloaded when the
+    case is unknown.
+
+    Cases that are not current or running are read from their CaseIndex
+    when it is up to date. The index is only written for the current case
+    and for cases reported as changed, since those have just been written.
+    Other cases without an index are read from their state map.
+    """
+    __instance = None
+
+    def __init__(self, notifier=ERT, use_case_index=True):
+        """ @type notifier: ert_gui.ertnotifier.ErtNotifier """
+        super(CaseRegistry, self).__init__()
+        self._notifier = notifier
+        self._use_case_index = use_case_index
+        self._lock = RLock()
+        self._entries = None
+        self._generation = None
+        self._invalidated = set()
+        self._refresh_count = 0
+
+        notifier.caseDataChanged.connect(self._caseDataChanged)
+
+    @classmethod
+    def sharedInstance(cls):
+        """ @rtype: CaseRegistry """
+        if cls.__instance is None:
+            cls.__instance = CaseRegistry()
+
+        return cls.__instance
+
+    @property
+    def refresh_count(self):
+        """ @rtype: int """
+        return self._refresh_count
+
+    def _caseDataChanged(self, case):
+        if len(case) == 0:
+            self.invalidateAll()
+        else:
+            self.invalidateCase(case)
+
+    def invalidateCase(self, case):
+        with self._lock:
+            self._invalidated.add(str(case))
+
+    def invalidateAll(self):
+        with self._lock:
+            self._entries = None
+
+    def caseNames(self, include_hidden=False):
+        """ @rtype: list[str] """
+        return [entry.name for entry in self.cases(include_hidden)]
+
+    def cases(self, include_hidden=False):
+        """ @rtype: list[CaseMetadata] """
+        entries = self._currentEntries()
+        return [entry for entry in entries.values() if include_hidden or not entry.hidden]
+
+    def metadata(self, case):
+        """ @rtype: CaseMetadata or None """
+        return self._currentEntries().get(str(case))
+
+    def _currentEntries(self):
+        with self._lock:
+            generation = self._notifier.generation
+
+            if self._entries is None or generation != self._generation or len(self._invalidated) > 0:
+                self._entries = self._refresh(self._entries or {})
+                self._generation = generation
+                self._invalidated = set()
+                self._refresh_count += 1
+
+            return self._entries
+
+    def _refresh(self, previous_entries):
+        ert = self._notifier.ert
+        fs_manager = ert.getEnkfFsManager()
+        current_case = str(fs_manager.getCurrentFileSystem().getCaseName())
+
+        entries = OrderedDict()
+        for case in fs_manager.getCaseList():
+            case = str(case)
+            running = fs_manager.isCaseRunning(case)
+            entry = previous_entries.get(case)
+            written = case == current_case or case in self._invalidated
+            changed = running or written
+
+            if entry is None or entry.running or changed:
+                entry = self._loadMetadata(ert, case, running, changed, written)
+
+            entries[case] = entry
+
+        return entries
+
+    def _loadMetadata(self, ert, case, running, changed, written):
+        fs_manager = ert.getEnkfFsManager()
+        hidden = fs_manager.isCaseHidden(case)
+
+        index = None
+        if self._use_case_index and not running:
+            index = CaseIndex.load(ert.getModelConfig().getEnspath(), case)
+
+            if index is not None and not changed:
+                return CaseMetadata(case, hidden, running, index.initialized, index.states)
+
+        states = tuple(fs_manager.getStateMapForCase(case))
+        initialized = fs_manager.isCaseInitialized(case)
+
+        if self._use_case_index and not running and written:
+            if index is None or index.states != states or index.initialized != initialized:
+                CaseIndex.create(ert, case, states, initialized)
+
+        return CaseMetadata(case, hidden, running, initialized, states)
@@ -1,11 +1,13 @@
 from res.analysis.analysis_module import AnalysisModule
 from res.analysis.enums.analysis_module_options_enum import AnalysisModuleOptionsEnum
-from res.enkf import RealizationStateEnum, EnkfVarType
+from res.enkf import EnkfVarType
 from res.enkf import ErtRunContext
 from res.job_queue import WorkflowRunner
 from ecl.util.util import BoolVector, StringList
 from ert_gui import ERT
+from ert_gui.ertnotifier import ErtNotifier
 from ert_gui.ertwidgets import showWaitCursorWhileWaiting
+from ert_gui.ertwidgets.models.case_registry import CaseRegistry
 
 
 def getRealizationCount():
@@ -14,24 +16,33 @@ def getRealizationCount():
 
 def getAllCases():
     """ @rtype: list[str] """
-    fs = ERT.ert.getEnkfFsManager().getCurrentFileSystem()
-    case_list = ERT.ert.getEnkfFsManager().getCaseList()
-    return [str(case) for case in case_list if not ERT.ert.getEnkfFsManager().isCaseHidden(case)]
+    return CaseRegistry.sharedInstance().caseNames()
+
+
+def getCaseMetadata(case_name):
+    """ @rtype: ert_gui.ertwidgets.models.case_registry.CaseMetadata or None """
+    return CaseRegistry.sharedInstance().metadata(case_name)
 
 
 def caseExists(case_name):
     """ @rtype: bool """
-    return str(case_name) in getAllCases()
+    metadata = getCaseMetadata(case_name)
+    return metadata is not None and not metadata.hidden
 
 
 def caseIsInitialized(case_name):
     """ @rtype: bool """
-    return ERT.ert.getEnkfFsManager().isCaseInitialized(case_name)
+    metadata = getCaseMetadata(case_name)
+
+    if metadata is None:
+        return ERT.ert.getEnkfFsManager().isCaseInitialized(case_name)
+
+    return metadata.initialized
 
 
 def getAllInitializedCases():
     """ @rtype: list[str] """
-    return [case for case in getAllCases() if caseIsInitialized(case)]
+    return [case.name for case in CaseRegistry.sharedInstance().cases() if case.initialized]
 
 
 def getCurrentCaseName():
@@ -49,25 +60,18 @@ def selectOrCreateNewCase(case_name):
     if getCurrentCaseName() != case_name:
         fs = ERT.ert.getEnkfFsManager().getFileSystem(case_name)
         ERT.ert.getEnkfFsManager().switchFileSystem(fs)
-        ERT.emitErtChange()
+        ERT.emitErtChange(ErtNotifier.CASE_LIST | ErtNotifier.CURRENT_CASE)
 
 
 def caseHasDataAndIsNotRunning(case):
     """ @rtype: bool """
-    case_has_data = False
-    state_map = ERT.ert.getEnkfFsManager().getStateMapForCase(case)
-
-    for state in state_map:
-        if state == RealizationStateEnum.STATE_HAS_DATA:
-            case_has_data = True
-            break
-
-    return case_has_data and not caseIsRunning(case)
+    metadata = getCaseMetadata(case)
+    return metadata is not None and metadata.hasData() and not caseIsRunning(case)
 
 
 def getAllCasesWithDataAndNotRunning():
     """ @rtype: list[str] """
-    return [case for case in getAllCases() if caseHasDataAndIsNotRunning(case)]
+    return [case.name for case in CaseRegistry.sharedInstance().cases() if case.hasData() and not caseIsRunning(case.name)]
 
 
 def caseIsRunning(case):
@@ -75,6 +79,12 @@ def caseIsRunning(case):
     return ERT.ert.getEnkfFsManager().isCaseRunning(case)
 
 
+def anyCaseIsRunning():
+    """ True if a simulation is writing to any case. @rtype: bool """
+    fs_manager = ERT.ert.getEnkfFsManager()
+    return any(fs_manager.isCaseRunning(case) for case in fs_manager.getCaseList())
+
+
 def getAllCasesNotRunning():
     """ @rtype: list[str] """
     return [case for case in getAllCases() if not caseIsRunning(case)]
@@ -82,8 +92,12 @@ def getAllCasesNotRunning():
 
 def getCaseRealizationStates(case_name):
     """ @rtype: list[res.enkf.enums.RealizationStateEnum] """
-    state_map = ERT.ert.getEnkfFsManager().getStateMapForCase(case_name)
-    return [state for state in state_map]
+    metadata = getCaseMetadata(case_name)
+
+    if metadata is None:
+        return list(ERT.ert.getEnkfFsManager().getStateMapForCase(case_name))
+
+    return list(metadata.states)
 
 
 @showWaitCursorWhileWaiting
@@ -97,7 +111,7 @@ def initializeCurrentCaseFromScratch(parameters, members):
     sim_fs = ERT.ert.getEnkfFsManager().getCurrentFileSystem()
     run_context = ErtRunContext.case_init(sim_fs, mask)
     ERT.ert.getEnkfFsManager().initializeFromScratch(selected_parameters, run_context)
-    ERT.emitErtChange()
+    ERT.emitErtChange(ErtNotifier.CASE_DATA, getCurrentCaseName())
 
 
 @showWaitCursorWhileWaiting
@@ -111,7 +125,7 @@ def initializeCurrentCaseFromExisting(source_case, target_case, source_report_st
         ERT.ert.getEnkfFsManager().customInitializeCurrentFromExistingCase(source_case, source_report_step, member_mask,
                                                                            selected_parameters)
 
-        ERT.emitErtChange()
+        ERT.emitErtChange(ErtNotifier.CASE_DATA, getCurrentCaseName())
 
 
 def getParameterList():
@@ -133,7 +147,7 @@ def setNumberOfIterations(iteration_count):
     """ @type iteration_count: int """
     if iteration_count != getNumberOfIterations():
         ERT.ert.analysisConfig().getAnalysisIterConfig().setNumIterations(iteration_count)
-        ERT.emitErtChange()
+        ERT.emitErtChange(ErtNotifier.CONFIG)
 
 
 def getWorkflowNames():
@@ -8,7 +8,8 @@ class TargetCaseModel(ValueModel):
         self._format_mode = format_mode
         self._custom = False
         ValueModel.__init__(self, self.getDefaultValue())
-        ERT.ertChanged.connect(self._caseChanged)
+        ERT.currentCaseChanged.connect(self._caseChanged)
+        ERT.configChanged.connect(self._caseChanged)
 
     def setValue(self, target_case):
         if target_case is None or target_case.strip() == "" or target_case == self.getDefaultValue():
@@ -7,6 +7,13 @@ try:
 except:
     pass
 
+from .decimation import MinMaxDecimator
+from .ensemble_statistics import EnsembleStatistics
+from .kernel_density import KernelDensity
+from .key_search_index import KeySearchIndex
+from .plot_data_cache import PlotDataCache
+from .refcase_vectors import RefcaseVectors
+from .summary_matrix_loader import SummaryMatrixLoader
 from .plot_data_gatherer import PlotDataGatherer
 from .plot_style import PlotStyle
 from .plot_limits import PlotLimits
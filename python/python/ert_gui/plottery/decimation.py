@@ -0,0 +1,88 @@
+import numpy
+
+
+class MinMaxDecimator(object):
+    """
+    Reduces series sharing a common x axis to at most two points (the minimum
+    and the maximum) per bucket, preserving the visual envelope of each line.
+
+    The full resolution data is kept, so the series can be decimated again for
+    a narrower visible range (e.g. after zooming).
+    """
+
+    def __init__(self, x, y, bucket_count):
+        """
+        @type x: numpy.ndarray 1-D array of length n, sorted in increasing order
+        @type y: numpy.ndarray 2-D array of shape (series, n)
+        @type bucket_count: int
+        """
+        super(MinMaxDecimator, self).__init__()
+        self._x = numpy.asarray(x, dtype=numpy.float64)
+        self._y = numpy.asarray(y, dtype=numpy.float64)
+        self._bucket_count = max(1, int(bucket_count))
+
+    @property
+    def bucket_count(self):
+        """ @rtype: int """
+        return self._bucket_count
+
+    def isDecimationNeeded(self):
+        """ @rtype: bool """
+        return len(self._x) > 2 * self._bucket_count
+
+    def decimate(self, x_minimum=None, x_maximum=None):
+        """
+        Returns (x, y) where both arrays have shape (series, points). The first
+        and last points are always kept, and the range is extended by one
+        point on each side so lines continue out of view.
+        @rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        start = 0
+        stop = len(self._x)
+
+        if x_minimum is not None:
+            start = max(0, numpy.searchsorted(self._x, x_minimum, side="left") - 1)
+
+        if x_maximum is not None:
+            stop = min(len(self._x), numpy.searchsorted(self._x, x_maximum, side="right") + 1)
+
+        x = self._x[start:stop]
+        y = self._y[:, start:stop]
+
+        if len(x) <= 2 * self._bucket_count:
+            return numpy.tile(x, (y.shape[0], 1)), y.copy()
+
+        indexes = MinMaxDecimator.minMaxIndexes(y, self._bucket_count)
+        first = numpy.zeros((y.shape[0], 1), dtype=indexes.dtype)
+        last = numpy.full((y.shape[0], 1), len(x) - 1, dtype=indexes.dtype)
+        indexes = numpy.hstack((first, indexes, last))
+        rows = numpy.arange(y.shape[0])[:, numpy.newaxis]
+        return x[indexes], y[rows, indexes]
+
+    @staticmethod
+    def minMaxIndexes(y, bucket_count):
+        """
+        For every series, the sorted indexes of the minimum and maximum of each bucket.
+        @type y: numpy.ndarray 2-D array of shape (series, n)
+        @rtype: numpy.ndarray of shape (series, 2 * bucket_count)
+        """
+        series_count, point_count = y.shape
+        bucket_size = int(numpy.ceil(float(point_count) / bucket_count))
+        bucket_count = int(numpy.ceil(float(point_count) / bucket_size))
+        padded_count = bucket_size * bucket_count
+
+        low = numpy.full((series_count, padded_count), numpy.inf)
+        high = numpy.full((series_count, padded_count), -numpy.inf)
+        finite = numpy.isfinite(y)
+        low[:, :point_count] = numpy.where(finite, y, numpy.inf)
+        high[:, :point_count] = numpy.where(finite, y, -numpy.inf)
+
+        offsets = numpy.arange(bucket_count) * bucket_size
+        minimum = low.reshape(series_count, bucket_count, bucket_size).argmin(axis=2) + offsets
+        maximum = high.reshape(series_count, bucket_count, bucket_size).argmax(axis=2) + offsets
+
+        indexes = numpy.empty((series_count, 2 * bucket_count), dtype=numpy.intp)
+        indexes[:, 0::2] = numpy.minimum(minimum, maximum)
+        indexes[:, 1::2] = numpy.maximum(minimum, maximum)
+
+        return numpy.minimum(indexes, point_count - 1)
@@ -0,0 +1,78 @@
+import warnings
+
+import numpy
+import pandas as pd
+from pandas import DataFrame, Series
+
+
+class EnsembleStatistics(object):
+    """
+    Computes minimum, maximum, mean, standard deviation and a configurable set
+    of quantiles across the realizations of an ensemble in one vectorized step.
+
+    For a DataFrame the statistics are computed per row (i.e. per date or index
+    across the realization columns) and returned as a DataFrame with one column
+    per statistic. For a Series (one value per realization) a Series with one
+    entry per statistic is returned.
+    """
+    DEFAULT_QUANTILES = (0.10, 0.33, 0.50, 0.67, 0.90)
+
+    MINIMUM = "Minimum"
+    MAXIMUM = "Maximum"
+    MEAN = "Mean"
+    STD = "Std"
+
+    @staticmethod
+    def quantileName(quantile):
+        """
+        The percentile of the quantile without rounding, e.g. p10 for 0.1 and
+        p10.5 for 0.105.
+        @rtype: str
+        """
+        return "p%.10g" % (quantile * 100)
+
+    @staticmethod
+    def compute(data, quantiles=DEFAULT_QUANTILES):
+        """
+        @type data: pandas.DataFrame or pandas.Series
+        @type quantiles: tuple of float
+        @rtype: pandas.DataFrame or pandas.Series
+        """
+        is_series = isinstance(data, Series)
+
+        if data.values.dtype == "object":
+            if is_series:
+                data = pd.to_numeric(data, errors="coerce")
+            else:
+                data = data.apply(pd.to_numeric, errors="coerce")
+
+        values = numpy.asarray(data.values, dtype=numpy.float64)
+
+        if is_series:
+            values = values.reshape(1, -1)
+
+        percents = [0.0] + [quantile * 100.0 for quantile in quantiles] + [100.0]
+        names = [EnsembleStatistics.quantileName(quantile) for quantile in quantiles]
+
+        if len(set(names)) != len(names):
+            raise ValueError("The quantiles must be unique: %s" % ", ".join(names))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+
+            if values.shape[1] == 0:
+                percentiles = numpy.full((len(percents), values.shape[0]), numpy.nan)
+                mean = numpy.full(values.shape[0], numpy.nan)
+                std = numpy.full(values.shape[0], numpy.nan)
+            else:
+                percentiles = numpy.nanpercentile(values, percents, axis=1)
+                mean = numpy.nanmean(values, axis=1)
+                std = numpy.nanstd(values, axis=1, ddof=1)
+
+        columns = [EnsembleStatistics.MINIMUM, EnsembleStatistics.MAXIMUM, EnsembleStatistics.MEAN, EnsembleStatistics.STD] + names
+        statistics = [percentiles[0], percentiles[-1], mean, std] + [percentiles[index + 1] for index in range(len(quantiles))]
+
+        if is_series:
+            return Series([statistic[0] for statistic in statistics], index=columns)
+
+        return DataFrame(dict(zip(columns, statistics)), index=data.index, columns=columns)
@@ -0,0 +1,83 @@
+import numpy
+import pandas as pd
+from pandas import Series
+
+
+class KernelDensity(object):
+    """
+    Gaussian kernel density estimation on a regular grid.
+
+    The samples are linearly binned onto the grid and the bin weights are
+    convolved with the Gaussian kernel using the FFT, which is O(m log m) in
+    the grid size m instead of O(n * m) for n samples. The bandwidth rules are
+    the same as the ones used by scipy.stats.gaussian_kde.
+    """
+    SCOTT = "scott"
+    SILVERMAN = "silverman"
+    BANDWIDTH_RULES = [SCOTT, SILVERMAN]
+
+    DEFAULT_GRID_SIZE = 1000
+
+    @staticmethod
+    def bandwidthFactor(sample_count, bandwidth=SCOTT):
+        """
+        The factor multiplied with the sample standard deviation to get the kernel standard deviation.
+        @type bandwidth: str or float
+        @rtype: float
+        """
+        if bandwidth == KernelDensity.SCOTT:
+            return sample_count ** (-1.0 / 5.0)
+        elif bandwidth == KernelDensity.SILVERMAN:
+            return (sample_count * 3.0 / 4.0) ** (-1.0 / 5.0)
+
+        try:
+            return float(bandwidth)
+        except (TypeError, ValueError):
+            raise ValueError("Bandwidth must be one of %s or a number, was: %s" % (KernelDensity.BANDWIDTH_RULES, bandwidth))
+
+    @staticmethod
+    def evaluate(data, bandwidth=SCOTT, grid_size=DEFAULT_GRID_SIZE):
+        """
+        Evaluates the density on a grid covering the sample range extended by
+        half the sample range on each side.
+        Returns an empty Series if there are fewer than two distinct values.
+        @type data: pandas.Series
+        @rtype: pandas.Series
+        """
+        if data.dtype.kind not in "biuf":
+            data = pd.to_numeric(data, errors="coerce")
+
+        values = numpy.asarray(data.values, dtype=numpy.float64)
+        values = values[numpy.isfinite(values)]
+
+        if len(values) < 2 or values.min() == values.max():
+            return Series(dtype=numpy.float64)
+
+        minimum = values.min()
+        maximum = values.max()
+        sample_range = maximum - minimum
+        grid = numpy.linspace(minimum - 0.5 * sample_range, maximum + 0.5 * sample_range, grid_size)
+        spacing = grid[1] - grid[0]
+
+        weights = KernelDensity._linearBinning(values, grid[0], spacing, grid_size)
+
+        kernel_std = KernelDensity.bandwidthFactor(len(values), bandwidth) * numpy.std(values, ddof=1)
+        offsets = numpy.arange(-(grid_size - 1), grid_size) * spacing
+        kernel = numpy.exp(-0.5 * (offsets / kernel_std) ** 2) / (kernel_std * numpy.sqrt(2.0 * numpy.pi))
+
+        fft_size = 1 << int(numpy.ceil(numpy.log2(3 * grid_size - 2)))
+        convolution = numpy.fft.irfft(numpy.fft.rfft(weights, fft_size) * numpy.fft.rfft(kernel, fft_size), fft_size)
+        density = convolution[grid_size - 1:2 * grid_size - 1] / len(values)
+
+        return Series(numpy.maximum(density, 0.0), index=grid)
+
+    @staticmethod
+    def _linearBinning(values, start, spacing, grid_size):
+        """ Distributes each sample between its two neighbouring grid points. """
+        position = (values - start) / spacing
+        lower = numpy.clip(numpy.floor(position).astype(int), 0, grid_size - 2)
+        fraction = position - lower
+
+        weights = numpy.bincount(lower, weights=1.0 - fraction, minlength=grid_size)
+        weights += numpy.bincount(lower + 1, weights=fraction, minlength=grid_size)
+        return weights
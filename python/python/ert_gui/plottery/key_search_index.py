@@ -0,0 +1,157 @@
+import fnmatch
+import re
+from bisect import bisect_left
+
+import numpy
+
+
+class KeySearchIndex(object):
+    """
+    Case insensitive search over a fixed set of keys.
+
+    A query without wildcards matches keys containing the query. A query with
+    the fnmatch wildcards * and ? (e.g. WOPR:* or *:OP1) must match the whole
+    key. Candidates are found with a sorted array of the keys for prefixes (a
+    flattened prefix trie) and a trigram index for the other literal parts of
+    the query, and only the candidates are matched against the query.
+
+    search() reuses the previous result when the new query narrows the
+    previous one, e.g. when a character is appended while typing.
+    """
+    WILDCARDS = "*?"
+
+    def __init__(self, keys):
+        """ @type keys: list of str """
+        super(KeySearchIndex, self).__init__()
+        self._keys = list(keys)
+        self._lower_keys = [key.lower() for key in self._keys]
+
+        order = sorted(range(len(self._keys)), key=lambda row: self._lower_keys[row])
+        self._sorted_rows = numpy.array(order, dtype=numpy.int64)
+        self._sorted_keys = [self._lower_keys[row] for row in order]
+
+        trigrams = {}
+        for row, key in enumerate(self._lower_keys):
+            for trigram in set(key[index:index + 3] for index in range(len(key) - 2)):
+                trigrams.setdefault(trigram, []).append(row)
+
+        self._trigrams = {trigram: numpy.array(rows, dtype=numpy.int64) for trigram, rows in trigrams.items()}
+
+        self._last_query = None
+        self._last_result = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        """ @rtype: list of str """
+        return self._keys
+
+    def search(self, query):
+        """
+        Returns the sorted rows of the keys matching the query.
+        @type query: str
+        @rtype: numpy.ndarray
+        """
+        query = query.lower()
+
+        candidates = None
+        if self._last_query is not None and KeySearchIndex.isNarrowing(self._last_query, query):
+            candidates = self._last_result
+
+        result = self._search(query, candidates)
+
+        self._last_query = query
+        self._last_result = result
+        return result
+
+    def searchMask(self, query):
+        """
+        A boolean array with one entry per key, True for the keys matching the query.
+        @rtype: numpy.ndarray
+        """
+        mask = numpy.zeros(len(self._keys), dtype=bool)
+        mask[self.search(query)] = True
+        return mask
+
+    def match(self, query):
+        """ @rtype: list of str """
+        return [self._keys[row] for row in self.search(query)]
+
+    def completions(self, prefix):
+        """
+        The keys starting with the prefix, in sorted order.
+        @rtype: list of str
+        """
+        start, stop = self._prefixRange(prefix.lower())
+        return [self._keys[row] for row in self._sorted_rows[start:stop]]
+
+    @staticmethod
+    def hasWildcards(query):
+        """ @rtype: bool """
+        return any(wildcard in query for wildcard in KeySearchIndex.WILDCARDS)
+
+    @staticmethod
+    def isNarrowing(previous, query):
+        """
+        True if every key matching query is known to also match previous.
+        @rtype: bool
+        """
+        previous_wildcards = KeySearchIndex.hasWildcards(previous)
+
+        if previous_wildcards != KeySearchIndex.hasWildcards(query):
+            return False
+
+        if not previous_wildcards:
+            return previous in query
+
+        return previous.endswith("*") and query.startswith(previous)
+
+    def _search(self, query, candidates):
+        if len(query) == 0:
+            return numpy.arange(len(self._keys), dtype=numpy.int64)
+
+        if KeySearchIndex.hasWildcards(query):
+            literals = re.split("[%s]+" % re.escape(KeySearchIndex.WILDCARDS), query)
+            prefix = literals[0]
+            regex = re.compile(fnmatch.translate(query))
+            matches = lambda key: regex.match(key) is not None
+        else:
+            literals = [query]
+            prefix = ""
+            matches = lambda key: query in key
+
+        if len(prefix) > 0:
+            start, stop = self._prefixRange(prefix)
+            candidates = self._intersect(candidates, numpy.sort(self._sorted_rows[start:stop]))
+
+        for literal in literals:
+            for index in range(len(literal) - 2):
+                rows = self._trigrams.get(literal[index:index + 3])
+
+                if rows is None:
+                    return numpy.zeros(0, dtype=numpy.int64)
+
+                candidates = self._intersect(candidates, rows)
+
+        if candidates is None:
+            candidates = numpy.arange(len(self._keys), dtype=numpy.int64)
+
+        lower_keys = self._lower_keys
+        return numpy.array([row for row in candidates if matches(lower_keys[row])], dtype=numpy.int64)
+
+    def _prefixRange(self, prefix):
+        if len(prefix) == 0:
+            return 0, len(self._sorted_keys)
+
+        start = bisect_left(self._sorted_keys, prefix)
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        stop = bisect_left(self._sorted_keys, upper_bound, start)
+        return start, stop
+
+    @staticmethod
+    def _intersect(candidates, rows):
+        if candidates is None:
+            return rows
+
+        return numpy.intersect1d(candidates, rows, assume_unique=True)
@@ -1,3 +1,9 @@
+import time
+from collections import OrderedDict
+
+import pandas as pd
+from pandas import DataFrame
+
 from .plot_config import PlotConfig
 from .plot_data_gatherer import PlotDataGatherer
 
@@ -11,8 +17,11 @@ class PlotContext(object):
     DEPTH_AXIS = "DEPTH"
     AXIS_TYPES = [UNKNOWN_AXIS, COUNT_AXIS, DATE_AXIS, DENSITY_AXIS, DEPTH_AXIS, INDEX_AXIS, VALUE_AXIS]
 
+    __last_case_load_times = OrderedDict()
+
     def __init__(self, ert, figure, plot_config, cases, key, data_gatherer):
         super(PlotContext, self).__init__()
+        self._case_load_times = OrderedDict()
         self._data_gatherer = data_gatherer
         self._key = key
         self._cases = cases
@@ -48,6 +57,49 @@ class PlotContext(object):
         """ :rtype: PlotDataGatherer """
         return self._data_gatherer
 
+    @classmethod
+    def lastCaseLoadTimes(cls):
+        """
+        The load time in seconds per case of the most recent gatherCaseData() call in any plot context.
+        :rtype: OrderedDict[str, float]
+        """
+        return OrderedDict(cls.__last_case_load_times)
+
+    def caseLoadTimes(self):
+        """ :rtype: OrderedDict[str, float] """
+        return OrderedDict(self._case_load_times)
+
+    def gatherCaseData(self, key):
+        """
+        Loads the data for the key for all cases of the context and records
+        the load time of each case. The cases are loaded one at a time, since
+        libres storage access is serialized by PlotDataGatherer.STORAGE_LOCK.
+        The data is usually loaded by the plot data loader before the plot is
+        drawn, so this reads from the cache.
+        Returns the same layout as PlotDataGatherer.gatherDataBatch().
+        :rtype: pandas.DataFrame
+        """
+        cases = self.cases()
+        ert = self.ert()
+        data_gatherer = self.dataGatherer()
+
+        def loadCase(case):
+            start = time.time()
+            data = data_gatherer.gatherDataBatch(ert, [case], [key])
+            return data, time.time() - start
+
+        results = [loadCase(case) for case in cases]
+
+        self._case_load_times = OrderedDict((case, load_time) for case, (_, load_time) in zip(cases, results))
+        PlotContext.__last_case_load_times = self._case_load_times
+
+        frames = [data for data, _ in results if len(data.columns) > 0]
+
+        if len(frames) == 0:
+            return DataFrame()
+
+        return pd.concat(frames, axis=1)
+
     def deactivateDateSupport(self):
         self._date_support_active = False
 
@@ -0,0 +1,180 @@
+import sys
+from collections import OrderedDict
+from threading import RLock, local
+
+
+class PlotDataCache(object):
+    """
+    A memory bounded least-recently-used cache for data gathered for plotting.
+
+    Entries are keyed by (case, key, data kind). Each case can be associated
+    with a stamp (typically derived from the state map of the case), and all
+    entries for a case are dropped when the stamp changes.
+
+    Values with a copy() method (e.g. DataFrames) are returned as copies, so
+    callers can modify the data without changing the cached entries. Callers
+    that only fill the cache can ask for the cached value itself.
+    """
+    DEFAULT_MEMORY_LIMIT = 512 * 1024 * 1024
+
+    __shared_instance = None
+
+    def __init__(self, memory_limit=DEFAULT_MEMORY_LIMIT):
+        super(PlotDataCache, self).__init__()
+        self._lock = RLock()
+        self._memory_limit = memory_limit
+        self._memory_usage = 0
+        self._entries = OrderedDict()
+        """ :type: OrderedDict[(str, str, str), (object, int)] """
+        self._case_stamps = {}
+        self._owner = None
+        self._hits = 0
+        self._misses = 0
+        self._loaded = local()
+
+    @classmethod
+    def sharedInstance(cls):
+        """
+        The process wide cache shared by the plot window, the shell and exporters.
+        @rtype: PlotDataCache
+        """
+        if cls.__shared_instance is None:
+            cls.__shared_instance = PlotDataCache()
+        return cls.__shared_instance
+
+    @property
+    def hits(self):
+        """ @rtype: int """
+        return self._hits
+
+    @property
+    def misses(self):
+        """ @rtype: int """
+        return self._misses
+
+    @property
+    def memory_usage(self):
+        """ @rtype: int """
+        return self._memory_usage
+
+    @property
+    def memory_limit(self):
+        """ @rtype: int """
+        return self._memory_limit
+
+    @memory_limit.setter
+    def memory_limit(self, value):
+        """ @type value: int """
+        with self._lock:
+            self._memory_limit = value
+            self._evict()
+
+    def loadedBytes(self):
+        """ The total size of the values inserted by the calling thread, i.e. loaded on cache misses. @rtype: int """
+        return getattr(self._loaded, "bytes", 0)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, cache_key):
+        return cache_key in self._entries
+
+    def validateOwner(self, owner):
+        """ Clears the cache if the data is requested on behalf of another owner (i.e. a different EnKFMain). """
+        with self._lock:
+            if self._owner is not owner:
+                self.clear()
+                self._owner = owner
+
+    def validateCaseStamp(self, case, stamp):
+        """ Drops all entries of a case if its stamp differs from the one recorded with the entries. """
+        with self._lock:
+            if case in self._case_stamps and self._case_stamps[case] != stamp:
+                self.invalidateCase(case)
+            self._case_stamps[case] = stamp
+
+    def get(self, case, key, kind, loader, copy=True):
+        """
+        Returns a copy of the cached value for (case, key, kind). On a miss
+        the value is created by calling loader() and inserted in the cache.
+        With copy=False the cached value itself is returned, and must not be
+        modified.
+        """
+        cache_key = (case, key, kind)
+
+        with self._lock:
+            if cache_key in self._entries:
+                value, size = self._entries.pop(cache_key)
+                self._entries[cache_key] = (value, size)
+                self._hits += 1
+                return PlotDataCache.copyValue(value) if copy else value
+
+            self._misses += 1
+
+        value = loader()
+        self.insert(case, key, kind, value)
+        return PlotDataCache.copyValue(value) if copy else value
+
+    def insert(self, case, key, kind, value):
+        cache_key = (case, key, kind)
+        size = PlotDataCache.estimateSize(value)
+        self._loaded.bytes = self.loadedBytes() + size
+
+        with self._lock:
+            if cache_key in self._entries:
+                self._memory_usage -= self._entries.pop(cache_key)[1]
+
+            if size > self._memory_limit:
+                return
+
+            self._entries[cache_key] = (value, size)
+            self._memory_usage += size
+            self._evict()
+
+    def invalidateCase(self, case):
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._entries if cache_key[0] == case]:
+                self._memory_usage -= self._entries.pop(cache_key)[1]
+            self._case_stamps.pop(case, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._case_stamps.clear()
+            self._memory_usage = 0
+
+    def resetCounters(self):
+        self._hits = 0
+        self._misses = 0
+
+    def _evict(self):
+        while self._memory_usage > self._memory_limit and len(self._entries) > 0:
+            cache_key, (value, size) = self._entries.popitem(last=False)
+            self._memory_usage -= size
+
+    @staticmethod
+    def copyValue(value):
+        """ A copy of values with a copy() method, other values are returned as is. """
+        copy = getattr(value, "copy", None)
+
+        if copy is None:
+            return value
+
+        return copy()
+
+    @staticmethod
+    def estimateSize(value):
+        """ @rtype: int """
+        try:
+            usage = value.memory_usage(index=True)
+        except (AttributeError, TypeError):
+            nbytes = getattr(value, "nbytes", None)
+            return nbytes if nbytes is not None else sys.getsizeof(value)
+
+        try:
+            return int(usage.sum())
+        except AttributeError:
+            return int(usage)
+
+    def __repr__(self):
+        return "PlotDataCache(entries: %d, memory: %d/%d bytes, hits: %d, misses: %d)" % (len(self), self._memory_usage, self._memory_limit, self._hits, self._misses)
@@ -1,18 +1,53 @@
-from pandas import DataFrame
-from res.enkf.export import GenKwCollector, SummaryCollector, GenDataCollector, SummaryObservationCollector, \
+from collections import OrderedDict
+from threading import RLock
+
+import pandas as pd
+from pandas import DataFrame, DatetimeIndex
+from res.enkf.export import GenKwCollector, GenDataCollector, SummaryObservationCollector, \
     GenDataObservationCollector, CustomKWCollector
+from .ensemble_statistics import EnsembleStatistics
+from .kernel_density import KernelDensity
+from .plot_data_cache import PlotDataCache
+from .refcase_vectors import RefcaseVectors
+from .summary_matrix_loader import SummaryMatrixLoader
 
 
 class PlotDataGatherer(object):
-
-    def __init__(self, dataGatherFunc, conditionFunc, refcaseGatherFunc=None, observationGatherFunc=None, historyGatherFunc=None):
+    """
+    Gathers plot data through the shared plot data cache. The storage is
+    read through libres, which is not thread safe, so every storage access
+    made by a gatherer is serialized with the STORAGE_LOCK shared by all
+    gatherers. Computations on data that has been gathered are not. Code
+    reading libres on the GUI thread while gatherers may be running (the
+    plot window and its models) must hold the same lock.
+
+    The cached data of a case is validated against the state map of the
+    case on every lookup, so data written to the case without a notifier
+    change (e.g. from the shell) is gathered again.
+    """
+    STORAGE_LOCK = RLock()
+
+    DATA = "data"
+    REFCASE = "refcase"
+    OBSERVATION = "observation"
+    HISTORY = "history"
+    STATISTICS = "statistics"
+    DENSITY = "density"
+
+    def __init__(self, dataGatherFunc, conditionFunc, refcaseGatherFunc=None, observationGatherFunc=None, historyGatherFunc=None, batchGatherFunc=None, cache=None):
         super(PlotDataGatherer, self).__init__()
 
+        if cache is None:
+            cache = PlotDataCache.sharedInstance()
+
+        self._cache = cache
+
         self._dataGatherFunction = dataGatherFunc
         self._conditionFunction = conditionFunc
         self._refcaseGatherFunction = refcaseGatherFunc
         self._observationGatherFunction = observationGatherFunc
         self._historyGatherFunc = historyGatherFunc
+        self._batchGatherFunction = batchGatherFunc
 
     def hasHistoryGatherFunction(self):
         """ :rtype: bool """
@@ -26,85 +61,176 @@ class PlotDataGatherer(object):
         """ :rtype: bool """
         return self._observationGatherFunction is not None
 
+    def hasBatchGatherFunction(self):
+        """ :rtype: bool """
+        return self._batchGatherFunction is not None
+
+    def cache(self):
+        """ :rtype: PlotDataCache """
+        return self._cache
+
     def canGatherDataForKey(self, key):
         """ :rtype: bool """
-        return self._conditionFunction(key)
+        return PlotDataGatherer._locked(self._conditionFunction, key)
 
-    def gatherData(self, ert, case, key):
-        """ :rtype: pandas.DataFrame """
+    def gatherData(self, ert, case, key, copy=True):
+        """
+        With copy=False the cached data is returned and must not be modified.
+        :rtype: pandas.DataFrame
+        """
         if not self.canGatherDataForKey(key):
             raise UserWarning("Unable to gather data for key: %s" % key)
 
-        return self._dataGatherFunction(ert, case, key)
+        return self._gatherCached(ert, case, key, PlotDataGatherer.DATA, copy, self._dataGatherFunction, case, key)
+
+    def gatherDataBatch(self, ert, cases, keys):
+        """
+        Gathers the data for several keys across several cases. For each case
+        all keys that are not already cached are loaded with a single call to
+        the batch gather function, i.e. one storage pass per case instead of
+        one per (case, key). The loaded keys are cached individually and are
+        shared with gatherData().
+
+        Returns a frame with one column per (Case, Key) indexed by realization.
+        Realizations missing in a case are NaN.
+        :type cases: list of str
+        :type keys: list of str
+        :rtype: pandas.DataFrame
+        """
+        for key in keys:
+            if not self.canGatherDataForKey(key):
+                raise UserWarning("Unable to gather data for key: %s" % key)
+
+        kind = self._kind(PlotDataGatherer.DATA, self._dataGatherFunction)
+        columns = OrderedDict()
+
+        for case in cases:
+            self._validateCache(ert, case)
+            missing = [key for key in keys if not (case, key, kind) in self._cache]
+
+            loaded = {}
+            if len(missing) > 0 and self.hasBatchGatherFunction():
+                loaded = PlotDataGatherer._locked(self._batchGatherFunction, ert, case, missing)
+
+                for key in missing:
+                    self._cache.insert(case, key, kind, loaded[key])
+
+            for key in keys:
+                if key in loaded:
+                    columns[(case, key)] = loaded[key]
+                else:
+                    # The columns are copied by the concatenation below.
+                    columns[(case, key)] = self._cache.get(case, key, kind, lambda: PlotDataGatherer._locked(self._dataGatherFunction, ert, case, key), copy=False)
+
+        if len(columns) == 0:
+            return DataFrame()
+
+        return pd.concat(list(columns.values()), axis=1, keys=list(columns.keys()), names=["Case", "Key"])
 
-    def gatherRefcaseData(self, ert, key):
+    def gatherRefcaseData(self, ert, key, copy=True):
         """ :rtype: pandas.DataFrame """
         if not self.canGatherDataForKey(key) or not self.hasRefcaseGatherFunction():
             raise UserWarning("Unable to gather refcase data for key: %s" % key)
 
-        return self._refcaseGatherFunction(ert, key)
+        return self._gatherCached(ert, None, key, PlotDataGatherer.REFCASE, copy, self._refcaseGatherFunction, key)
 
-    def gatherObservationData(self, ert, case, key):
+    def gatherObservationData(self, ert, case, key, copy=True):
         """ :rtype: pandas.DataFrame """
         if not self.canGatherDataForKey(key) or not self.hasObservationGatherFunction():
             raise UserWarning("Unable to gather observation data for key: %s" % key)
 
-        return self._observationGatherFunction(ert, case, key)
+        return self._gatherCached(ert, case, key, PlotDataGatherer.OBSERVATION, copy, self._observationGatherFunction, case, key)
 
-    def gatherHistoryData(self, ert, case, key):
+    def gatherHistoryData(self, ert, case, key, copy=True):
         """ :rtype: pandas.DataFrame """
         if not self.canGatherDataForKey(key) or not self.hasHistoryGatherFunction():
             raise UserWarning("Unable to gather history data for key: %s" % key)
 
-        return self._historyGatherFunc(ert, case, key)
+        return self._gatherCached(ert, case, key, PlotDataGatherer.HISTORY, copy, self._historyGatherFunc, case, key)
 
+    def gatherStatisticsData(self, ert, case, key, quantiles=EnsembleStatistics.DEFAULT_QUANTILES):
+        """
+        Statistics across the realizations of the data for a case, cached per (case, key, quantile set).
+        :rtype: pandas.DataFrame or pandas.Series
+        """
+        quantiles = tuple(quantiles)
+        kind = "%s:%s" % (PlotDataGatherer.STATISTICS, ",".join(repr(float(quantile)) for quantile in quantiles))
+
+        def computeStatistics():
+            return EnsembleStatistics.compute(self.gatherData(ert, case, key, copy=False), quantiles)
+
+        self._validateCache(ert, case)
+        return self._cache.get(case, key, self._kind(kind, self._dataGatherFunction), computeStatistics)
+
+    def gatherKernelDensityData(self, ert, case, key, bandwidth=KernelDensity.SCOTT):
+        """
+        Gaussian kernel density of the data for a case, cached per (case, key, bandwidth).
+        :rtype: pandas.Series
+        """
+        kind = "%s:%s" % (PlotDataGatherer.DENSITY, bandwidth)
+
+        def computeDensity():
+            return KernelDensity.evaluate(self.gatherData(ert, case, key, copy=False), bandwidth)
+
+        self._validateCache(ert, case)
+        return self._cache.get(case, key, self._kind(kind, self._dataGatherFunction), computeDensity)
+
+    def _gatherCached(self, ert, case, key, kind, copy, gather_function, *arguments):
+        self._validateCache(ert, case)
+        return self._cache.get(case, key, self._kind(kind, gather_function), lambda: PlotDataGatherer._locked(gather_function, ert, *arguments), copy=copy)
+
+    def _validateCache(self, ert, case):
+        self._cache.validateOwner(ert)
+
+        if case is not None:
+            self._cache.validateCaseStamp(case, PlotDataGatherer.caseStamp(ert, case))
 
     @staticmethod
-    def gatherGenKwData(ert, case, key):
-        """ :rtype: pandas.DataFrame """
-        data = GenKwCollector.loadAllGenKwData(ert, case, [key])
-        return data[key].dropna()
+    def _locked(function, *arguments):
+        with PlotDataGatherer.STORAGE_LOCK:
+            return function(*arguments)
 
     @staticmethod
-    def gatherSummaryData(ert, case, key):
-        """ :rtype: pandas.DataFrame """
-        data = SummaryCollector.loadAllSummaryData(ert, case, [key])
-        if not data.empty:
-            data = data.reset_index()
+    def _kind(kind, gather_function):
+        return "%s:%s" % (kind, getattr(gather_function, "__name__", "unknown"))
 
-            if any(data.duplicated()):
-                print("** Warning: The simulation data contains duplicate "
-                      "timestamps. A possible explanation is that your "
-                      "simulation timestep is less than a second.")
-                data = data.drop_duplicates()
+    @staticmethod
+    def caseStamp(ert, case):
+        """
+        A fingerprint of the realization states of a case, used to detect that
+        the data stored for a case has changed.
+        :rtype: tuple
+        """
+        with PlotDataGatherer.STORAGE_LOCK:
+            state_map = ert.getEnkfFsManager().getStateMapForCase(case)
+            return tuple(state_map)
 
 
-            data = data.pivot(index="Date", columns="Realization", values=key)
+    @staticmethod
+    def gatherGenKwData(ert, case, key):
+        """ :rtype: pandas.DataFrame """
+        return PlotDataGatherer.gatherGenKwDataBatch(ert, case, [key])[key]
+
+    @staticmethod
+    def gatherGenKwDataBatch(ert, case, keys):
+        """ :rtype: dict[str, pandas.Series] """
+        data = GenKwCollector.loadAllGenKwData(ert, case, keys)
+        return {key: data[key].dropna() for key in keys}
 
-        return data #.dropna()
+    @staticmethod
+    def gatherSummaryData(ert, case, key):
+        """ :rtype: pandas.DataFrame """
+        return SummaryMatrixLoader.loadSummaryMatrix(ert, case, key)
 
     @staticmethod
     def gatherSummaryRefcaseData(ert, key):
-        refcase = ert.eclConfig().getRefcase()
+        vector = RefcaseVectors.getVector(ert, key)
 
-        if refcase is None or not key in refcase:
+        if vector is None:
             return DataFrame()
 
-        vector = refcase.get_vector(key, report_only=False)
-
-        rows = []
-        for index in range(1, len(vector)):
-            node = vector[index]
-            row = {
-                "Date": node.date,
-                key: node.value
-            }
-            rows.append(row)
-
-        data = DataFrame(rows)
-        data = data.set_index("Date")
-
-        return data
+        dates, values = vector
+        return DataFrame({key: values}, index=DatetimeIndex(dates, name="Date"))
 
     @staticmethod
     def gatherSummaryHistoryData(ert, case, key):
@@ -162,6 +288,10 @@ class PlotDataGatherer(object):
     @staticmethod
     def gatherCustomKwData(ert, case, key):
         """ :rtype: pandas.DataFrame """
-        data = CustomKWCollector.loadAllCustomKWData(ert, case, [key])[key]
+        return PlotDataGatherer.gatherCustomKwDataBatch(ert, case, [key])[key]
 
-        return data
+    @staticmethod
+    def gatherCustomKwDataBatch(ert, case, keys):
+        """ :rtype: dict[str, pandas.Series] """
+        data = CustomKWCollector.loadAllCustomKWData(ert, case, keys)
+        return {key: data[key] for key in keys}
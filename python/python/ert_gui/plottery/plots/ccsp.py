@@ -1,5 +1,6 @@
 from matplotlib.patches import Rectangle
 from matplotlib.lines import Line2D
+from ert_gui.plottery import EnsembleStatistics as ES
 from .plot_tools import PlotTools
 import pandas as pd
 
@@ -33,24 +34,26 @@ def plotCrossCaseStatistics(plot_context):
         "p67": {},
         "p90": {}
     }
+    case_data = plot_context.gatherCaseData(key)
     for case_index, case in enumerate(case_list):
         case_indexes.append(case_index)
-        data = plot_context.dataGatherer().gatherData(ert, case, key)
+        data = case_data[case, key].dropna()
         std_dev_factor = config.getStandardDeviationFactor()
 
         if not data.empty:
             data = _assertNumeric(data)
             if not data is None:
+                statistics = plot_context.dataGatherer().gatherStatisticsData(ert, case, key)
                 ccs["index"].append(case_index)
-                ccs["mean"][case_index] = data.mean()
-                ccs["min"][case_index] = data.min()
-                ccs["max"][case_index] = data.max()
-                ccs["std"][case_index] = data.std() * std_dev_factor
-                ccs["p10"][case_index] = data.quantile(0.1)
-                ccs["p33"][case_index] = data.quantile(0.33)
-                ccs["p50"][case_index] = data.quantile(0.5)
-                ccs["p67"][case_index] = data.quantile(0.67)
-                ccs["p90"][case_index] = data.quantile(0.9)
+                ccs["mean"][case_index] = statistics[ES.MEAN]
+                ccs["min"][case_index] = statistics[ES.MINIMUM]
+                ccs["max"][case_index] = statistics[ES.MAXIMUM]
+                ccs["std"][case_index] = statistics[ES.STD] * std_dev_factor
+                ccs["p10"][case_index] = statistics["p10"]
+                ccs["p33"][case_index] = statistics["p33"]
+                ccs["p50"][case_index] = statistics["p50"]
+                ccs["p67"][case_index] = statistics["p67"]
+                ccs["p90"][case_index] = statistics["p90"]
 
                 _plotCrossCaseStatistics(axes, config, ccs, case_index)
                 config.nextColor()
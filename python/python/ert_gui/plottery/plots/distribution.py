@@ -20,9 +20,10 @@ def plotDistribution(plot_context):
     case_list = plot_context.cases()
     case_indexes = []
     previous_data = None
+    case_data = plot_context.gatherCaseData(key)
     for case_index, case in enumerate(case_list):
         case_indexes.append(case_index)
-        data = plot_context.dataGatherer().gatherData(ert, case, key)
+        data = case_data[case, key].dropna()
 
         if not data.empty:
             _plotDistribution(axes, config, data, case, case_index, previous_data)
@@ -1,7 +1,16 @@
+import numpy
+from matplotlib.collections import LineCollection
+from matplotlib.dates import date2num
+from matplotlib.lines import Line2D
 from .refcase import plotRefcase
 from .history import plotHistory
 from .observations import plotObservations
 from .plot_tools import PlotTools
+from ert_gui.plottery import MinMaxDecimator
+
+# Above this number of realizations a case is drawn as a single LineCollection instead of one Line2D per realization.
+LINE_COLLECTION_THRESHOLD = 100
+LINE_COLLECTION_LINE_STYLES = ["-", "--", "-.", ":"]
 
 def plotEnsemble(plot_context):
     """
@@ -19,6 +28,8 @@ def plotEnsemble(plot_context):
     plot_context.y_axis = plot_context.VALUE_AXIS
     plot_context.x_axis = plot_context.DATE_AXIS
 
+    bucket_count = _canvasWidth(plot_context.figure())
+
     for case in case_list:
         data = plot_context.dataGatherer().gatherData(ert, case, key)
         if not data.empty:
@@ -26,7 +37,10 @@ def plotEnsemble(plot_context):
                 plot_context.deactivateDateSupport()
                 plot_context.x_axis = plot_context.INDEX_AXIS
 
-            _plotLines(axes, config, data, case, plot_context.isDateSupportActive())
+            if _useLineCollection(config, data):
+                _plotLineCollection(axes, config, data, case, plot_context.isDateSupportActive(), bucket_count)
+            else:
+                _plotLines(axes, config, data, case, plot_context.isDateSupportActive(), bucket_count)
             config.nextColor()
 
     plotRefcase(plot_context, axes)
@@ -37,20 +51,109 @@ def plotEnsemble(plot_context):
     PlotTools.finalizePlot(plot_context, axes, default_x_label=default_x_label, default_y_label="Value")
 
 
-def _plotLines(axes, plot_config, data, ensemble_label, is_date_supported):
+def _plotLines(axes, plot_config, data, ensemble_label, is_date_supported, bucket_count):
     """
     @type axes: matplotlib.axes.Axes
     @type plot_config: ert_gui.plottery.PlotConfig
     @type data: pandas.DataFrame
     @type ensemble_label: Str
+    @type bucket_count: int
     """
 
     style = plot_config.defaultStyle()
+    decimator = _createDecimator(data, is_date_supported, bucket_count)
 
-    if is_date_supported:
+    if decimator.isDecimationNeeded():
+        x, y = decimator.decimate()
+        lines = axes.plot(x.T, y.T, color=style.color, alpha=style.alpha, marker=style.marker, linestyle=style.line_style, linewidth=style.width, markersize=style.size)
+
+        if is_date_supported:
+            axes.xaxis_date()
+
+        def updateLines(x, y):
+            for line, line_x, line_y in zip(lines, x, y):
+                line.set_data(line_x, line_y)
+
+        _redecimateOnZoom(axes, decimator, updateLines)
+
+    elif is_date_supported:
         lines = axes.plot_date(x=data.index.values, y=data, color=style.color, alpha=style.alpha, marker=style.marker, linestyle=style.line_style, linewidth=style.width, markersize=style.size)
     else:
         lines = axes.plot(data.index.values, data, color=style.color, alpha=style.alpha, marker=style.marker, linestyle=style.line_style, linewidth=style.width, markersize=style.size)
 
     if len(lines) > 0:
         plot_config.addLegendItem(ensemble_label, lines[0])
+
+
+def _useLineCollection(plot_config, data):
+    """
+    Markers are not supported by a LineCollection, so those styles are drawn with one Line2D per realization.
+    @type plot_config: ert_gui.plottery.PlotConfig
+    @type data: pandas.DataFrame
+    @rtype: bool
+    """
+    style = plot_config.defaultStyle()
+    return len(data.columns) > LINE_COLLECTION_THRESHOLD and style.marker == "" and style.line_style in LINE_COLLECTION_LINE_STYLES
+
+
+def _plotLineCollection(axes, plot_config, data, ensemble_label, is_date_supported, bucket_count):
+    """
+    @type axes: matplotlib.axes.Axes
+    @type plot_config: ert_gui.plottery.PlotConfig
+    @type data: pandas.DataFrame
+    @type ensemble_label: Str
+    @type bucket_count: int
+    """
+    style = plot_config.defaultStyle()
+    decimator = _createDecimator(data, is_date_supported, bucket_count)
+
+    if is_date_supported:
+        axes.xaxis_date()
+
+    lines = LineCollection(_segments(*decimator.decimate()), colors=style.color, alpha=style.alpha, linestyles=style.line_style, linewidths=style.width)
+    axes.add_collection(lines, autolim=True)
+    axes.autoscale_view()
+
+    _redecimateOnZoom(axes, decimator, lambda x, y: lines.set_segments(_segments(x, y)))
+
+    legend_line = Line2D([], [], color=style.color, alpha=style.alpha, linestyle=style.line_style, linewidth=style.width)
+    plot_config.addLegendItem(ensemble_label, legend_line)
+
+
+def _segments(x, y):
+    """ @rtype: numpy.ndarray of shape (lines, points, 2) """
+    segments = numpy.empty(shape=(y.shape[0], y.shape[1], 2), dtype=numpy.float64)
+    segments[:, :, 0] = x
+    segments[:, :, 1] = y
+    return segments
+
+
+def _createDecimator(data, is_date_supported, bucket_count):
+    """
+    The x values (date numbers for dates) are computed once for all realizations.
+    @rtype: MinMaxDecimator
+    """
+    if is_date_supported:
+        x = date2num(data.index.to_pydatetime())
+    else:
+        x = numpy.asarray(data.index.values, dtype=numpy.float64)
+
+    y = numpy.asarray(data.values, dtype=numpy.float64).T
+    return MinMaxDecimator(x, y, bucket_count)
+
+
+def _redecimateOnZoom(axes, decimator, updateFunction):
+    """ The full resolution data is kept by the decimator and decimated again for the visible x range. """
+    if not decimator.isDecimationNeeded():
+        return
+
+    def xLimitsChanged(changed_axes):
+        x_minimum, x_maximum = changed_axes.get_xlim()
+        updateFunction(*decimator.decimate(x_minimum, x_maximum))
+
+    axes.callbacks.connect("xlim_changed", xLimitsChanged)
+
+
+def _canvasWidth(figure):
+    """ @rtype: int """
+    return int(figure.get_figwidth() * figure.dpi)
@@ -1,7 +1,4 @@
-import numpy
-from scipy.stats import gaussian_kde
 from .plot_tools import PlotTools
-import pandas as pd
 
 
 def plotGaussianKDE(plot_context):
@@ -24,40 +21,26 @@ def plotGaussianKDE(plot_context):
 
     case_list = plot_context.cases()
     for case in case_list:
-        data = plot_context.dataGatherer().gatherData(ert, case, key)
+        density = plot_context.dataGatherer().gatherKernelDensityData(ert, case, key)
 
-        if not data.empty and data.nunique() > 1:
-            _plotGaussianKDE(axes, config, data, case)
+        if not density.empty:
+            _plotGaussianKDE(axes, config, density, case)
             config.nextColor()
 
     PlotTools.finalizePlot(plot_context, axes, default_x_label="Value", default_y_label="Density")
 
 
-def _plotGaussianKDE(axes, plot_config, data, label):
+def _plotGaussianKDE(axes, plot_config, density, label):
     """
     @type axes: matplotlib.axes.Axes
     @type plot_config: PlotConfig
-    @type data: DataFrame
+    @type density: pandas.Series density values indexed by the evaluation grid
     @type label: Str
     """
 
     style = plot_config.histogramStyle()
 
-    if data.dtype == "object":
-        try:
-            data = pd.to_numeric(data, errors='coerce')
-        except AttributeError:
-            data = data.convert_objects(convert_numeric=True)
+    lines = axes.plot(density.index.values, density.values, linewidth=style.width, color=style.color, alpha=style.alpha)
 
-    if data.dtype == "object":
-        pass
-    else:
-        sample_range = data.max() - data.min()
-        indexes = numpy.linspace(data.min() - 0.5 * sample_range, data.max() + 0.5 * sample_range, 1000)
-        gkde = gaussian_kde(data.values)
-        evaluated_gkde = gkde.evaluate(indexes)
-
-        lines = axes.plot(indexes, evaluated_gkde, linewidth=style.width, color=style.color, alpha=style.alpha)
-
-        if len(lines) > 0:
-            plot_config.addLegendItem(label, lines[0])
\ No newline at end of file
+    if len(lines) > 0:
+        plot_config.addLegendItem(label, lines[0])
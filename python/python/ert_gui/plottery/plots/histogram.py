@@ -33,8 +33,9 @@ def plotHistogram(plot_context):
     categories = set()
     max_element_count = 0
     categorical = False
+    case_data = plot_context.gatherCaseData(key)
     for case in case_list:
-        data[case] = plot_context.dataGatherer().gatherData(ert, case, key)
+        data[case] = case_data[case, key].dropna()
 
         if data[case].dtype == "object":
             try:
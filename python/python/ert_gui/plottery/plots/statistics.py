@@ -1,6 +1,6 @@
 from matplotlib.patches import Rectangle
 from matplotlib.lines import Line2D
-from pandas import DataFrame
+from ert_gui.plottery import EnsembleStatistics as ES
 from .refcase import plotRefcase
 from .observations import plotObservations
 from .plot_tools import PlotTools
@@ -31,22 +31,10 @@ def plotStatistics(plot_context):
             rectangle = Rectangle((0, 0), 1, 1, color=style.color, alpha=0.8) # creates rectangle patch for legend use.
             config.addLegendItem(case, rectangle)
 
-            statistics_data = DataFrame()
+            statistics_data = plot_context.dataGatherer().gatherStatisticsData(ert, case, key)
             std_dev_factor = config.getStandardDeviationFactor()
 
-            statistics_data["Minimum"] = data.min(axis=1)
-            statistics_data["Maximum"] = data.max(axis=1)
-            statistics_data["Mean"] = data.mean(axis=1)
-            statistics_data["p10"] = data.quantile(0.1, axis=1)
-            statistics_data["p33"] = data.quantile(0.33, axis=1)
-            statistics_data["p50"] = data.quantile(0.50, axis=1)
-            statistics_data["p67"] = data.quantile(0.67, axis=1)
-            statistics_data["p90"] = data.quantile(0.90, axis=1)
-            std = data.std(axis=1) * std_dev_factor
-            statistics_data["std+"] = statistics_data["Mean"] + std
-            statistics_data["std-"] = statistics_data["Mean"] - std
-
-            _plotPercentiles(axes, config, statistics_data, case)
+            _plotPercentiles(axes, config, statistics_data, std_dev_factor)
             config.nextColor()
 
     _addStatisticsLegends(plot_config=config)
@@ -76,32 +64,36 @@ def _addStatisticsLegend(plot_config, style_name, alpha_multiplier=1.0):
             plot_config.addLegendItem(style.name, line)
 
 
-def _plotPercentiles(axes, plot_config, data, ensemble_label):
+def _plotPercentiles(axes, plot_config, data, std_dev_factor):
     """
     @type axes: matplotlib.axes.Axes
     @type plot_config: ert_gui.plottery.PlotConfig
     @type data: DataFrame
-    @type ensemble_label: Str
+    @type std_dev_factor: float
     """
+    index_values = data.index.values
+    mean = data[ES.MEAN].values
+    std = data[ES.STD].values * std_dev_factor
+
     style = plot_config.getStatisticsStyle("mean")
     if style.isVisible():
-        axes.plot(data.index.values, data["Mean"].values, alpha=style.alpha, linestyle=style.line_style, color=style.color, marker=style.marker, linewidth=style.width, markersize=style.size)
+        axes.plot(index_values, mean, alpha=style.alpha, linestyle=style.line_style, color=style.color, marker=style.marker, linewidth=style.width, markersize=style.size)
 
     style = plot_config.getStatisticsStyle("p50")
     if style.isVisible():
-        axes.plot(data.index.values, data["p50"].values, alpha=style.alpha, linestyle=style.line_style, color=style.color, marker=style.marker, linewidth=style.width, markersize=style.size)
+        axes.plot(index_values, data["p50"].values, alpha=style.alpha, linestyle=style.line_style, color=style.color, marker=style.marker, linewidth=style.width, markersize=style.size)
 
     style = plot_config.getStatisticsStyle("std")
-    _plotPercentile(axes, style, data.index.values, data["std+"].values, data["std-"].values, 0.5)
+    _plotPercentile(axes, style, index_values, mean + std, mean - std, 0.5)
 
     style = plot_config.getStatisticsStyle("min-max")
-    _plotPercentile(axes, style, data.index.values, data["Maximum"].values, data["Minimum"].values, 0.5)
+    _plotPercentile(axes, style, index_values, data[ES.MAXIMUM].values, data[ES.MINIMUM].values, 0.5)
 
     style = plot_config.getStatisticsStyle("p10-p90")
-    _plotPercentile(axes, style, data.index.values, data["p90"].values, data["p10"].values, 0.5)
+    _plotPercentile(axes, style, index_values, data["p90"].values, data["p10"].values, 0.5)
 
     style = plot_config.getStatisticsStyle("p33-p67")
-    _plotPercentile(axes, style, data.index.values, data["p67"].values, data["p33"].values, 0.5)
+    _plotPercentile(axes, style, index_values, data["p67"].values, data["p33"].values, 0.5)
 
 
 def _plotPercentile(axes, style, index_values, top_line_data, bottom_line_data, alpha_multiplier):
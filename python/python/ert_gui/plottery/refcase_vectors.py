@@ -0,0 +1,48 @@
+from threading import RLock
+
+
+class RefcaseVectors(object):
+    """
+    Extracts refcase vectors and their dates as NumPy arrays, one call per
+    vector. The vectors are cached per key for as long as the same EnKFMain
+    instance is used.
+    """
+    __lock = RLock()
+    __ert = None
+    __vectors = {}
+
+    @classmethod
+    def getVector(cls, ert, key):
+        """
+        Returns (dates, values) for the key, or None if there is no refcase or
+        the key is not in the refcase. The first element (the start of the
+        simulation) is not included.
+        :rtype: (numpy.ndarray, numpy.ndarray) or None
+        """
+        with cls.__lock:
+            if cls.__ert is not ert:
+                cls.__ert = ert
+                cls.__vectors = {}
+
+            if key not in cls.__vectors:
+                cls.__vectors[key] = cls._loadVector(ert, key)
+
+            return cls.__vectors[key]
+
+    @classmethod
+    def clear(cls):
+        with cls.__lock:
+            cls.__ert = None
+            cls.__vectors = {}
+
+    @staticmethod
+    def _loadVector(ert, key):
+        refcase = ert.eclConfig().getRefcase()
+
+        if refcase is None or not key in refcase:
+            return None
+
+        values = refcase.numpy_vector(key, report_only=False)
+        dates = refcase.numpy_dates
+
+        return dates[1:], values[1:]
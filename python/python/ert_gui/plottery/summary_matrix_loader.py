@@ -0,0 +1,121 @@
+import numpy
+from pandas import DataFrame, Index, factorize
+from res.enkf.export import SummaryCollector
+
+
+class SummaryMatrixLoader(object):
+    """
+    Loads summary data for one key as a wide (dates x realizations) frame.
+
+    The collector returns the data in long format, indexed by the product of
+    realizations and dates. Instead of pivoting, the value column is reshaped
+    into a single preallocated float matrix. Duplicate timestamps are detected
+    on the date index only.
+
+    As with the pivot, a repeated date is only dropped when every realization
+    has the same value at the repeated date. Otherwise the frame is pivoted,
+    which fails on the conflicting values.
+    """
+
+    @staticmethod
+    def loadSummaryMatrix(ert, case, key):
+        """ :rtype: pandas.DataFrame """
+        data = SummaryCollector.loadAllSummaryData(ert, case, [key])
+
+        if data.empty:
+            return data
+
+        return SummaryMatrixLoader.toMatrix(data, key)
+
+    @staticmethod
+    def toMatrix(data, key):
+        """
+        Converts a long format frame indexed by (Realization, Date) to a
+        frame with Date as index and one column per realization.
+        :type data: pandas.DataFrame
+        :type key: str
+        :rtype: pandas.DataFrame
+        """
+        realization_values = data.index.get_level_values("Realization")
+        date_values = data.index.get_level_values("Date")
+
+        layout = SummaryMatrixLoader._productLayout(realization_values, date_values)
+
+        if layout is None:
+            return SummaryMatrixLoader._pivot(data, key)
+
+        realizations, dates = layout
+        values = data[key].values.reshape(len(realizations), len(dates))
+
+        date_index = Index(dates, name="Date")
+        unique_dates = ~date_index.duplicated()
+
+        if not unique_dates.all():
+            if not SummaryMatrixLoader._duplicatesAreIdentical(values, dates):
+                return SummaryMatrixLoader._pivot(data, key)
+
+            SummaryMatrixLoader._warnDuplicates()
+            date_index = date_index[unique_dates]
+            values = values[:, unique_dates]
+
+        matrix = numpy.empty(shape=(len(date_index), len(realizations)), dtype=numpy.float64, order="F")
+        matrix[:] = values.T
+
+        columns = Index(realizations, name="Realization")
+        return DataFrame(matrix, index=date_index, columns=columns, copy=False)
+
+    @staticmethod
+    def _productLayout(realization_values, date_values):
+        """
+        Returns (realizations, dates) if the index is the full product of the
+        realizations and dates in realization major order, otherwise None.
+        """
+        realization_values = numpy.asarray(realization_values)
+        row_count = len(realization_values)
+        date_count = numpy.count_nonzero(realization_values == realization_values[0])
+
+        if row_count % date_count != 0:
+            return None
+
+        realization_count = row_count // date_count
+        realization_matrix = realization_values.reshape(realization_count, date_count)
+        realizations = realization_matrix[:, 0]
+
+        if not (realization_matrix == realizations[:, numpy.newaxis]).all():
+            return None
+
+        date_matrix = numpy.asarray(date_values).reshape(realization_count, date_count)
+        dates = date_matrix[0]
+
+        if not (date_matrix == dates[numpy.newaxis, :]).all():
+            return None
+
+        return realizations, dates
+
+    @staticmethod
+    def _duplicatesAreIdentical(values, dates):
+        """
+        True if the values of every repeated date equal the values of the
+        first occurrence of the date, for all realizations. NaN equals NaN.
+        :type values: numpy.ndarray of shape (realizations, dates)
+        """
+        codes = factorize(numpy.asarray(dates))[0]
+        first_positions = numpy.unique(codes, return_index=True)[1]
+        first = values[:, first_positions[codes]]
+        return bool(((values == first) | (numpy.isnan(values) & numpy.isnan(first))).all())
+
+    @staticmethod
+    def _pivot(data, key):
+        data = data.reset_index()
+
+        if any(data.duplicated()):
+            SummaryMatrixLoader._warnDuplicates()
+            data = data.drop_duplicates()
+
+        return data.pivot(index="Date", columns="Realization", values=key)
+
+    @staticmethod
+    def _warnDuplicates():
+        print("** Warning: The simulation data contains duplicate "
+              "timestamps. A possible explanation is that your "
+              "simulation timestep is less than a second.")
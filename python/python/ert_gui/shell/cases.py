@@ -1,5 +1,6 @@
 from res.enkf import EnkfVarType
 
+from ert_gui.ertwidgets.models.case_index import CaseIndex
 from ert_gui.shell import assertConfigLoaded, ErtShellCollection
 from ert_gui.shell.libshell import autoCompleteList, splitArguments
 from ert_gui.shell.libshell.shell_tools import boolValidator
@@ -68,8 +69,10 @@ class Cases(ErtShellCollection):
 
     @assertConfigLoaded
     def list(self, line):
+        fs_manager = self.ert().getEnkfFsManager()
+        ens_path = self.ert().getModelConfig().getEnspath()
         fs_list = self.getFileSystemNames()
-        current_fs = self.ert().getEnkfFsManager().getCurrentFileSystem().getCaseName()
+        current_fs = fs_manager.getCurrentFileSystem().getCaseName()
         max_length = max([len(fs) for fs in fs_list])
         case_format = "%1s %-" + str(max_length) + "s  %s"
         for fs in fs_list:
@@ -77,8 +80,17 @@ class Cases(ErtShellCollection):
             if fs == current_fs:
                 current = "*"
 
+            index = None
+            if fs != current_fs and not fs_manager.isCaseRunning(fs):
+                index = CaseIndex.load(ens_path, fs)
+
+            if index is not None:
+                has_data = index.hasData()
+            else:
+                has_data = fs_manager.caseHasData(fs)
+
             state = "No Data"
-            if self.ert().getEnkfFsManager().caseHasData(fs):
+            if has_data:
                 state = "Data"
 
             print(case_format % (current, fs, state))
@@ -170,5 +182,6 @@ class Cases(ErtShellCollection):
         size = self.ert().getEnsembleSize()
         parameters = ert.ensembleConfig().getKeylistFromVarType(EnkfVarType.PARAMETER)
         ert.getEnkfFsManager().initializeCaseFromScratch(fs , parameters, 0, size - 1)
+        CaseIndex.create(ert, case_name)
         
         print("Case: '%s' initialized")
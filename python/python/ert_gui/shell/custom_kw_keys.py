@@ -27,7 +27,7 @@ class CustomKWKeys(ErtShellCollection):
         if self.__plot_data_gatherer is None:
             custom_kw_pdg = PDG.gatherCustomKwData
             custom_kw_key_manager = self.ert().getKeyManager().isCustomKwKey
-            self.__plot_data_gatherer = PDG(custom_kw_pdg, custom_kw_key_manager)
+            self.__plot_data_gatherer = PDG(custom_kw_pdg, custom_kw_key_manager, batchGatherFunc=PDG.gatherCustomKwDataBatch)
 
         return self.__plot_data_gatherer
 
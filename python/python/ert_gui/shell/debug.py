@@ -1,4 +1,5 @@
 from ecl import EclVersion
+from ert_gui.plottery import PlotDataCache, PlotContext
 from ert_gui.shell import assertConfigLoaded, ErtShellCollection
 
 
@@ -12,6 +13,8 @@ class Debug(ErtShellCollection):
         self.addShellFunction(name="git_commit", function=Debug.gitCommit, help_message="Show the git commit")
         self.addShellFunction(name="info", function=Debug.info, help_message="Shows site_config, version, timestamp and Git Commit")
         self.addShellFunction(name="last_plugin_result", function=Debug.lastPluginResult, help_message="Shows the last plugin result.")
+        self.addShellFunction(name="plot_cache", function=Debug.plotCache, help_arguments="[clear]", help_message="Show the hit/miss counters and memory usage of the plot data cache. 'clear' empties the cache.")
+        self.addShellFunction(name="plot_gather", function=Debug.plotGather, help_message="Show the load time per case of the last cross case plot.")
         self.addShellFunction(name="eval", function=Debug.eval, help_arguments="<Python expression>", help_message="Evaluate a Python expression. The last plugin result is defined as: x")
 
         self.shellContext()["debug"] = self
@@ -45,6 +48,22 @@ class Debug(ErtShellCollection):
     def lastPluginResult(self, line):
         print("Last plugin result: %s" % self.__last_plugin_result)
 
+    def plotCache(self, line):
+        cache = PlotDataCache.sharedInstance()
+
+        if line.strip() == "clear":
+            cache.clear()
+            cache.resetCounters()
+
+        print("Entries: %d" % len(cache))
+        print("Memory:  %d of %d bytes" % (cache.memory_usage, cache.memory_limit))
+        print("Hits:    %d" % cache.hits)
+        print("Misses:  %d" % cache.misses)
+
+    def plotGather(self, line):
+        for case, load_time in PlotContext.lastCaseLoadTimes().items():
+            print("  %-30s %8.3f s" % (case, load_time))
+
     def eval(self, line):
         line = line.strip()
 
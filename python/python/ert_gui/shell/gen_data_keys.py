@@ -12,6 +12,7 @@ class GenDataKeys(ErtShellCollection):
         ShellPlot.addPrintSupport(self, "GenData")
         ShellPlot.addEnsemblePlotSupport(self, "GenData")
         ShellPlot.addQuantilesPlotSupport(self, "GenData")
+        ShellPlot.addQuantilesPrintSupport(self, "GenData")
 
 
     def fetchSupportedKeys(self):
@@ -22,7 +22,7 @@ class GenKWKeys(ErtShellCollection):
         if self.__plot_data_gatherer is None:
             gen_kw_pdg = PDG.gatherGenKwData
             gen_kw_key_manager = self.ert().getKeyManager().isGenKwKey
-            self.__plot_data_gatherer = PDG(gen_kw_pdg, gen_kw_key_manager)
+            self.__plot_data_gatherer = PDG(gen_kw_pdg, gen_kw_key_manager, batchGatherFunc=PDG.gatherGenKwDataBatch)
 
         return self.__plot_data_gatherer
 
@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 
 from ert_gui.plottery.plot_config_factory import PlotConfigFactory
 from ert_gui.shell import assertConfigLoaded
-from ert_gui.plottery import PlotConfig, PlotContext
+from ert_gui.plottery import PlotConfig, PlotContext, KeySearchIndex
 from ert_gui.shell.libshell import matchItems, extractFullArgument, autoCompleteListWithSeparator
 
 
@@ -116,11 +116,27 @@ class ShellPlot(object):
 
         return assertConfigLoaded(do_function)
 
+    @classmethod
+    def keySearchIndex(cls, instance):
+        """
+        A search index over the supported keys of the instance. The index is
+        kept on the instance and rebuilt when the supported keys change.
+        :rtype: KeySearchIndex
+        """
+        keys = list(instance.fetchSupportedKeys())
+        index = getattr(instance, "_key_search_index", None)
+
+        if index is None or index.keys() != keys:
+            index = KeySearchIndex(keys)
+            instance._key_search_index = index
+
+        return index
+
     @classmethod
     def _createCompleteFunction(cls):
         def complete_function(self, text, line, begidx, endidx):
             key = extractFullArgument(line, endidx)
-            return autoCompleteListWithSeparator(key, self.fetchSupportedKeys())
+            return autoCompleteListWithSeparator(key, ShellPlot.keySearchIndex(self).completions(key))
 
         complete_function = assertConfigLoaded(complete_function)
         return complete_function
@@ -234,3 +250,37 @@ class ShellPlot(object):
                                   completer=cls._createCompleteFunction(),
                                   help_arguments="<key_1> [key_2..key_n]",
                                   help_message="Print the values for the specified %s key(s)." % name)
+
+    @classmethod
+    def _createDoPrintQuantilesFunction(cls, name):
+        def do_function(self, line):
+            keys = matchItems(line, self.fetchSupportedKeys())
+
+            if len(keys) == 0:
+                self.lastCommandFailed("Must have at least one %s key" % name)
+                return False
+
+            case_name = self.shellContext().ert().getEnkfFsManager().getCurrentFileSystem().getCaseName()
+
+            for key in keys:
+                pdg = self.plotDataGatherer()
+                if pdg.canGatherDataForKey(key):
+                    data = pdg.gatherStatisticsData(self.shellContext().ert(), case_name, key)
+                    print(data)
+                else:
+                    self.lastCommandFailed("Unable to print quantiles for key: %s" % key)
+
+        return assertConfigLoaded(do_function)
+
+    @classmethod
+    def addQuantilesPrintSupport(cls, instance, name):
+        """
+        :type instance: ert_gui.shell.ShellFunction
+        """
+        cls._checkForRequiredMethods(instance)
+
+        instance.addShellFunction(name="quantiles",
+                                  function=cls._createDoPrintQuantilesFunction(name),
+                                  completer=cls._createCompleteFunction(),
+                                  help_arguments="<key_1> [key_2..key_n]",
+                                  help_message="Print the minimum, maximum, mean, standard deviation and quantiles for the specified %s key(s)." % name)
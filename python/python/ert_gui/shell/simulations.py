@@ -3,6 +3,7 @@ from datetime import datetime
 
 from res.enkf import EnkfSimulationRunner
 from res.enkf.enums import HookRuntime
+from ert_gui.ertwidgets.models.case_index import CaseIndex
 from ert_gui.shell import assertConfigLoaded, ErtShellCollection
 
 
@@ -43,6 +44,7 @@ class Simulations(ErtShellCollection):
 
         print("Start simulations!")
         num_successful_realizations = simulation_runner.runEnsembleExperiment()
+        CaseIndex.create(self.ert(), self.ert().getEnkfFsManager().getCurrentFileSystem().getCaseName())
 
         success = self.ert().analysisConfig().haveEnoughRealisations(num_successful_realizations, self.ert().getEnsembleSize())
         if not success:
@@ -4,6 +4,7 @@ from res.enkf import ESUpdate, ErtRunContext
 from ert_gui.shell import assertConfigLoaded, ErtShellCollection
 from ert_gui.shell.libshell import splitArguments, createFloatValidator
 from res.enkf.enums import HookRuntime
+from ert_gui.ertwidgets.models.case_index import CaseIndex
 
 class Smoother(ErtShellCollection):
     def __init__(self, parent):
@@ -90,6 +91,8 @@ class Smoother(ErtShellCollection):
 
             if not success:
                 self.lastCommandFailed("Unable to perform update")
+            else:
+                CaseIndex.create(ert, case_name)
 
             ert.getEnkfSimulationRunner().runWorkflows(HookRuntime.POST_UPDATE)
 
@@ -1,6 +1,6 @@
 from ert_gui.plottery import PlotDataGatherer as PDG
 from ert_gui.shell import assertConfigLoaded, ShellPlot, ErtShellCollection
-from ert_gui.shell.libshell import splitArguments
+from ert_gui.shell.libshell import splitArguments, extractFullArgument, autoCompleteListWithSeparator
 
 
 class SummaryKeys(ErtShellCollection):
@@ -9,7 +9,10 @@ class SummaryKeys(ErtShellCollection):
 
         self.addShellFunction(name="list",
                               function=SummaryKeys.list,
-                              help_message="Shows a list of all available Summary keys. (* = with observations)")
+                              completer=SummaryKeys.completeList,
+                              help_arguments="[pattern]",
+                              help_message="Shows a list of all available Summary keys. (* = with observations) "
+                                           "The keys can be filtered with a pattern like WOPR:* or *:OP1.")
 
         self.addShellFunction(name="observations",
                               function=SummaryKeys.observations,
@@ -30,17 +33,29 @@ class SummaryKeys(ErtShellCollection):
         ShellPlot.addPrintSupport(self, "Summary")
         ShellPlot.addEnsemblePlotSupport(self, "Summary")
         ShellPlot.addQuantilesPlotSupport(self, "Summary")
+        ShellPlot.addQuantilesPrintSupport(self, "Summary")
 
 
     @assertConfigLoaded
     def list(self, line):
-        keys = self.summaryKeys()
+        pattern = line.strip()
+
+        if len(pattern) > 0:
+            keys = ShellPlot.keySearchIndex(self).match(pattern)
+        else:
+            keys = self.summaryKeys()
+
         observation_keys = self.summaryObservationKeys()
 
         result = ["*%s" % key if key in observation_keys else " %s" % key for key in keys]
 
         self.columnize(result)
 
+    @assertConfigLoaded
+    def completeList(self, text, line, begidx, endidx):
+        key = extractFullArgument(line, endidx)
+        return autoCompleteListWithSeparator(key, ShellPlot.keySearchIndex(self).completions(key))
+
     @assertConfigLoaded
     def observations(self, line):
         keys = self.summaryKeys()
@@ -1,6 +1,7 @@
 from .progress import Progress
 from .simple_progress import SimpleProgress
 from .detailed_progress import DetailedProgressDialog
+from .realization_list_model import RealizationListModel
 from .run_dialog import RunDialog
 from .simulation_config_panel import SimulationConfigPanel
 from .single_test_run_panel import SingleTestRunPanel
@@ -1,17 +1,29 @@
 import math
 import time
+
+import numpy
+
 try:
-  from PyQt4.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel
+  from PyQt4.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel, QRect
   from PyQt4.QtGui import QWidget, QPainter, QColor, QFrame, QGridLayout, QImage, QDialog, QTableView, QLabel
 except ImportError:
-  from PyQt5.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel
+  from PyQt5.QtCore import QTimer, pyqtSignal, QVariant, Qt, QAbstractTableModel, QRect
   from PyQt5.QtWidgets import QWidget, QFrame, QDialog, QTableView, QLabel, QGridLayout
   from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QImage
 
 
 class DetailedProgress(QFrame):
+    """
+    Shows the status of every forward model job of every realization. The
+    statuses are kept in a (realization x job) array of status codes which
+    is mapped through a color table into the pixel buffer of the image in
+    one step. When the progress is updated only the cells of the
+    realizations with changed statuses are repainted.
+    """
     clicked = pyqtSignal(int)
 
+    FULL_UPDATE_LIMIT = 256
+
     def __init__(self, states, parent):
         super(DetailedProgress, self).__init__(parent)
         self.setLineWidth(1)
@@ -19,8 +31,23 @@ class DetailedProgress(QFrame):
         self.state_colors = {state.name: state.color for state in states}
         self.state_colors['Success'] = (255, 200, 128)
         self.state_colors['Failure'] = self.state_colors["Failed"]
+
+        # Code 0 is used for jobs without status and is transparent
+        self._status_codes = {}
+        colors = [0]
+        for name in sorted(self.state_colors):
+            red, green, blue = self.state_colors[name]
+            self._status_codes[name] = len(colors)
+            colors.append(0xff000000 | (red << 16) | (green << 8) | blue)
+        self._color_table = numpy.array(colors, dtype=numpy.uint32)
+
         self._current_iteration = 0
         self._current_progress = []
+        self._statuses = numpy.zeros((0, 0), dtype=numpy.uint8)
+        self._versions = {}
+        self._layout = None
+        self._pixels = None
+        self._image = None
         self.selected_realization = -1
         self.grid_height = -1
         self.grid_width = -1
@@ -33,52 +60,146 @@ class DetailedProgress(QFrame):
         y = int((float(position.y()) / self.height()) * self.grid_height)
         index = y * self.grid_width + x
 
+        previous = self.selected_realization
         self.selected_realization = index
         self.clicked.emit(index)
-        self.update()
+        self.update(self._cellRect(previous))
+        self.update(self._cellRect(index))
+
+    def statusArray(self):
+        """ The status codes as an array with one row per realization and one column per job. @rtype: numpy.ndarray """
+        return self._statuses
+
+    def statusCode(self, status):
+        """ @rtype: int """
+        return self._status_codes.get(status, 0)
+
+    @staticmethod
+    def layoutStatusImage(statuses, grid_width, grid_height, sub_grid_size):
+        """
+        Arranges the job statuses of each realization in a square of
+        sub_grid_size x sub_grid_size pixels, and the realizations in a grid
+        of grid_width x grid_height squares.
+        @type statuses: numpy.ndarray (realizations x jobs)
+        @rtype: numpy.ndarray (grid_height * sub_grid_size x grid_width * sub_grid_size)
+        """
+        realization_count, job_count = statuses.shape
+        cells = numpy.zeros((grid_width * grid_height, sub_grid_size * sub_grid_size), dtype=statuses.dtype)
+        cells[:realization_count, :job_count] = statuses
+        cells = cells.reshape(grid_height, grid_width, sub_grid_size, sub_grid_size)
+        return cells.transpose(0, 2, 1, 3).reshape(grid_height * sub_grid_size, grid_width * sub_grid_size)
 
-    def draw_window(self, x, y, progress, render_image):
-        nr_jobs = len(progress)
-        grid_size = int(math.ceil(math.sqrt(nr_jobs)))
+    def set_progress(self, progress, iteration):
+        """ @type progress: ert_gui.simulation.models.JobStatusTable """
+        status_names, table_codes, versions = progress.snapshot()
+        realizations = numpy.flatnonzero(versions)
+        self._current_progress = [int(iens) for iens in realizations]
 
-        for index, job in enumerate(progress):
-            y_off = index / grid_size
-            x_off = index - (y_off * grid_size)
-            color = QColor(*self.state_colors[job.status])
-            render_image.setPixel(x + x_off, y + y_off, color.rgb())
+        if iteration != self._current_iteration:
+            self._versions = {}
 
-    def set_progress(self, progress, iteration):
-        self._current_progress = sorted(progress.items(), key=lambda x: x[0])
         self._current_iteration = iteration
-        self.update()
+
+        codes = numpy.array([0] + [self.statusCode(name) for name in status_names], dtype=numpy.uint8)
+        realization_count = realizations[-1] + 1 if len(realizations) > 0 else 0
+        job_count = table_codes.shape[1]
+
+        statuses = self._statuses
+        if statuses.shape != (realization_count, job_count):
+            statuses = numpy.zeros((realization_count, job_count), dtype=numpy.uint8)
+            self._versions = {}
+
+        changed = []
+        for iens in self._current_progress:
+            version = int(versions[iens])
+            if self._versions.get(iens) == version:
+                continue
+
+            self._versions[iens] = version
+            row = codes[table_codes[iens]]
+
+            if not numpy.array_equal(row, statuses[iens]):
+                statuses[iens] = row
+                changed.append(iens)
+
+        if statuses is not self._statuses:
+            self._statuses = statuses
+            self._layout = None
+            self.update()
+        elif len(changed) > DetailedProgress.FULL_UPDATE_LIMIT or self._layout is None:
+            self._layout = None
+            self.update()
+        else:
+            self._updateCells(changed)
+
+    def _updateLayout(self):
+        width = self.width()
+        height = self.height()
+        realization_count, job_count = self._statuses.shape
+        layout = (width, height, realization_count, job_count)
+
+        if layout == self._layout:
+            return
+
+        aspect_ratio = float(width) / height
+        self.grid_height = int(math.ceil(math.sqrt(realization_count / aspect_ratio)))
+        self.grid_width = int(math.ceil(self.grid_height * aspect_ratio))
+        self._sub_grid_size = int(math.ceil(math.sqrt(job_count)))
+
+        status_image = self.layoutStatusImage(self._statuses, self.grid_width, self.grid_height, self._sub_grid_size)
+        self._setPixels(self._color_table[status_image])
+        self._layout = layout
+
+    def _setPixels(self, pixels):
+        # The image uses the array as its buffer, which must be kept alive as long as the image
+        self._pixels = numpy.ascontiguousarray(pixels)
+        image_height, image_width = self._pixels.shape
+        self._image = QImage(self._pixels.data, image_width, image_height, image_width * 4, QImage.Format_ARGB32)
+
+    def _updateCells(self, changed):
+        if len(changed) == 0:
+            return
+
+        sub_grid_size = self._sub_grid_size
+        job_count = self._statuses.shape[1]
+
+        for iens in changed:
+            y = iens // self.grid_width
+            x = iens - y * self.grid_width
+            cell = numpy.zeros(sub_grid_size * sub_grid_size, dtype=numpy.uint8)
+            cell[:job_count] = self._statuses[iens]
+            self._pixels[y * sub_grid_size:(y + 1) * sub_grid_size, x * sub_grid_size:(x + 1) * sub_grid_size] = self._color_table[cell.reshape(sub_grid_size, sub_grid_size)]
+            self.update(self._cellRect(iens))
+
+    def _cellRect(self, iens):
+        if iens < 0 or self.grid_width <= 0:
+            return QRect()
+
+        cell_width = float(self.width()) / self.grid_width
+        cell_height = float(self.height()) / self.grid_height
+        y = iens // self.grid_width
+        x = iens - y * self.grid_width
+        return QRect(int(x * cell_width), int(y * cell_height), int(math.ceil(cell_width)) + 1, int(math.ceil(cell_height)) + 1)
 
     def paintEvent(self, event):
         super(DetailedProgress, self).paintEvent(event)
-        if not self._current_progress:
+        if not self._current_progress or self._statuses.shape[1] == 0:
             return
 
+        self._updateLayout()
+
         painter = QPainter(self)
-        width = self.width()
-        height = self.height()
-        aspect_ratio = float(width)/height
-        nr_realizations = len(self._current_progress)
-        fm_size = len(self._current_progress[0][1])
-        self.grid_height = math.ceil(math.sqrt(nr_realizations / aspect_ratio))
-        self.grid_width = math.ceil(self.grid_height * aspect_ratio)
-        sub_grid_size = math.ceil(math.sqrt(fm_size))
-        cell_height = height / self.grid_height
-        cell_width = width / self.grid_width
-
-        foreground_image = QImage(self.grid_width*sub_grid_size, self.grid_height*sub_grid_size, QImage.Format_ARGB32)
-        foreground_image.fill(QColor(0, 0, 0, 0))
-
-        for index, (iens, progress) in enumerate(self._current_progress):
-            y = int(iens / self.grid_width)
-            x = int(iens - (y * self.grid_width))
-            self.draw_window(x * sub_grid_size, y * sub_grid_size, progress, foreground_image)
-        painter.drawImage(self.contentsRect(), foreground_image)
+        painter.drawImage(self.contentsRect(), self._image)
+
+        cell_width = float(self.width()) / self.grid_width
+        cell_height = float(self.height()) / self.grid_height
+        update_rect = event.rect()
+
+        for iens in self._current_progress:
+            rect = self._cellRect(iens)
+            if not update_rect.intersects(rect):
+                continue
 
-        for index, (iens, progress) in enumerate(self._current_progress):
             y = int(iens / self.grid_width)
             x = int(iens - (y * self.grid_width))
             if iens == self.selected_realization:
@@ -158,6 +279,7 @@ class DetailedProgressDialog(QDialog):
         self.layout().setColumnStretch(1, 2)
         self.progress = None
         self.selected_realization = None
+        self._selected_version = None
         self.resize(parent.width(), parent.height())
 
     def set_progress(self, progress, iteration):
@@ -176,11 +298,18 @@ class DetailedProgressDialog(QDialog):
         self.update_single_view()
 
     def update_single_view(self):
-        if not self.single_view.isVisible() or not self.selected_realization in self.progress:
+        if not self.single_view.isVisible() or self.progress is None or not self.selected_realization in self.progress:
+            return
+
+        # The job details are only loaded for the selected realization, and only when its status has changed
+        version = (self.progress.iteration, self.selected_realization, self.progress.version(self.selected_realization))
+        if version == self._selected_version:
             return
 
+        self._selected_version = version
+        jobs = self.progress.loadJobs(self.selected_realization)
+
         model_data = []
-        jobs = self.progress[self.selected_realization]
         headers = []
         for job in jobs:
             data = job.dump_data()
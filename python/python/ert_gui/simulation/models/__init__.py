@@ -1,3 +1,7 @@
+from .queue_status_snapshot import QueueStatusSnapshot
+from .forward_model_status_watcher import ForwardModelStatusWatcher
+from .progress_events import ProgressEvent, ProgressEventQueue, PhaseChangedEvent, RealizationStatusChangedEvent, JobStatusChangedEvent, RunFailedEvent, SimulationsEndedEvent
+from .job_status_table import JobStatusTable
 from .base_run_model import BaseRunModel, ErtRunError
 from .ensemble_experiment import EnsembleExperiment
 from .single_test_run import SingleTestRun
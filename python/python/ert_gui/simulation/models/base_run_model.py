@@ -1,9 +1,16 @@
 import time
+import numpy
+from threading import RLock
 from res.job_queue import JobStatusType
-from res.job_queue import JobQueueManager, ForwardModelStatus
+from res.job_queue import JobQueueManager
 from ert_gui import ERT
 from res.util import ResLog
 from ecl.util.util import BoolVector
+from ert_gui.ertwidgets.models.case_index import CaseIndex
+from ert_gui.simulation.models.queue_status_snapshot import QueueStatusSnapshot
+from ert_gui.simulation.models.forward_model_status_watcher import ForwardModelStatusWatcher
+from ert_gui.simulation.models.job_status_table import JobStatusTable
+from ert_gui.simulation.models.progress_events import ProgressEventQueue, PhaseChangedEvent, RealizationStatusChangedEvent, JobStatusChangedEvent, RunFailedEvent, SimulationsEndedEvent
 
 # A method decorated with the @job_queue decorator implements the following logic:
 #
@@ -47,11 +54,19 @@ class BaseRunModel(object):
         self._queue_config = queue_config
         self._job_queue = None
         self.realization_progress = {}
+        """ @type: dict[int, JobStatusTable] """
+        self._progress_lock = RLock()
+        self._phase_lock = RLock()
+        self._progress_events = ProgressEventQueue()
+        self._last_queue_statuses = None
+        self._status_watcher = ForwardModelStatusWatcher(self._forwardModelStatusChanged, poll_callback=self._monitorRun)
         self.initial_realizations_mask = None
         self.completed_realizations_mask = None
         self.support_restart = True
         self._run_context = None
         self._last_run_iteration = -1;
+        self._runpath_creation_times = {}
+        self._written_cases = []
         self.reset( )
 
     def ert(self):
@@ -63,22 +78,71 @@ class BaseRunModel(object):
         self._failed = False
 
 
+    def progressEvents(self):
+        """
+        The events published while simulating: phase changes, realization
+        and job status changes, and failure.
+        @rtype: ProgressEventQueue
+        """
+        return self._progress_events
+
+
     def startSimulations(self, arguments):
+        self._status_watcher.start()
         try:
             self.initial_realizations_mask = arguments["active_realizations"]
             run_context = self.runSimulations(arguments)
-            self.updateDetailedProgress()
             self.completed_realizations_mask = run_context.get_mask()
         except ErtRunError as e:
             self.completed_realizations_mask = BoolVector(default_value = False)
             self._failed = True
             self._fail_message = str(e)
             self._simulationEnded()
+            self._progress_events.publish(RunFailedEvent(self._fail_message))
         except UserWarning as e:
             self._fail_message = str(e)
             self._simulationEnded()
-
-        self._run_context = None #delete last active run_context to notify fs_manager that storage is not being written to
+        except Exception as e:
+            self._failed = True
+            self._fail_message = str(e)
+            self._simulationEnded()
+            self._progress_events.publish(RunFailedEvent(self._fail_message))
+            raise
+        finally:
+            # The final poll of the watcher registers the realizations submitted last, so the run context is still needed
+            self._status_watcher.stop()
+            self._run_context = None #delete last active run_context to notify fs_manager that storage is not being written to
+            self._writeCaseIndexes()
+            self._progress_events.publish(SimulationsEndedEvent(self._failed))
+
+    def _writeCaseIndexes(self):
+        """ Writes the index of the cases written by the run, while their storage is still mounted. """
+        cases = self._written_cases
+        self._written_cases = []
+
+        for case in cases:
+            try:
+                CaseIndex.create(self.ert(), case)
+            except Exception:
+                # The index is only an optimization, the case is read from storage without it.
+                pass
+
+    def createRunPath(self, run_context):
+        """ Creates the runpaths of the active realizations and records the time it took. """
+        start_time = time.time()
+        self.ert().getEnkfSimulationRunner().createRunPath(run_context)
+        self._runpath_creation_times[run_context.get_iter()] = time.time() - start_time
+
+        for fs in (run_context.get_sim_fs(), run_context.get_target_fs()):
+            if fs is not None and not fs.getCaseName() in self._written_cases:
+                self._written_cases.append(fs.getCaseName())
+
+    def getRunpathCreationTimes(self):
+        """
+        The time in seconds spent creating the runpaths of each iteration.
+        @rtype: dict[int, float]
+        """
+        return dict(self._runpath_creation_times)
 
     def runSimulations(self, job_queue, run_context):
         raise NotImplementedError("Method must be implemented by inheritors!")
@@ -115,8 +179,12 @@ class BaseRunModel(object):
 
 
     def setPhaseName(self, phase_name, indeterminate=None):
-        self._phase_name = phase_name
-        self.setIndeterminate(indeterminate)
+        with self._phase_lock:
+            self._phase_name = phase_name
+            if indeterminate is not None:
+                self._indeterminate = indeterminate
+
+            self._publishPhase()
 
 
     def getPhaseName(self):
@@ -126,7 +194,14 @@ class BaseRunModel(object):
 
     def setIndeterminate(self, indeterminate):
         if indeterminate is not None:
-            self._indeterminate = indeterminate
+            with self._phase_lock:
+                self._indeterminate = indeterminate
+                self._publishPhase()
+
+
+    def _publishPhase(self):
+        event = PhaseChangedEvent(self._phase, self._phase_count, self._phase_name, self._indeterminate)
+        self._progress_events.publish(event)
 
 
     def isFinished(self):
@@ -149,20 +224,23 @@ class BaseRunModel(object):
 
 
     def setPhase(self, phase, phase_name, indeterminate=None):
-        self.setPhaseName(phase_name)
-        if not 0 <= phase <= self._phase_count:
-            raise ValueError("Phase must be an integer from 0 to less than %d." % self._phase_count)
+        with self._phase_lock:
+            self._phase_name = phase_name
+            if not 0 <= phase <= self._phase_count:
+                raise ValueError("Phase must be an integer from 0 to less than %d." % self._phase_count)
 
-        self.setIndeterminate(indeterminate)
+            if indeterminate is not None:
+                self._indeterminate = indeterminate
 
-        if phase == 0:
-            self._job_start_time = int(time.time())
+            if phase == 0:
+                self._job_start_time = int(time.time())
 
-        if phase == self._phase_count:
-            self._simulationEnded()
+            if phase == self._phase_count:
+                self._simulationEnded()
 
-        self._phase = phase
-        self._phase_update_count = 0
+            self._phase = phase
+            self._phase_update_count = 0
+            self._publishPhase()
 
 
     def getRunningTime(self):
@@ -182,22 +260,25 @@ class BaseRunModel(object):
 
         return queue_size
 
-    @job_queue({})
-    def getQueueStatus(self):
-        """ @rtype: dict of (JobStatusType, int) """
-        queue_status = {}
-
-        if self._job_queue.isRunning():
-            for job_number in range(len(self._job_queue)):
-                status = self._job_queue.getJobStatus(job_number)
+    def getQueueStatusSnapshot(self):
+        """
+        Reads the status of all jobs once. Pass the snapshot to getProgress()
+        and use it for the state counts instead of reading the queue again.
+        @rtype: QueueStatusSnapshot
+        """
+        job_queue = self._job_queue
 
-                if not status in queue_status:
-                    queue_status[status] = 0
+        if job_queue is None:
+            return QueueStatusSnapshot([])
 
-                queue_status[status] += 1
+        return QueueStatusSnapshot.fromQueue(job_queue)
 
+    def getQueueStatus(self, queue_status_snapshot=None):
+        """ @rtype: dict of (JobStatusType, int) """
+        if queue_status_snapshot is None:
+            queue_status_snapshot = self.getQueueStatusSnapshot()
 
-        return queue_status
+        return queue_status_snapshot.statusCounts()
 
     @job_queue(False)
     def isQueueRunning(self):
@@ -205,23 +286,24 @@ class BaseRunModel(object):
         return self._job_queue.isRunning()
 
 
-    def getProgress(self):
-        """ @rtype: float """
+    def getProgress(self, queue_status_snapshot=None):
+        """
+        @type queue_status_snapshot: QueueStatusSnapshot or None read from the queue if None
+        @rtype: float
+        """
         if self.isFinished():
             current_progress = 1.0
         elif not self.isQueueRunning() and self._phase_update_count > 0:
             current_progress = (self._phase + 1.0) / self._phase_count
         else:
             self._phase_update_count += 1
-            queue_status = self.getQueueStatus()
+            if queue_status_snapshot is None:
+                queue_status_snapshot = self.getQueueStatusSnapshot()
+
             queue_size = self.getQueueSize()
 
             done_state = JobStatusType.JOB_QUEUE_SUCCESS | JobStatusType.JOB_QUEUE_DONE
-            done_count = 0
-
-            for state in queue_status:
-                if state in done_state:
-                    done_count += queue_status[state]
+            done_count = queue_status_snapshot.count(done_state)
 
             phase_progress = float(done_count) / queue_size
             current_progress = (self._phase + phase_progress) / self._phase_count
@@ -230,21 +312,61 @@ class BaseRunModel(object):
 
     @staticmethod
     def is_forward_model_finished(progress):
-        for job in progress:
-            if job.status != 'Success':
-                return False
+        return ForwardModelStatusWatcher.isFinished(progress)
+
+    def _jobStatusTable(self, iteration):
+        with self._progress_lock:
+            if iteration not in self.realization_progress:
+                self.realization_progress[iteration] = JobStatusTable(iteration)
+
+            return self.realization_progress[iteration]
+
+    def _forwardModelStatusChanged(self, iteration, deltas):
+        job_status_table = self._jobStatusTable(iteration)
 
-        return True
+        for iens, jobs in deltas.items():
+            job_status_table.update(iens, jobs)
+
+        self._progress_events.publish(JobStatusChangedEvent(iteration, sorted(deltas)))
+
+    def _monitorRun(self):
+        """ Called by the status watcher thread before every poll. """
+        self.updateDetailedProgress()
+        self._publishQueueStatus()
+
+    def _publishQueueStatus(self):
+        queue_status_snapshot = self.getQueueStatusSnapshot()
+        statuses = queue_status_snapshot.statuses
+
+        if len(statuses) == 0:
+            return
+
+        if self._last_queue_statuses is not None and numpy.array_equal(statuses, self._last_queue_statuses):
+            return
+
+        self._last_queue_statuses = statuses
+        queue_size = max(1, queue_status_snapshot.queue_size)
+        self._progress_events.publish(RealizationStatusChangedEvent(queue_status_snapshot, queue_size))
 
     def updateDetailedProgress(self):
-        if not self._run_context:
+        """
+        Adds the submitted realizations to the status watcher, which reads
+        the status files in the background and updates realization_progress.
+        Only called by the status watcher before every poll, so the watcher
+        is the only writer of the progress.
+        """
+        run_context = self._run_context
+        if not run_context:
             return
 
-        iteration = self._run_context.get_iter()
-        if iteration not in self.realization_progress:
-            self.realization_progress[iteration] = {}
-        for run_arg in self._run_context:
-            if not run_arg:
+        iteration = run_context.get_iter()
+        if iteration != self._status_watcher.iteration:
+            self._status_watcher.setIteration(iteration)
+
+        job_status_table = self._jobStatusTable(iteration)
+
+        for run_arg in run_context:
+            if not run_arg or self._status_watcher.isKnown(run_arg.iens):
                 continue
             try:
                 # will throw if not yet submitted (is in a limbo state)
@@ -252,29 +374,24 @@ class BaseRunModel(object):
             except ValueError:
                 continue
 
-            fms = self.realization_progress[iteration].get(run_arg.iens, None)
-            if fms and BaseRunModel.is_forward_model_finished(fms):
-                continue
-
-            fms = ForwardModelStatus.load(run_arg.runpath, num_retry=1)
-
-            if not fms:
-                continue
-
-            jobs = fms.jobs
-            self.realization_progress[iteration][run_arg.iens] = jobs
+            job_status_table.setRunpath(run_arg.iens, run_arg.runpath)
+            self._status_watcher.watch(run_arg.iens, run_arg.runpath)
 
     def getDetailedProgress(self):
-        self.updateDetailedProgress()
-
-        if self._run_context and self._run_context.get_iter() in self.realization_progress:
-            return self.realization_progress[self._run_context.get_iter()], self._run_context.get_iter()
-
-        elif self._last_run_iteration in self.realization_progress:
-            return self.realization_progress[self._last_run_iteration], self._last_run_iteration
+        """
+        The job status table of the current (or last) iteration and the
+        iteration. Only reads the progress maintained by the status watcher.
+        @rtype: (JobStatusTable, int)
+        """
+        with self._progress_lock:
+            if self._run_context and self._run_context.get_iter() in self.realization_progress:
+                iteration = self._run_context.get_iter()
+            elif self._last_run_iteration in self.realization_progress:
+                iteration = self._last_run_iteration
+            else:
+                return JobStatusTable(-1), -1
 
-        else:
-            return {},-1
+            return self.realization_progress[iteration], iteration
 
     def isIndeterminate(self):
         """ @rtype: bool """
@@ -27,7 +27,7 @@ class EnsembleSmoother(BaseRunModel):
         # self.setAnalysisModule(arguments["analysis_module"])
 
         self.setPhaseName("Pre processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().createRunPath(prior_context)
+        self.createRunPath(prior_context)
         self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
 
         self.setPhaseName("Running forecast...", indeterminate=False)
@@ -55,7 +55,7 @@ class EnsembleSmoother(BaseRunModel):
 
         rerun_context = self.create_context( arguments, prior_context = prior_context )
 
-        self.ert().getEnkfSimulationRunner().createRunPath( rerun_context )
+        self.createRunPath(rerun_context)
         self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
 
         self.setPhaseName("Running forecast...", indeterminate=False)
@@ -0,0 +1,242 @@
+import os
+import sys
+import traceback
+from multiprocessing.pool import ThreadPool
+from threading import Event, RLock, Thread
+
+from res.job_queue import ForwardModelStatus
+
+
+class ForwardModelStatusWatcher(object):
+    """
+    Follows the forward model status files of the realizations in one
+    iteration. Each poll only stats the status files, and a file is only
+    parsed again when its modification time, size or inode has changed.
+    While polling in the background the changed files are parsed by a
+    bounded pool of threads that lives from start() to stop().
+
+    Realizations where all jobs have succeeded are no longer watched. The
+    parsed job lists are passed to the callback as a dict from realization
+    number to jobs, together with the iteration they belong to.
+
+    The watcher can be polled directly, or from a background thread with
+    start() and stop(). The optional poll callback is called before every
+    poll, e.g. to add realizations that have been submitted. An error in a
+    background poll is written to stderr and polling continues.
+    """
+    STATUS_FILE = "status.json"
+    DEFAULT_INTERVAL = 1.0
+    DEFAULT_THREAD_COUNT = 4
+
+    def __init__(self, callback, interval=DEFAULT_INTERVAL, thread_count=DEFAULT_THREAD_COUNT, load_status=None, poll_callback=None):
+        """
+        @type callback: (int, dict[int, list]) -> None
+        @type poll_callback: () -> None or None
+        @type interval: float seconds between polls when running in the background
+        @type thread_count: int the maximum number of status files parsed at the same time
+        @type load_status: (str) -> ForwardModelStatus or None
+        """
+        super(ForwardModelStatusWatcher, self).__init__()
+        self._callback = callback
+        self._interval = interval
+        self._thread_count = max(1, thread_count)
+
+        if load_status is None:
+            load_status = lambda runpath: ForwardModelStatus.load(runpath, num_retry=1)
+
+        self._load_status = load_status
+        self._poll_callback = poll_callback
+
+        self._lock = RLock()
+        self._poll_lock = RLock()
+        self._iteration = None
+        self._watched = {}
+        self._finished = set()
+        self._stamps = {}
+
+        self._thread = None
+        self._pool = None
+        self._stop_event = Event()
+
+        self._stat_count = 0
+        self._load_count = 0
+
+    @property
+    def iteration(self):
+        """ @rtype: int or None """
+        return self._iteration
+
+    @property
+    def stat_count(self):
+        """ The number of status files examined since the watcher was created. @rtype: int """
+        return self._stat_count
+
+    @property
+    def load_count(self):
+        """ The number of status files parsed since the watcher was created. @rtype: int """
+        return self._load_count
+
+    @staticmethod
+    def isFinished(jobs):
+        """ @rtype: bool """
+        for job in jobs:
+            if job.status != 'Success':
+                return False
+
+        return True
+
+    def setIteration(self, iteration):
+        """ Starts watching a new iteration, forgetting all realizations. """
+        with self._lock:
+            self._iteration = iteration
+            self._watched = {}
+            self._finished = set()
+            self._stamps = {}
+
+    def isKnown(self, iens):
+        """ True if the realization is watched or has finished. @rtype: bool """
+        with self._lock:
+            return iens in self._watched or iens in self._finished
+
+    def watch(self, iens, runpath):
+        with self._lock:
+            if iens in self._finished or self._watched.get(iens) == runpath:
+                return
+
+            self._watched[iens] = runpath
+            self._stamps.pop(iens, None)
+
+    def watchedCount(self):
+        """ @rtype: int """
+        with self._lock:
+            return len(self._watched)
+
+    def poll(self):
+        """
+        Parses the status files that have changed since the last poll and
+        passes the result to the callback.
+        @rtype: int the number of realizations with new status
+        """
+        with self._poll_lock:
+            if self._poll_callback is not None:
+                self._poll_callback()
+
+            with self._lock:
+                iteration = self._iteration
+                watched = list(self._watched.items())
+                stamps = dict(self._stamps)
+
+            changed = []
+            for iens, runpath in watched:
+                stamp = self._statusFileStamp(runpath)
+                self._stat_count += 1
+
+                if stamp is not None and stamp != stamps.get(iens):
+                    changed.append((iens, runpath, stamp))
+
+            if len(changed) == 0:
+                return 0
+
+            loaded = self._loadChanged(changed)
+
+            deltas = {}
+            with self._lock:
+                if iteration != self._iteration:
+                    return 0
+
+                for (iens, runpath, stamp), status in zip(changed, loaded):
+                    if status is None or self._watched.get(iens) != runpath:
+                        continue
+
+                    self._stamps[iens] = stamp
+                    deltas[iens] = status.jobs
+
+                    if ForwardModelStatusWatcher.isFinished(status.jobs):
+                        del self._watched[iens]
+                        self._finished.add(iens)
+
+            if len(deltas) > 0:
+                self._callback(iteration, deltas)
+
+            return len(deltas)
+
+    def _statusFileStamp(self, runpath):
+        try:
+            stat = os.stat(os.path.join(runpath, ForwardModelStatusWatcher.STATUS_FILE))
+        except OSError:
+            return None
+
+        return stat.st_mtime, stat.st_size, stat.st_ino
+
+    def _loadChanged(self, changed):
+        self._load_count += len(changed)
+        runpaths = [runpath for iens, runpath, stamp in changed]
+        pool = self._pool
+
+        if pool is None or len(runpaths) <= 1:
+            return [self._loadStatus(runpath) for runpath in runpaths]
+
+        return pool.map(self._loadStatus, runpaths)
+
+    def _loadStatus(self, runpath):
+        try:
+            return self._load_status(runpath)
+        except (IOError, OSError, ValueError):
+            # The status file can be partially written, the next change is picked up by a later poll.
+            return None
+
+    def isRunning(self):
+        """ @rtype: bool """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """ Polls in a background thread until stop() is called. Does nothing if already running. """
+        with self._lock:
+            if self.isRunning():
+                return
+
+            self._stop_event.clear()
+
+            if self._thread_count > 1 and self._pool is None:
+                self._pool = ThreadPool(self._thread_count)
+
+            self._thread = Thread(name="ert_gui_forward_model_status_watcher", target=self._run)
+            self._thread.setDaemon(True)
+            self._thread.start()
+
+    def stop(self):
+        """ Stops the background thread and polls once more to pick up the final status. """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+        if thread is not None:
+            self._stop_event.set()
+            thread.join()
+
+        try:
+            self.poll()
+        finally:
+            with self._lock:
+                pool = self._pool
+                self._pool = None
+
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def _run(self):
+        while True:
+            try:
+                self.poll()
+            except Exception as e:
+                exc_type, exc_value, exc_tb = sys.exc_info()
+                sys.stderr.write("%s\n" % ("-" * 80))
+                traceback.print_tb(exc_tb)
+                sys.stderr.write("Exception type: %s\n" % exc_type.__name__)
+                sys.stderr.write("%s\n" % e)
+                sys.stderr.write("%s\n" % ("-" * 80))
+                sys.stderr.write("An error occurred while polling the forward model status.\n")
+
+            if self._stop_event.wait(self._interval):
+                break
@@ -25,7 +25,7 @@ class IteratedEnsembleSmoother(BaseRunModel):
         self.setPhase(run_context.get_iter(), phase_msg, indeterminate=False)
 
         self.setPhaseName("Pre processing...", indeterminate=True)
-        self.ert().getEnkfSimulationRunner().createRunPath( run_context )
+        self.createRunPath(run_context)
         self.ert().getEnkfSimulationRunner().runWorkflows( HookRuntime.PRE_SIMULATION )
 
         self.setPhaseName("Running forecast...", indeterminate=False)
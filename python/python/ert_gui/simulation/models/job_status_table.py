@@ -0,0 +1,194 @@
+import time
+from datetime import datetime
+from threading import RLock
+
+import numpy
+
+from res.job_queue import ForwardModelStatus
+
+
+class JobStatusTable(object):
+    """
+    The forward model status of the realizations in one iteration, stored
+    compactly: the status of each job as an int8 code into a table of
+    status names, the start and end times as int32 seconds since the epoch
+    and the job names in a table shared by all realizations.
+
+    Only the runpath of each realization is kept in addition, so the full
+    job details can be loaded from the status file when needed.
+    """
+    __slots__ = ("iteration", "_lock", "_job_names", "_status_names", "_status_codes",
+                 "_states", "_start_times", "_end_times", "_versions", "_runpaths")
+
+    NO_STATUS = 0
+    SUCCESS = "Success"
+
+    def __init__(self, iteration):
+        super(JobStatusTable, self).__init__()
+        self.iteration = iteration
+        self._lock = RLock()
+        self._job_names = []
+        self._status_names = []
+        self._status_codes = {}
+        self._states = numpy.zeros((0, 0), dtype=numpy.int8)
+        self._start_times = numpy.zeros((0, 0), dtype=numpy.int32)
+        self._end_times = numpy.zeros((0, 0), dtype=numpy.int32)
+        self._versions = numpy.zeros(0, dtype=numpy.int32)
+        self._runpaths = {}
+
+    def __len__(self):
+        return len(self.realizations())
+
+    def __contains__(self, iens):
+        with self._lock:
+            return 0 <= iens < len(self._versions) and self._versions[iens] > 0
+
+    @staticmethod
+    def _timestamp(value):
+        if value is None:
+            return 0
+
+        if isinstance(value, datetime):
+            return int(time.mktime(value.timetuple()))
+
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
+
+    def _statusCode(self, status):
+        code = self._status_codes.get(status)
+
+        if code is None:
+            self._status_names.append(status)
+            code = len(self._status_names)
+            self._status_codes[status] = code
+
+        return code
+
+    def _resize(self, realization_count, job_count):
+        old_realizations, old_jobs = self._states.shape
+        realization_count = max(realization_count, old_realizations)
+        job_count = max(job_count, old_jobs)
+
+        if (realization_count, job_count) == (old_realizations, old_jobs):
+            return
+
+        def resized(array):
+            result = numpy.zeros((realization_count, job_count), dtype=array.dtype)
+            result[:old_realizations, :old_jobs] = array
+            return result
+
+        self._states = resized(self._states)
+        self._start_times = resized(self._start_times)
+        self._end_times = resized(self._end_times)
+
+        versions = numpy.zeros(realization_count, dtype=numpy.int32)
+        versions[:old_realizations] = self._versions
+        self._versions = versions
+
+    def setRunpath(self, iens, runpath):
+        with self._lock:
+            self._runpaths[iens] = runpath
+
+    def runpath(self, iens):
+        """ @rtype: str or None """
+        return self._runpaths.get(iens)
+
+    def update(self, iens, jobs):
+        """
+        Stores the status of the jobs of a realization.
+        @type jobs: list of ForwardModelJobStatus
+        """
+        with self._lock:
+            if len(self._job_names) < len(jobs):
+                self._job_names.extend(job.name for job in jobs[len(self._job_names):])
+
+            self._resize(iens + 1, len(jobs))
+            job_count = len(jobs)
+            self._states[iens, :job_count] = [self._statusCode(job.status) for job in jobs]
+            self._states[iens, job_count:] = JobStatusTable.NO_STATUS
+            self._start_times[iens, :job_count] = [self._timestamp(getattr(job, "start_time", None)) for job in jobs]
+            self._end_times[iens, :job_count] = [self._timestamp(getattr(job, "end_time", None)) for job in jobs]
+            self._versions[iens] += 1
+
+    def realizations(self):
+        """ The realizations with status, in increasing order. @rtype: numpy.ndarray """
+        with self._lock:
+            return numpy.flatnonzero(self._versions)
+
+    def jobNames(self):
+        """ @rtype: list of str """
+        with self._lock:
+            return list(self._job_names)
+
+    def statusNames(self):
+        """ The status names, status code n is the name at index n - 1. @rtype: list of str """
+        with self._lock:
+            return list(self._status_names)
+
+    def jobCount(self):
+        """ @rtype: int """
+        with self._lock:
+            return self._states.shape[1]
+
+    def snapshot(self):
+        """
+        Copies of the status names, the (realization x job) status codes and
+        the version of every realization, read together so they are
+        consistent with each other.
+        @rtype: (list of str, numpy.ndarray, numpy.ndarray)
+        """
+        with self._lock:
+            return list(self._status_names), self._states.copy(), self._versions.copy()
+
+    def version(self, iens):
+        """ Incremented every time the status of the realization is updated. @rtype: int """
+        with self._lock:
+            if 0 <= iens < len(self._versions):
+                return int(self._versions[iens])
+
+            return 0
+
+    def statusCodes(self):
+        """ A copy of the (realization x job) status codes. @rtype: numpy.ndarray """
+        with self._lock:
+            return self._states.copy()
+
+    def startTimes(self, iens):
+        """ @rtype: numpy.ndarray """
+        with self._lock:
+            return self._start_times[iens].copy()
+
+    def endTimes(self, iens):
+        """ @rtype: numpy.ndarray """
+        with self._lock:
+            return self._end_times[iens].copy()
+
+    def isFinished(self, iens):
+        """ True if every job of the realization has succeeded. @rtype: bool """
+        with self._lock:
+            if not iens in self:
+                return False
+
+            success = self._status_codes.get(JobStatusTable.SUCCESS)
+            states = self._states[iens]
+            states = states[states != JobStatusTable.NO_STATUS]
+            return success is not None and bool(numpy.all(states == success))
+
+    def loadJobs(self, iens):
+        """
+        Loads the full job details of the realization from its status file.
+        @rtype: list of ForwardModelJobStatus
+        """
+        runpath = self.runpath(iens)
+
+        if runpath is None:
+            return []
+
+        status = ForwardModelStatus.load(runpath, num_retry=1)
+
+        if not status:
+            return []
+
+        return status.jobs
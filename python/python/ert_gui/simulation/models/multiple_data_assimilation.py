@@ -105,7 +105,7 @@ class MultipleDataAssimilation(BaseRunModel):
 
         phase_string = "Running simulation for iteration: %d" % iteration
         self.setPhaseName(phase_string, indeterminate=True)
-        self.ert().getEnkfSimulationRunner().createRunPath(run_context)
+        self.createRunPath(run_context)
 
         phase_string = "Pre processing for iteration: %d" % iteration
         self.setPhaseName(phase_string)
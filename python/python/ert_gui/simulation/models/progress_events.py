@@ -0,0 +1,110 @@
+import time
+
+try:
+    from Queue import Queue, Empty
+except ImportError:
+    from queue import Queue, Empty
+
+
+class ProgressEvent(object):
+    """ Base class of the events published by the run models while simulating. """
+
+    def __init__(self):
+        super(ProgressEvent, self).__init__()
+        self.time = time.time()
+
+
+class PhaseChangedEvent(ProgressEvent):
+    """ The phase, the phase name or the indeterminate flag of the run has changed. """
+
+    def __init__(self, phase, phase_count, phase_name, indeterminate):
+        super(PhaseChangedEvent, self).__init__()
+        self.phase = phase
+        self.phase_count = phase_count
+        self.phase_name = phase_name
+        self.indeterminate = indeterminate
+
+    def isFinished(self):
+        """ @rtype: bool """
+        return self.phase == self.phase_count
+
+
+class RealizationStatusChangedEvent(ProgressEvent):
+    """ The queue status of one or more realizations has changed. """
+
+    def __init__(self, queue_status_snapshot, queue_size):
+        """
+        @type queue_status_snapshot: ert_gui.simulation.models.QueueStatusSnapshot
+        @type queue_size: int
+        """
+        super(RealizationStatusChangedEvent, self).__init__()
+        self.queue_status_snapshot = queue_status_snapshot
+        self.queue_size = queue_size
+
+
+class JobStatusChangedEvent(ProgressEvent):
+    """ The forward model status of one or more realizations has changed. """
+
+    def __init__(self, iteration, realizations):
+        """ @type realizations: list of int """
+        super(JobStatusChangedEvent, self).__init__()
+        self.iteration = iteration
+        self.realizations = realizations
+
+
+class RunFailedEvent(ProgressEvent):
+    """ The run has stopped because of an error. """
+
+    def __init__(self, message):
+        super(RunFailedEvent, self).__init__()
+        self.message = message
+
+
+class SimulationsEndedEvent(ProgressEvent):
+    """ The simulation thread is done, the run has either finished or failed. """
+
+    def __init__(self, failed):
+        super(SimulationsEndedEvent, self).__init__()
+        self.failed = failed
+
+
+class ProgressEventQueue(object):
+    """
+    A thread safe queue of ProgressEvents. The simulation thread publishes
+    events, and a consumer (e.g. the run dialog) takes all pending events
+    in one batch.
+    """
+
+    def __init__(self):
+        super(ProgressEventQueue, self).__init__()
+        self._queue = Queue()
+
+    def publish(self, event):
+        """ @type event: ProgressEvent """
+        self._queue.put(event)
+
+    def takeEvents(self, max_count=None):
+        """
+        Returns the pending events in the order they were published, without waiting.
+        @rtype: list of ProgressEvent
+        """
+        events = []
+        while max_count is None or len(events) < max_count:
+            try:
+                events.append(self._queue.get_nowait())
+            except Empty:
+                break
+
+        return events
+
+    def waitForEvents(self, timeout):
+        """
+        Waits up to timeout seconds for at least one event, then returns all pending events.
+        @rtype: list of ProgressEvent
+        """
+        try:
+            first = self._queue.get(timeout=timeout)
+        except Empty:
+            return []
+
+        return [first] + self.takeEvents()
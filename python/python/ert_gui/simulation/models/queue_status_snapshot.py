@@ -0,0 +1,82 @@
+import numpy
+
+from res.job_queue import JobStatusType
+
+
+class QueueStatusSnapshot(object):
+    """
+    The status of every job in the queue at one point in time, stored as an
+    array of JobStatusType values. The statuses are read from the queue once
+    and the snapshot is shared by everything showing the progress of the
+    same update.
+    """
+
+    def __init__(self, statuses, queue_size=None):
+        """
+        @type statuses: numpy.ndarray or list of int JobStatusType values
+        @type queue_size: int or None the number of jobs, defaults to the number of statuses
+        """
+        super(QueueStatusSnapshot, self).__init__()
+        self._statuses = numpy.asarray(statuses, dtype=numpy.int32)
+
+        if queue_size is None:
+            queue_size = len(self._statuses)
+
+        self._queue_size = queue_size
+
+    @classmethod
+    def fromQueue(cls, job_queue):
+        """
+        Reads the status of all jobs from the queue. The snapshot is empty if
+        the queue is not running.
+        @type job_queue: res.job_queue.JobQueue
+        @rtype: QueueStatusSnapshot
+        """
+        queue_size = len(job_queue)
+
+        if not job_queue.isRunning():
+            return cls(numpy.zeros(0, dtype=numpy.int32), queue_size)
+
+        statuses = numpy.empty(queue_size, dtype=numpy.int32)
+        for job_number in range(queue_size):
+            statuses[job_number] = int(job_queue.getJobStatus(job_number))
+
+        return cls(statuses, queue_size)
+
+    @property
+    def statuses(self):
+        """ @rtype: numpy.ndarray """
+        return self._statuses
+
+    @property
+    def queue_size(self):
+        """ @rtype: int """
+        return self._queue_size
+
+    def count(self, state_flag):
+        """
+        The number of jobs with a status included in the flag, e.g.
+        JOB_QUEUE_DONE | JOB_QUEUE_SUCCESS.
+        @type state_flag: JobStatusType
+        @rtype: int
+        """
+        return int(numpy.count_nonzero(self._statuses & int(state_flag)))
+
+    def countStates(self, state_flags):
+        """
+        The count for each flag, e.g. for the states of a SimulationsTracker.
+        @type state_flags: list of JobStatusType
+        @rtype: list of int
+        """
+        masks = numpy.array([int(state_flag) for state_flag in state_flags], dtype=numpy.int32)
+
+        if len(masks) == 0:
+            return []
+
+        return [int(count) for count in numpy.count_nonzero(self._statuses[numpy.newaxis, :] & masks[:, numpy.newaxis], axis=1)]
+
+    def statusCounts(self):
+        """ @rtype: dict of (JobStatusType, int) """
+        values, counts = numpy.unique(self._statuses, return_counts=True)
+        statuses_by_value = {int(status): status for status in JobStatusType.enums()}
+        return {statuses_by_value[int(value)]: int(count) for value, count in zip(values, counts)}
@@ -0,0 +1,135 @@
+import numpy
+
+try:
+  from PyQt4.QtCore import QAbstractListModel, QModelIndex, Qt, QVariant
+except ImportError:
+  from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QVariant
+
+
+class RealizationListModel(QAbstractListModel):
+    """
+    Lists the realizations of a run with a check mark for the successful
+    ones. Failed realizations are the ones active in the last run that have
+    not been successful. The masks are stored as boolean arrays, and the
+    rows of the current filter as a sorted array of realization numbers, so
+    looking up the realization of a row is constant time.
+
+    Realizations stay successful when a restart of the failed realizations
+    is run, as long as the same model is updated with the new masks.
+    """
+    SHOW_ALL = 0
+    SHOW_FAILED = 1
+    SHOW_SUCCESSFUL = 2
+
+    def __init__(self, parent=None):
+        QAbstractListModel.__init__(self, parent)
+        self.__initial = numpy.zeros(0, dtype=bool)
+        self.__successful = numpy.zeros(0, dtype=bool)
+        self.__realization_count = 0
+        self.__filter = RealizationListModel.SHOW_ALL
+        self.__rows = numpy.zeros(0, dtype=numpy.int64)
+
+    @staticmethod
+    def maskArray(mask, size=None):
+        """
+        Converts a mask (e.g. a BoolVector) to a boolean array, padded with
+        False or truncated to size if given.
+        @rtype: numpy.ndarray
+        """
+        if mask is None:
+            array = numpy.zeros(0, dtype=bool)
+        elif hasattr(mask, "numpy_copy"):
+            array = numpy.asarray(mask.numpy_copy(), dtype=bool)
+        else:
+            array = numpy.fromiter(mask, dtype=bool)
+
+        if size is not None and len(array) != size:
+            resized = numpy.zeros(size, dtype=bool)
+            count = min(size, len(array))
+            resized[:count] = array[:count]
+            array = resized
+
+        return array
+
+    @staticmethod
+    def failedMask(initial_mask, completed_mask):
+        """
+        The realizations that were active in the run but did not complete.
+        @rtype: numpy.ndarray
+        """
+        completed = RealizationListModel.maskArray(completed_mask)
+        initial = RealizationListModel.maskArray(initial_mask, len(completed))
+        return initial & ~completed
+
+    def setMasks(self, initial_mask, completed_mask):
+        """
+        Updates the list with the result of a run. Realizations that were
+        successful in an earlier run remain successful.
+        """
+        completed = self.maskArray(completed_mask)
+        size = max(len(completed), len(self.__successful))
+
+        self.beginResetModel()
+        self.__successful = self.maskArray(self.__successful, size) | self.maskArray(completed, size)
+        self.__initial = self.maskArray(initial_mask, size)
+        self.__realization_count = size
+        self.__updateRows()
+        self.endResetModel()
+
+    def setFilter(self, show):
+        """ @type show: int one of SHOW_ALL, SHOW_FAILED and SHOW_SUCCESSFUL """
+        self.beginResetModel()
+        self.__filter = show
+        self.__updateRows()
+        self.endResetModel()
+
+    def filter(self):
+        """ @rtype: int """
+        return self.__filter
+
+    def __updateRows(self):
+        if self.__filter == RealizationListModel.SHOW_FAILED:
+            self.__rows = numpy.flatnonzero(self.__initial & ~self.__successful)
+        elif self.__filter == RealizationListModel.SHOW_SUCCESSFUL:
+            self.__rows = numpy.flatnonzero(self.__successful)
+        else:
+            self.__rows = numpy.arange(self.__realization_count)
+
+    def isSuccessful(self, realization):
+        """ @rtype: bool """
+        return 0 <= realization < len(self.__successful) and bool(self.__successful[realization])
+
+    def realization(self, row):
+        """ @rtype: int """
+        return int(self.__rows[row])
+
+    def rowForRealization(self, realization):
+        """
+        The row of the realization, or -1 if it is not shown with the current filter.
+        @rtype: int
+        """
+        row = int(numpy.searchsorted(self.__rows, realization))
+
+        if row < len(self.__rows) and self.__rows[row] == realization:
+            return row
+
+        return -1
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return len(self.__rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.__rows):
+            return QVariant()
+
+        realization = int(self.__rows[index.row()])
+
+        if role == Qt.DisplayRole:
+            return str(realization)
+        elif role == Qt.CheckStateRole:
+            return Qt.Checked if self.__successful[realization] else Qt.Unchecked
+
+        return QVariant()
@@ -1,18 +1,22 @@
 from threading import Thread
 import sys
 
+import numpy
+
 try:
     from PyQt4.QtCore import Qt, QTimer, QSize
-    from PyQt4.QtGui import QDialog, QVBoxLayout, QLayout, QMessageBox, QPushButton, QHBoxLayout, QColor, QLabel, QListView, QStandardItemModel, QStandardItem
+    from PyQt4.QtGui import QDialog, QVBoxLayout, QLayout, QMessageBox, QPushButton, QHBoxLayout, QColor, QLabel, QListView, QComboBox
 except ImportError:
     from PyQt5.QtCore import Qt, QTimer, QSize
-    from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLayout, QMessageBox, QPushButton, QHBoxLayout, QLabel,  QListView
-    from PyQt5.QtGui import QColor, QStandardItemModel, QStandardItem
+    from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLayout, QMessageBox, QPushButton, QHBoxLayout, QLabel,  QListView, QComboBox
+    from PyQt5.QtGui import QColor
 
 
 from ert_gui.ertwidgets import resourceMovie, Legend
 from ert_gui.simulation import Progress, SimpleProgress, DetailedProgressDialog
-from ert_gui.simulation.models import BaseRunModel, SimulationsTracker
+from ert_gui.simulation.models import BaseRunModel, SimulationsTracker, QueueStatusSnapshot
+from ert_gui.simulation.models import PhaseChangedEvent, RealizationStatusChangedEvent, JobStatusChangedEvent, SimulationsEndedEvent
+from ert_gui.simulation.realization_list_model import RealizationListModel
 from ert_gui.tools.plot.plot_tool import PlotTool
 
 from ecl.util.util import BoolVector
@@ -83,10 +87,18 @@ class RunDialog(QDialog):
         self.restart_button.setHidden(True)
         self.show_details_button = QPushButton("Details")
 
+        self.realizations_model = RealizationListModel(self)
         self.realizations_view = QListView()
-        self.realizations_view.setModel(QStandardItemModel(self.realizations_view))
+        self.realizations_view.setModel(self.realizations_model)
+        self.realizations_view.setUniformItemSizes(True)
         self.realizations_view.setVisible(False)
 
+        self.__realization_filters = [RealizationListModel.SHOW_ALL, RealizationListModel.SHOW_FAILED, RealizationListModel.SHOW_SUCCESSFUL]
+        self.realizations_filter = QComboBox()
+        self.realizations_filter.addItems(["All realizations", "Failed realizations", "Successful realizations"])
+        self.realizations_filter.currentIndexChanged[int].connect(self.filterRealizations)
+        self.realizations_filter.setVisible(False)
+
         button_layout = QHBoxLayout()
 
         size = 20
@@ -112,6 +124,7 @@ class RunDialog(QDialog):
         layout.addStretch()
         layout.addLayout(button_layout)
 
+        layout.addWidget(self.realizations_filter)
         layout.addWidget(self.realizations_view)
 
         self.setLayout(layout)
@@ -125,9 +138,11 @@ class RunDialog(QDialog):
         self.__update_queued = False
         self.__simulation_started = False
 
+        self.__queue_status_snapshot = QueueStatusSnapshot([])
+
         self.__update_timer = QTimer(self)
-        self.__update_timer.setInterval(500)
-        self.__update_timer.timeout.connect(self.updateRunStatus)
+        self.__update_timer.setInterval(200)
+        self.__update_timer.timeout.connect(self.processProgressEvents)
         self._simulations_argments = {}
 
     def startSimulation(self, arguments):
@@ -161,10 +176,41 @@ class RunDialog(QDialog):
                 self.reject()
 
 
-    def updateRunStatus(self):
-        self.checkIfRunFinished()
+    def processProgressEvents(self):
+        """ Applies the progress events published by the run model since the last call. """
+        events = self._run_model.progressEvents().takeEvents()
+        self.setRunningTime()
+
+        if len(events) == 0:
+            return
+
+        status_changed = False
+        jobs_changed = False
+        ended = False
+
+        for event in events:
+            if isinstance(event, RealizationStatusChangedEvent):
+                self.__queue_status_snapshot = event.queue_status_snapshot
+                status_changed = True
+            elif isinstance(event, PhaseChangedEvent):
+                status_changed = True
+            elif isinstance(event, JobStatusChangedEvent):
+                jobs_changed = True
+            elif isinstance(event, SimulationsEndedEvent):
+                ended = True
+
+        if status_changed or jobs_changed:
+            self.updateRunStatus(self.__queue_status_snapshot, update_detailed_progress=jobs_changed)
+
+        if ended:
+            self.checkIfRunFinished()
+
 
-        self.total_progress.setProgress(self._run_model.getProgress())
+    def updateRunStatus(self, queue_status_snapshot=None, update_detailed_progress=True):
+        if queue_status_snapshot is None:
+            queue_status_snapshot = self._run_model.getQueueStatusSnapshot()
+
+        self.total_progress.setProgress(self._run_model.getProgress(queue_status_snapshot))
 
         self.__status_label.setText(self._run_model.getPhaseName())
 
@@ -177,27 +223,20 @@ class RunDialog(QDialog):
                 self.legends[state].updateLegend(state.name, 0, 0)
 
         else:
-            if self.detailed_progress:
+            if self.detailed_progress and update_detailed_progress:
                 self.detailed_progress.set_progress(*self._run_model.getDetailedProgress())
 
             self.progress.setIndeterminate(False)
             total_count = self._run_model.getQueueSize()
-            queue_status = self._run_model.getQueueStatus()
+            state_counts = queue_status_snapshot.countStates([state.state for state in states])
 
-            for state in states:
-                state.count = 0
+            for state, count in zip(states, state_counts):
+                state.count = count
                 state.total_count = total_count
 
-            for state in states:
-                for queue_state in queue_status:
-                    if queue_state in state.state:
-                        state.count += queue_status[queue_state]
-
                 self.progress.updateState(state.state, 100.0 * state.count / state.total_count)
                 self.legends[state].updateLegend(state.name, state.count, state.total_count)
 
-        self.setRunningTime()
-
 
     def setRunningTime(self):
         days = 0
@@ -223,6 +262,10 @@ class RunDialog(QDialog):
         else:
             self.running_time.setText("Running time: %d seconds" % seconds)
 
+        runpath_creation_times = self._run_model.getRunpathCreationTimes()
+        tool_tip = "\n".join("Created the runpaths for iteration %d in %.1f seconds" % (iteration, creation_time) for iteration, creation_time in sorted(runpath_creation_times.items()))
+        self.running_time.setToolTip(tool_tip)
+
 
     def killJobs(self):
         kill_job = QMessageBox.question(self, "Kill simulations?", "Are you sure you want to kill the currently running simulations?", QMessageBox.Yes | QMessageBox.No )
@@ -238,6 +281,7 @@ class RunDialog(QDialog):
         self.kill_button.setHidden(True)
         self.done_button.setHidden(False)
         self.realizations_view.setVisible(True)
+        self.realizations_filter.setVisible(True)
         self.restart_button.setVisible(self.has_failed_realizations() )
         self.restart_button.setEnabled(self._run_model.support_restart)
 
@@ -245,10 +289,7 @@ class RunDialog(QDialog):
     def has_failed_realizations(self):
         completed = self._run_model.completed_realizations_mask
         initial = self._run_model.initial_realizations_mask
-        for (index, successful) in enumerate(completed):
-            if initial[index] and not successful:
-                return True
-        return False
+        return bool(RealizationListModel.failedMask(initial, completed).any())
 
 
     def count_successful_realizations(self):
@@ -266,9 +307,11 @@ class RunDialog(QDialog):
         """
         completed = self._run_model.completed_realizations_mask
         initial = self._run_model.initial_realizations_mask
-        inverted_mask = BoolVector(  default_value = False )
-        for (index, successful) in enumerate(completed):
-            inverted_mask[index] = initial[index] and not successful
+        failed = RealizationListModel.failedMask(initial, completed)
+
+        inverted_mask = BoolVector(default_value=False, initial_size=len(failed))
+        for index in numpy.flatnonzero(failed):
+            inverted_mask[int(index)] = True
         return inverted_mask
 
 
@@ -289,14 +332,11 @@ class RunDialog(QDialog):
 
     def update_realizations_view(self):
         completed = self._run_model.completed_realizations_mask
-        for (index, successful) in enumerate(completed):
-            items = self.realizations_view.model().findItems(str(index))
-            if not items:
-                item = QStandardItem(str(index))
-                self.realizations_view.model().appendRow(item)
-            else:
-                item = items[0]
-            item.setCheckState(successful or item.checkState())
+        initial = self._run_model.initial_realizations_mask
+        self.realizations_model.setMasks(initial, completed)
+
+    def filterRealizations(self, index):
+        self.realizations_model.setFilter(self.__realization_filters[index])
 
     def show_detailed_progress(self):
         if not self.detailed_progress:
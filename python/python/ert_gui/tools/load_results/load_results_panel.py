@@ -20,6 +20,8 @@ try:
 except ImportError:
   from PyQt5.QtWidgets import QWidget, QFormLayout, QComboBox, QTextEdit
 
+from ert_gui import ERT
+from ert_gui.ertnotifier import ErtNotifier
 from ert_gui.ertwidgets.models.activerealizationsmodel import ActiveRealizationsModel
 from ert_gui.ertwidgets.models.all_cases_model import AllCasesModel
 from ert_gui.ertwidgets.models.ertmodel import getCurrentCaseName
@@ -95,6 +97,7 @@ class LoadResultsPanel(QWidget):
             print('Expected a (whole) number in iteration field, got "%s". Error message: %s.'  % (iteration, e))
             return False
         loaded = LoadResultsModel.loadResults(selected_case, realizations, iteration)
+        ERT.emitErtChange(ErtNotifier.CASE_DATA, selected_case)
         if loaded > 0:
             print('Successfully loaded %d realisations.' % loaded)
         else:
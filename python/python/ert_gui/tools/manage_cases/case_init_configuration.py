@@ -191,12 +191,16 @@ class CaseInitializationConfigurationPanel(QTabWidget):
         case_widget.setLayout(layout)
 
         case_selector.currentIndexChanged[str].connect(self._showInfoForCase)
-        ERT.ertChanged.connect(self._showInfoForCase)
+        ERT.currentCaseChanged.connect(self._showInfoForCase)
+        ERT.caseDataChanged.connect(self._caseDataChanged)
 
         self.addTab(case_widget, "Case Info")
 
         self._showInfoForCase()
 
+    def _caseDataChanged(self, case_name):
+        self._showInfoForCase()
+
     def _showInfoForCase(self, case_name=None):
         if case_name is None:
             case_name = getCurrentCaseName()
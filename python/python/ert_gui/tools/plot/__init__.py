@@ -1,4 +1,6 @@
 from .plot_widget import PlotWidget
+from .plot_data_loader import PlotDataLoader, PlotDataLoadTask
+from .plot_data_prefetcher import PlotDataPrefetcher
 
 from .filter_popup import FilterPopup
 
@@ -1,5 +1,7 @@
 import sys
 
+import numpy
+
 try:
   from PyQt4.QtCore import QAbstractItemModel, QModelIndex, Qt, QVariant
   from PyQt4.QtGui import QColor
@@ -7,7 +9,9 @@ except ImportError:
   from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt, QVariant
   from PyQt5.QtGui import QColor
 
+from ert_gui import ERT
 from ert_gui.ertwidgets import resourceIcon
+from ert_gui.plottery import KeySearchIndex, PlotDataGatherer
 
 
 class DataTypeKeysListModel(QAbstractItemModel):
@@ -15,6 +19,12 @@ class DataTypeKeysListModel(QAbstractItemModel):
     HAS_OBSERVATIONS = QColor(237, 218, 116)
     GROUP_ITEM = QColor(64, 64, 64)
 
+    SUMMARY_KEY = 1
+    GEN_KW_KEY = 2
+    GEN_DATA_KEY = 4
+    CUSTOM_KW_KEY = 8
+    KEY_WITH_OBSERVATIONS = 16
+
     def __init__(self, ert):
         """
         @type ert: res.enkf.EnKFMain
@@ -23,9 +33,96 @@ class DataTypeKeysListModel(QAbstractItemModel):
         self.__ert = ert
         self.__icon = resourceIcon("ide/small/bullet_star")
 
+        self.__keys = []
+        self.__flags = numpy.zeros(0, dtype=numpy.uint8)
+        self.__rows = {}
+        self.__search_index = KeySearchIndex([])
+        self.__setKeys(*self.__readKeys())
+
+        ERT.configChanged.connect(self.refresh)
+        ERT.caseDataChanged.connect(self._caseDataChanged)
+
     def keyManager(self):
         return self.__ert.getKeyManager()
 
+    def _caseDataChanged(self, case_name):
+        self.refresh()
+
+    def disconnectNotifier(self):
+        """ Stops following the changes of the configuration and the case data. """
+        ERT.configChanged.disconnect(self.refresh)
+        ERT.caseDataChanged.disconnect(self._caseDataChanged)
+
+    def refresh(self):
+        """
+        Reads the keys from the key manager. The model is only reset when the
+        list of keys has changed, otherwise only the changed flags are
+        updated so views keep their selection.
+        """
+        keys, flags = self.__readKeys()
+
+        if keys == self.__keys:
+            changed_rows = numpy.flatnonzero(flags != self.__flags)
+            self.__flags = flags
+
+            if len(changed_rows) > 0:
+                self.dataChanged.emit(self.index(int(changed_rows[0]), 0), self.index(int(changed_rows[-1]), 0))
+            return
+
+        ERT.countRepopulate("DataTypeKeysListModel")
+        self.beginResetModel()
+        self.__setKeys(keys, flags)
+        self.endResetModel()
+
+    def __readKeys(self):
+        with PlotDataGatherer.STORAGE_LOCK:
+            return self.__readKeysLocked()
+
+    def __readKeysLocked(self):
+        key_manager = self.keyManager()
+        keys = list(key_manager.allDataTypeKeys())
+
+        summary_keys = set(key_manager.summaryKeys())
+        summary_keys_with_observations = set(key_manager.summaryKeysWithObservations())
+        gen_kw_keys = set(key_manager.genKwKeys())
+        gen_data_keys = set(key_manager.genDataKeys())
+        custom_kw_keys = set(key_manager.customKwKeys())
+
+        flags = numpy.zeros(len(keys), dtype=numpy.uint8)
+
+        for row, key in enumerate(keys):
+            if key in summary_keys:
+                flag = self.SUMMARY_KEY
+
+                if key in summary_keys_with_observations:
+                    flag |= self.KEY_WITH_OBSERVATIONS
+            else:
+                flag = 0
+
+                if key in gen_kw_keys:
+                    flag |= self.GEN_KW_KEY
+                elif key in gen_data_keys:
+                    flag |= self.GEN_DATA_KEY
+                elif key in custom_kw_keys:
+                    flag |= self.CUSTOM_KW_KEY
+
+                if key_manager.isKeyWithObservations(key):
+                    flag |= self.KEY_WITH_OBSERVATIONS
+
+            flags[row] = flag
+
+        return keys, flags
+
+    def __setKeys(self, keys, flags):
+        self.__keys = keys
+        self.__flags = flags
+        self.__rows = {key: row for row, key in enumerate(keys)}
+        self.__search_index = KeySearchIndex(keys)
+
+    def searchIndex(self):
+        """ @rtype: KeySearchIndex """
+        return self.__search_index
+
     def index(self, row, column, parent=None, *args, **kwargs):
         return self.createIndex(row, column, parent)
 
@@ -33,7 +130,7 @@ class DataTypeKeysListModel(QAbstractItemModel):
         return QModelIndex()
 
     def rowCount(self, parent=None, *args, **kwargs):
-        return len(self.keyManager().allDataTypeKeys())
+        return len(self.__keys)
 
     def columnCount(self, QModelIndex_parent=None, *args, **kwargs):
         return 1
@@ -42,14 +139,12 @@ class DataTypeKeysListModel(QAbstractItemModel):
         assert isinstance(index, QModelIndex)
 
         if index.isValid():
-            items = self.keyManager().allDataTypeKeys()
             row = index.row()
-            item = items[row]
 
             if role == Qt.DisplayRole:
-                return item
+                return self.__keys[row]
             elif role == Qt.BackgroundRole:
-                if self.keyManager().isKeyWithObservations(item):
+                if self.__flags[row] & self.KEY_WITH_OBSERVATIONS:
                     return self.HAS_OBSERVATIONS
 
         return QVariant()
@@ -59,25 +154,44 @@ class DataTypeKeysListModel(QAbstractItemModel):
 
         if index.isValid():
             row = index.row()
-            return self.keyManager().allDataTypeKeys()[row]
+            return self.__keys[row]
 
         return None
 
+    def rowFlags(self, row):
+        """ @rtype: int """
+        return int(self.__flags[row])
+
+    def rowOfKey(self, key):
+        """ The row of the key, or -1 if the key is not in the model. @rtype: int """
+        return self.__rows.get(key, -1)
+
+    def keyFlags(self, key):
+        """ @rtype: int """
+        row = self.__rows.get(key)
+
+        if row is None:
+            return 0
+
+        return int(self.__flags[row])
 
     def isSummaryKey(self, key):
-        return self.keyManager().isSummaryKey(key)
+        return bool(self.keyFlags(key) & self.SUMMARY_KEY)
 
     def isBlockKey(self, key):
         return False
 
     def isGenKWKey(self, key):
-        return self.keyManager().isGenKwKey(key)
+        return bool(self.keyFlags(key) & self.GEN_KW_KEY)
 
     def isGenDataKey(self, key):
-        return self.keyManager().isGenDataKey(key)
+        return bool(self.keyFlags(key) & self.GEN_DATA_KEY)
 
     def isCustomKwKey(self, key):
-        return self.keyManager().isCustomKwKey(key)
+        return bool(self.keyFlags(key) & self.CUSTOM_KW_KEY)
+
+    def isKeyWithObservations(self, key):
+        return bool(self.keyFlags(key) & self.KEY_WITH_OBSERVATIONS)
 
     def isCustomPcaKey(self, key):
         return False
@@ -41,6 +41,10 @@ class DataTypeKeysWidget(QWidget):
         self.data_type_keys_widget.setModel(self.filter_model)
         self.data_type_keys_widget.selectionModel().selectionChanged.connect(self.itemSelected)
 
+        self.__key_before_reset = None
+        self.model.modelAboutToBeReset.connect(self.__storeSelectedKey)
+        self.model.modelReset.connect(self.__restoreSelectedKey)
+
         layout.addSpacing(15)
         layout.addWidget(self.data_type_keys_widget, 2)
         layout.addStretch()
@@ -72,12 +76,51 @@ class DataTypeKeysWidget(QWidget):
         item = self.model.itemAt(source_index)
         return item
 
+    def __storeSelectedKey(self):
+        self.__key_before_reset = self.getSelectedItem()
+
+    def __restoreSelectedKey(self):
+        key = self.__key_before_reset
+        self.__key_before_reset = None
+
+        if key is None:
+            return
+
+        row = self.model.rowOfKey(key)
+
+        if row >= 0:
+            index = self.filter_model.mapFromSource(self.model.index(row, 0))
+
+            if index.isValid():
+                self.data_type_keys_widget.setCurrentIndex(index)
+
+    def getNeighbourItems(self, count):
+        """
+        Returns up to count visible items after and before the selected item,
+        ordered by distance with the following item first.
+        @rtype: list of str
+        """
+        row = self.data_type_keys_widget.currentIndex().row()
+        row_count = self.filter_model.rowCount()
+        items = []
+
+        if row < 0:
+            return items
+
+        for distance in range(1, count + 1):
+            for neighbour_row in (row + distance, row - distance):
+                if 0 <= neighbour_row < row_count:
+                    source_index = self.filter_model.mapToSource(self.filter_model.index(neighbour_row, 0))
+                    items.append(self.model.itemAt(source_index))
+
+        return items
+
     def selectDefault(self):
         self.data_type_keys_widget.setCurrentIndex(self.filter_model.index(0, 0))
 
 
     def setSearchString(self, filter):
-        self.filter_model.setFilterFixedString(filter)
+        self.filter_model.setSearchString(filter)
 
     def showFilterPopup(self):
         self.__filter_popup.show()
@@ -36,63 +36,92 @@ class DataTypeProxyModel(QSortFilterProxyModel):
         self.__show_custom_kw_keys = True
         self.__show_custom_pca_keys = True
 
-        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.__hidden_flags = 0
+        self.__search_string = ""
+        self.__search_mask = None
+        self.__search_mask_stale = False
+
         self.setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.__invalidateSearchMask)
 
     def filterAcceptsRow(self, index, q_model_index):
-        show = QSortFilterProxyModel.filterAcceptsRow(self, index, q_model_index)
+        search_mask = self.__searchMask()
+
+        if search_mask is not None and (index >= len(search_mask) or not search_mask[index]):
+            return False
+
+        if self.__hidden_flags & self.sourceModel().rowFlags(index):
+            return False
 
-        if show:
-            source_model = self.sourceModel()
-            source_index = source_model.index(index, 0, q_model_index)
-            key = source_model.itemAt(source_index)
+        return True
 
-            if not self.__show_summary_keys and source_model.isSummaryKey(key):
-                show = False
+    def sourceModel(self):
+        """ @rtype: DataTypeKeysListModel """
+        return QSortFilterProxyModel.sourceModel(self)
 
-            elif not self.__show_block_keys and source_model.isBlockKey(key):
-                show = False
+    def setSearchString(self, search_string):
+        """
+        Shows only the keys matching the search string. Wildcards (* and ?)
+        match the whole key, otherwise any key containing the string is shown.
+        """
+        self.__search_string = str(search_string)
+        self.__search_mask_stale = True
+        self.invalidateFilter()
 
-            elif not self.__show_gen_kw_keys and source_model.isGenKWKey(key):
-                show = False
+    def __invalidateSearchMask(self):
+        # The keys of the source model are replaced during the reset, the mask is rebuilt when the proxy filters again.
+        self.__search_mask_stale = True
 
-            elif not self.__show_gen_data_keys and source_model.isGenDataKey(key):
-                show = False
+    def __searchMask(self):
+        if self.__search_mask_stale:
+            if len(self.__search_string) == 0:
+                self.__search_mask = None
+            else:
+                self.__search_mask = self.sourceModel().searchIndex().searchMask(self.__search_string)
 
-            elif not self.__show_custom_kw_keys and source_model.isCustomKwKey(key):
-                show = False
+            self.__search_mask_stale = False
 
-            elif not self.__show_custom_pca_keys and source_model.isCustomPcaKey(key):
-                show = False
+        return self.__search_mask
 
+    def __updateHiddenFlags(self):
+        hidden_flags = 0
 
-        return show
+        if not self.__show_summary_keys:
+            hidden_flags |= DataTypeKeysListModel.SUMMARY_KEY
 
-    def sourceModel(self):
-        """ @rtype: DataTypeKeysListModel """
-        return QSortFilterProxyModel.sourceModel(self)
+        if not self.__show_gen_kw_keys:
+            hidden_flags |= DataTypeKeysListModel.GEN_KW_KEY
+
+        if not self.__show_gen_data_keys:
+            hidden_flags |= DataTypeKeysListModel.GEN_DATA_KEY
+
+        if not self.__show_custom_kw_keys:
+            hidden_flags |= DataTypeKeysListModel.CUSTOM_KW_KEY
+
+        self.__hidden_flags = hidden_flags
+        self.invalidateFilter()
 
     def setShowSummaryKeys(self, visible):
         self.__show_summary_keys = visible
-        self.invalidateFilter()
+        self.__updateHiddenFlags()
 
     def setShowBlockKeys(self, visible):
         self.__show_block_keys = visible
-        self.invalidateFilter()
+        self.__updateHiddenFlags()
 
     def setShowGenKWKeys(self, visible):
         self.__show_gen_kw_keys = visible
-        self.invalidateFilter()
+        self.__updateHiddenFlags()
 
     def setShowGenDataKeys(self, visible):
         self.__show_gen_data_keys = visible
-        self.invalidateFilter()
+        self.__updateHiddenFlags()
 
     def setShowCustomKwKeys(self, visible):
         self.__show_custom_kw_keys = visible
-        self.invalidateFilter()
+        self.__updateHiddenFlags()
 
     def setShowCustomPcaKeys(self, visible):
         self.__show_custom_pca_keys = visible
-        self.invalidateFilter()
+        self.__updateHiddenFlags()
 
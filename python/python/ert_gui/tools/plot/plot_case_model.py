@@ -7,6 +7,7 @@ except ImportError:
 
 
 from ert_gui.ertwidgets.models.ertmodel import getAllCasesNotRunning
+from ert_gui.plottery import PlotDataGatherer
 
 
 class PlotCaseModel(QAbstractItemModel):
@@ -54,7 +55,8 @@ class PlotCaseModel(QAbstractItemModel):
 
     def getAllItems(self):
         if self.__data is None:
-            self.__data = getAllCasesNotRunning()
+            with PlotDataGatherer.STORAGE_LOCK:
+                self.__data = getAllCasesNotRunning()
 
         return self.__data
 
@@ -0,0 +1,146 @@
+import sys
+import traceback
+
+try:
+  from PyQt4.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+except ImportError:
+  from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class PlotDataLoadTask(QRunnable):
+    """ Gathers all data needed to plot a key for a list of cases into the plot data cache. """
+
+    def __init__(self, loader, request_id, ert, data_gatherer, cases, key):
+        QRunnable.__init__(self)
+        self._loader = loader
+        self._request_id = request_id
+        self._ert = ert
+        self._data_gatherer = data_gatherer
+        self._cases = list(cases)
+        self._key = key
+        self._cancelled = False
+        self._error = None
+
+    @property
+    def request_id(self):
+        """ @rtype: int """
+        return self._request_id
+
+    def cancel(self):
+        self._cancelled = True
+
+    def isCancelled(self):
+        """ @rtype: bool """
+        return self._cancelled
+
+    def error(self):
+        """ The message of the exception that stopped the task, or None. @rtype: str or None """
+        return self._error
+
+    def gatherFunctions(self):
+        """
+        The data is only gathered into the cache, so the cached values are not copied.
+        @rtype: list of functions
+        """
+        ert = self._ert
+        key = self._key
+        gatherer = self._data_gatherer
+        first_case = self._cases[0] if len(self._cases) > 0 else None
+
+        functions = [lambda case=case: gatherer.gatherData(ert, case, key, copy=False) for case in self._cases]
+
+        if gatherer.hasRefcaseGatherFunction():
+            functions.append(lambda: gatherer.gatherRefcaseData(ert, key, copy=False))
+
+        if gatherer.hasObservationGatherFunction() and first_case is not None:
+            functions.append(lambda: gatherer.gatherObservationData(ert, first_case, key, copy=False))
+
+        if gatherer.hasHistoryGatherFunction():
+            functions.append(lambda: gatherer.gatherHistoryData(ert, first_case, key, copy=False))
+
+        return functions
+
+    def run(self):
+        try:
+            for gather_function in self.gatherFunctions():
+                if self.isCancelled():
+                    break
+                gather_function()
+        except Exception as e:
+            exc_type, exc_value, exc_tb = sys.exc_info()
+            sys.stderr.write("%s\n" % ("-" * 80))
+            traceback.print_tb(exc_tb)
+            sys.stderr.write("Exception type: %s\n" % exc_type.__name__)
+            sys.stderr.write("%s\n" % e)
+            sys.stderr.write("%s\n" % ("-" * 80))
+            sys.stderr.write("An error occurred while loading plot data in the background.\n")
+            self._error = str(e)
+        finally:
+            self._loader.taskFinished.emit(self._request_id)
+
+
+class PlotDataLoader(QObject):
+    """
+    Loads plot data on a pool of worker threads. Only the latest request is
+    considered current; starting a new request cancels the previous one, and
+    dataLoaded or dataLoadFailed is only emitted (in the GUI thread) for the
+    current request. dataLoadFailed carries the key and the error message.
+    The storage access of the tasks is serialized by the data gatherers, so
+    only the processing of the loaded data runs in parallel.
+    """
+    DEFAULT_THREAD_COUNT = 2
+
+    dataLoaded = pyqtSignal(str)
+    dataLoadFailed = pyqtSignal(str, str)
+    taskFinished = pyqtSignal(int)
+
+    def __init__(self, parent=None, thread_count=DEFAULT_THREAD_COUNT):
+        QObject.__init__(self, parent)
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(thread_count)
+        self._request_id = 0
+        self._current_task = None
+        """ :type: PlotDataLoadTask """
+        self._current_key = None
+
+        self.taskFinished.connect(self._taskFinished)
+
+    def threadPool(self):
+        """ @rtype: QThreadPool """
+        return self._thread_pool
+
+    def setThreadCount(self, thread_count):
+        self._thread_pool.setMaxThreadCount(thread_count)
+
+    def isLoading(self):
+        """ @rtype: bool """
+        return self._current_task is not None
+
+    def load(self, ert, data_gatherer, cases, key):
+        """ Starts loading in the background; supersedes any previous request. """
+        self.cancel()
+
+        self._request_id += 1
+        self._current_key = key
+
+        if data_gatherer is None:
+            self.dataLoadFailed.emit(key, "Unable to gather data for key: %s" % key)
+            return
+
+        self._current_task = PlotDataLoadTask(self, self._request_id, ert, data_gatherer, cases, key)
+        self._thread_pool.start(self._current_task)
+
+    def cancel(self):
+        if self._current_task is not None:
+            self._current_task.cancel()
+            self._current_task = None
+
+    def _taskFinished(self, request_id):
+        if self._current_task is not None and request_id == self._current_task.request_id:
+            error = self._current_task.error()
+            self._current_task = None
+
+            if error is not None:
+                self.dataLoadFailed.emit(self._current_key, error)
+            else:
+                self.dataLoaded.emit(self._current_key)
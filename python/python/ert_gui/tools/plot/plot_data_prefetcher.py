@@ -0,0 +1,193 @@
+from collections import OrderedDict
+from threading import Lock
+
+try:
+  from PyQt4.QtCore import QObject, pyqtSignal
+except ImportError:
+  from PyQt5.QtCore import QObject, pyqtSignal
+
+from ert_gui.plottery import PlotDataGatherer
+from ert_gui.tools.plot import PlotDataLoadTask
+
+
+class PlotDataPrefetchTask(PlotDataLoadTask):
+    """
+    A load task that gives up as soon as prefetching is no longer allowed,
+    and reports the size of the data it loads into the cache to the
+    prefetcher. Data that was already cached is not counted.
+    """
+
+    def __init__(self, prefetcher, request_id, ert, data_gatherer, cases, key):
+        PlotDataLoadTask.__init__(self, prefetcher, request_id, ert, data_gatherer, cases, key)
+        self._prefetcher = prefetcher
+
+    def isCancelled(self):
+        """ @rtype: bool """
+        return PlotDataLoadTask.isCancelled(self) or not self._prefetcher.isPrefetchAllowed()
+
+    def prefetchFunctions(self):
+        """ @rtype: list of functions """
+        return PlotDataLoadTask.gatherFunctions(self)
+
+    def gatherFunctions(self):
+        """ @rtype: list of functions """
+        cache = self._data_gatherer.cache()
+
+        def counted(gather_function):
+            def gather():
+                loaded_bytes = cache.loadedBytes()
+                data = gather_function()
+
+                if not PlotDataLoadTask.isCancelled(self):
+                    self._prefetcher.addPrefetchedBytes(cache.loadedBytes() - loaded_bytes)
+
+                return data
+            return gather
+
+        return [counted(gather_function) for gather_function in self.prefetchFunctions()]
+
+    def run(self):
+        if not PlotDataLoadTask.isCancelled(self):
+            self._prefetcher.updateSimulationRunning()
+
+        PlotDataLoadTask.run(self)
+
+
+class PlotDataBatchPrefetchTask(PlotDataPrefetchTask):
+    """
+    Prefetches several keys of a data gatherer with a batch gather function,
+    loading all the keys of a case in one storage pass.
+    """
+
+    def __init__(self, prefetcher, request_id, ert, data_gatherer, cases, keys):
+        PlotDataPrefetchTask.__init__(self, prefetcher, request_id, ert, data_gatherer, cases, keys[0])
+        self._keys = list(keys)
+
+    def prefetchFunctions(self):
+        """ @rtype: list of functions """
+        ert = self._ert
+        keys = self._keys
+        gatherer = self._data_gatherer
+        return [lambda case=case: gatherer.gatherDataBatch(ert, [case], keys) for case in self._cases]
+
+
+class PlotDataPrefetcher(QObject):
+    """
+    Speculatively loads the data of the keys surrounding the selected key into
+    the plot data cache. The tasks share the thread pool of the foreground
+    loader, but run with a lower priority.
+
+    The memory budget limits the size of the data loaded by the prefetch
+    tasks of one selection, and no data is prefetched while a simulation is
+    writing to any case. Both are checked again before every task.
+    """
+    DEFAULT_NEIGHBOUR_COUNT = 2
+    DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+    PREFETCH_PRIORITY = -1
+
+    taskFinished = pyqtSignal(int)
+
+    def __init__(self, thread_pool, simulationRunningFunc, neighbour_count=DEFAULT_NEIGHBOUR_COUNT, memory_budget=DEFAULT_MEMORY_BUDGET, parent=None):
+        """
+        @type thread_pool: QThreadPool
+        @type simulationRunningFunc: callable
+        @type neighbour_count: int
+        @type memory_budget: int
+        """
+        QObject.__init__(self, parent)
+
+        self._thread_pool = thread_pool
+        self._simulationRunningFunction = simulationRunningFunc
+        self._neighbour_count = neighbour_count
+        self._memory_budget = memory_budget
+        self._simulation_running = False
+        self._prefetched_bytes = 0
+        self._prefetched_bytes_lock = Lock()
+        self._request_id = 0
+        self._tasks = {}
+        """ :type: dict[int, PlotDataPrefetchTask] """
+
+        self.taskFinished.connect(self._taskFinished)
+
+    def setNeighbourCount(self, neighbour_count):
+        self._neighbour_count = neighbour_count
+
+    def neighbourCount(self):
+        """ @rtype: int """
+        return self._neighbour_count
+
+    def setMemoryBudget(self, memory_budget):
+        """ @type memory_budget: int """
+        self._memory_budget = memory_budget
+
+    def memoryBudget(self):
+        """ @rtype: int """
+        return self._memory_budget
+
+    def prefetchedBytes(self):
+        """ The size of the data loaded by the prefetch tasks of the current selection. @rtype: int """
+        return self._prefetched_bytes
+
+    def addPrefetchedBytes(self, size):
+        """ @type size: int """
+        with self._prefetched_bytes_lock:
+            self._prefetched_bytes += size
+
+    def updateSimulationRunning(self):
+        """ Checks if a simulation is running. Called before every prefetch task. """
+        with PlotDataGatherer.STORAGE_LOCK:
+            self._simulation_running = self._simulationRunningFunction()
+
+    def isPrefetchAllowed(self):
+        """ @rtype: bool """
+        return self._prefetched_bytes < self._memory_budget and not self._simulation_running
+
+    def prefetch(self, ert, keys, cases, dataGathererFunc):
+        """
+        Cancels any outstanding prefetching and queues the keys in order. The
+        keys of a data gatherer with a batch gather function are prefetched
+        together, in the place of the first of them.
+        @type keys: list of str
+        @type cases: list of str
+        @type dataGathererFunc: callable
+        """
+        self.cancel()
+
+        with self._prefetched_bytes_lock:
+            self._prefetched_bytes = 0
+
+        self.updateSimulationRunning()
+
+        if not self.isPrefetchAllowed():
+            return
+
+        groups = OrderedDict()
+        for key in keys:
+            data_gatherer = dataGathererFunc(key)
+
+            if data_gatherer is None:
+                continue
+
+            if data_gatherer.hasBatchGatherFunction():
+                groups.setdefault(data_gatherer, (data_gatherer, []))[1].append(key)
+            else:
+                groups[(data_gatherer, key)] = (data_gatherer, [key])
+
+        for data_gatherer, group_keys in groups.values():
+            self._request_id += 1
+
+            if len(group_keys) > 1:
+                task = PlotDataBatchPrefetchTask(self, self._request_id, ert, data_gatherer, cases, group_keys)
+            else:
+                task = PlotDataPrefetchTask(self, self._request_id, ert, data_gatherer, cases, group_keys[0])
+
+            self._tasks[self._request_id] = task
+            self._thread_pool.start(task, PlotDataPrefetcher.PREFETCH_PRIORITY)
+
+    def cancel(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    def _taskFinished(self, request_id):
+        self._tasks.pop(request_id, None)
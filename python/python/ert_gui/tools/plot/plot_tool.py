@@ -1,3 +1,8 @@
+try:
+  from PyQt4.QtCore import Qt
+except ImportError:
+  from PyQt5.QtCore import Qt
+
 from ert_gui.ertwidgets import resourceIcon
 from ert_gui.tools import Tool
 from ert_gui.tools.plot import PlotWindow
@@ -9,6 +14,7 @@ class PlotTool(Tool):
 
     def trigger(self):
         plot_window = PlotWindow(self.parent())
+        plot_window.setAttribute(Qt.WA_DeleteOnClose)
         plot_window.show()
 
 
@@ -100,6 +100,13 @@ class PlotWidget(QWidget):
             self.setDirty(False)
 
 
+    def showMessage(self, message):
+        """ Replaces the plot with a message, until the plot is updated again. """
+        self.resetPlot()
+        self._figure.text(0.5, 0.5, message, horizontalalignment="center", verticalalignment="center", wrap=True)
+        self._canvas.draw()
+        self.setDirty(False)
+
     def setDirty(self, dirty=True):
         self._dirty = dirty
 
@@ -9,11 +9,10 @@ except ImportError:
 
 
 from ert_gui import ERT
-from ert_gui.ertwidgets import showWaitCursorWhileWaiting
-from ert_gui.ertwidgets.models.ertmodel import getCurrentCaseName
-from ert_gui.plottery import PlotContext, PlotDataGatherer as PDG, PlotConfig, plots, PlotConfigFactory
+from ert_gui.ertwidgets.models.ertmodel import getCurrentCaseName, anyCaseIsRunning
+from ert_gui.plottery import PlotContext, PlotDataGatherer as PDG, PlotDataCache, PlotConfig, plots, PlotConfigFactory
 
-from ert_gui.tools.plot import DataTypeKeysWidget, CaseSelectionWidget, PlotWidget, DataTypeKeysListModel
+from ert_gui.tools.plot import DataTypeKeysWidget, CaseSelectionWidget, PlotWidget, DataTypeKeysListModel, PlotDataLoader, PlotDataPrefetcher
 from ert_gui.tools.plot.customize import PlotCustomizer
 
 CROSS_CASE_STATISTICS = "Cross Case Statistics"
@@ -44,7 +43,8 @@ class PlotWindow(QMainWindow):
         self._plot_customizer = PlotCustomizer(self, self._ert.plotConfig())
 
         def plotConfigCreator(key):
-            return PlotConfigFactory.createPlotConfigForKey(self._ert, key)
+            with PDG.STORAGE_LOCK:
+                return PlotConfigFactory.createPlotConfigForKey(self._ert, key)
 
         self._plot_customizer.setPlotConfigCreator(plotConfigCreator)
         self._plot_customizer.settingsChanged.connect(self.keySelected)
@@ -67,10 +67,20 @@ class PlotWindow(QMainWindow):
         self._data_gatherers = []
         """:type: list of PlotDataGatherer """
 
+        self._plot_data_cache = PlotDataCache.sharedInstance()
+        ERT.configChanged.connect(self._configChanged)
+        ERT.caseDataChanged.connect(self._caseDataChanged)
+
+        self._plot_data_loader = PlotDataLoader(self)
+        self._plot_data_loader.dataLoaded.connect(self._dataLoaded)
+        self._plot_data_loader.dataLoadFailed.connect(self._dataLoadFailed)
+
+        self._plot_data_prefetcher = PlotDataPrefetcher(self._plot_data_loader.threadPool(), self._isSimulationRunning, parent=self)
+
         summary_gatherer = self.createDataGatherer(PDG.gatherSummaryData, key_manager.isSummaryKey, refcaseGatherFunc=PDG.gatherSummaryRefcaseData, observationGatherFunc=PDG.gatherSummaryObservationData, historyGatherFunc=PDG.gatherSummaryHistoryData)
         gen_data_gatherer = self.createDataGatherer(PDG.gatherGenDataData, key_manager.isGenDataKey, observationGatherFunc=PDG.gatherGenDataObservationData)
-        gen_kw_gatherer = self.createDataGatherer(PDG.gatherGenKwData, key_manager.isGenKwKey)
-        custom_kw_gatherer = self.createDataGatherer(PDG.gatherCustomKwData, key_manager.isCustomKwKey)
+        gen_kw_gatherer = self.createDataGatherer(PDG.gatherGenKwData, key_manager.isGenKwKey, batchGatherFunc=PDG.gatherGenKwDataBatch)
+        custom_kw_gatherer = self.createDataGatherer(PDG.gatherCustomKwData, key_manager.isCustomKwKey, batchGatherFunc=PDG.gatherCustomKwDataBatch)
 
 
         self.addPlotWidget(ENSEMBLE, plots.plotEnsemble, [summary_gatherer, gen_data_gatherer])
@@ -81,13 +91,15 @@ class PlotWindow(QMainWindow):
         self.addPlotWidget(CROSS_CASE_STATISTICS, plots.plotCrossCaseStatistics, [gen_kw_gatherer, custom_kw_gatherer])
 
 
-        data_types_key_model = DataTypeKeysListModel(self._ert)
+        self._data_types_key_model = DataTypeKeysListModel(self._ert)
 
-        self._data_type_keys_widget = DataTypeKeysWidget(data_types_key_model)
+        self._data_type_keys_widget = DataTypeKeysWidget(self._data_types_key_model)
         self._data_type_keys_widget.dataTypeKeySelected.connect(self.keySelected)
         self.addDock("Data types", self._data_type_keys_widget)
 
-        current_case = getCurrentCaseName()
+        with PDG.STORAGE_LOCK:
+            current_case = getCurrentCaseName()
+
         self._case_selection_widget = CaseSelectionWidget(current_case)
         self._case_selection_widget.caseSelectionChanged.connect(self.keySelected)
         self.addDock("Plot case", self._case_selection_widget)
@@ -100,12 +112,34 @@ class PlotWindow(QMainWindow):
 
 
 
-    def createDataGatherer(self, dataGatherFunc, gatherConditionFunc, refcaseGatherFunc=None, observationGatherFunc=None, historyGatherFunc=None):
-        data_gatherer = PDG(dataGatherFunc, gatherConditionFunc, refcaseGatherFunc=refcaseGatherFunc, observationGatherFunc=observationGatherFunc, historyGatherFunc=historyGatherFunc)
+    def createDataGatherer(self, dataGatherFunc, gatherConditionFunc, refcaseGatherFunc=None, observationGatherFunc=None, historyGatherFunc=None, batchGatherFunc=None):
+        data_gatherer = PDG(dataGatherFunc, gatherConditionFunc, refcaseGatherFunc=refcaseGatherFunc, observationGatherFunc=observationGatherFunc, historyGatherFunc=historyGatherFunc, batchGatherFunc=batchGatherFunc, cache=self._plot_data_cache)
         self._data_gatherers.append(data_gatherer)
         return data_gatherer
 
 
+    def closeEvent(self, event):
+        ERT.configChanged.disconnect(self._configChanged)
+        ERT.caseDataChanged.disconnect(self._caseDataChanged)
+        self._data_types_key_model.disconnectNotifier()
+
+        self._plot_data_prefetcher.cancel()
+        self._plot_data_loader.cancel()
+        self._plot_data_loader.threadPool().waitForDone()
+        QMainWindow.closeEvent(self, event)
+
+
+    def _configChanged(self):
+        self._plot_data_cache.clear()
+
+    def _caseDataChanged(self, case_name):
+        case_name = str(case_name)
+
+        if len(case_name) == 0:
+            self._plot_data_cache.clear()
+        else:
+            self._plot_data_cache.invalidateCase(case_name)
+
     def currentPlotChanged(self):
         for plot_widget in self._plot_widgets:
             plot_widget.setActive(False)
@@ -114,7 +148,8 @@ class PlotWindow(QMainWindow):
             if index == self._central_tab.currentIndex() and plot_widget.canPlotKey(self.getSelectedKey()):
                 plot_widget.setActive()
                 self._updateCustomizer(plot_widget)
-                plot_widget.updatePlot()
+                if not self._plot_data_loader.isLoading():
+                    plot_widget.updatePlot()
 
     def _updateCustomizer(self, plot_widget):
         """ @type plot_widget: PlotWidget """
@@ -123,10 +158,11 @@ class PlotWindow(QMainWindow):
 
         index_type = PlotContext.UNKNOWN_AXIS
 
-        if key_manager.isGenDataKey(key):
-            index_type = PlotContext.INDEX_AXIS
-        elif key_manager.isSummaryKey(key):
-            index_type = PlotContext.DATE_AXIS
+        with PDG.STORAGE_LOCK:
+            if key_manager.isGenDataKey(key):
+                index_type = PlotContext.INDEX_AXIS
+            elif key_manager.isSummaryKey(key):
+                index_type = PlotContext.DATE_AXIS
 
         x_axis_type = PlotContext.UNKNOWN_AXIS
         y_axis_type = PlotContext.UNKNOWN_AXIS
@@ -187,7 +223,6 @@ class PlotWindow(QMainWindow):
         return dock_widget
 
 
-    @showWaitCursorWhileWaiting
     def keySelected(self):
         key = self.getSelectedKey()
         self._plot_customizer.switchPlotConfigHistory(key)
@@ -197,10 +232,36 @@ class PlotWindow(QMainWindow):
             index = self._central_tab.indexOf(plot_widget)
             self._central_tab.setTabEnabled(index, plot_widget.canPlotKey(key))
 
+        cases = self._case_selection_widget.getPlotCaseNames()
+        self._plot_data_prefetcher.cancel()
+        self._plot_data_loader.load(self._ert, self.getDataGathererForKey(key), cases, key)
+
+    def _dataLoaded(self, key):
+        key = str(key)
+        if key != self.getSelectedKey():
+            return
+
         for plot_widget in self._plot_widgets:
             if plot_widget.canPlotKey(key):
                 plot_widget.updatePlot()
 
+        neighbour_keys = self._data_type_keys_widget.getNeighbourItems(self._plot_data_prefetcher.neighbourCount())
+        cases = self._case_selection_widget.getPlotCaseNames()
+        self._plot_data_prefetcher.prefetch(self._ert, neighbour_keys, cases, self.getDataGathererForKey)
+
+    def _dataLoadFailed(self, key, message):
+        key = str(key)
+        if key != self.getSelectedKey():
+            return
+
+        for plot_widget in self._plot_widgets:
+            if plot_widget.canPlotKey(key):
+                plot_widget.showMessage("Unable to load the data of %s:\n%s" % (key, message))
+
+    def _isSimulationRunning(self):
+        """ @rtype: bool """
+        return anyCaseIsRunning()
+
 
     def toggleCustomizeDialog(self):
         self._plot_customizer.toggleCustomizationDialog()
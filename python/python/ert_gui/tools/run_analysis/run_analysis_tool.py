@@ -25,6 +25,7 @@ from ecl.util.util import BoolVector
 from res.enkf import ErtRunContext
 
 from ert_gui import ERT
+from ert_gui.ertnotifier import ErtNotifier
 from res.enkf import ESUpdate
 from ert_gui.ertwidgets import resourceIcon
 from ert_gui.ertwidgets.closabledialog import ClosableDialog
@@ -68,5 +69,5 @@ class RunAnalysisTool(Tool):
             msg.exec_()
             return
 
-        ERT.ertChanged.emit()
+        ERT.emitErtChange(ErtNotifier.CASE_LIST | ErtNotifier.CASE_DATA, target)
         self._dialog.accept()
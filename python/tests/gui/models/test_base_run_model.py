@@ -2,8 +2,16 @@ from tests import ErtTest
 from res.enkf import EnKFMain
 from res.test import ErtTestContext
 from ert_gui.simulation.models import BaseRunModel
+from ert_gui.simulation.models.progress_events import RunFailedEvent, SimulationsEndedEvent
 from ert_gui import configureErtNotifier
 
+
+class FailingRunModel(BaseRunModel):
+
+    def runSimulations(self, arguments):
+        raise RuntimeError("Unexpected failure")
+
+
 class BaseRunModelTest(ErtTest):
 
     def test_instantiation(self):
@@ -14,3 +22,32 @@ class BaseRunModelTest(ErtTest):
             brm = BaseRunModel('kjell' ,ert.get_queue_config( ))
             self.assertFalse(brm.isQueueRunning())
             self.assertTrue(brm.getProgress() >= 0)
+
+    def test_phase_changes_are_published(self):
+        brm = BaseRunModel('kjell', None, phase_count=2)
+        brm.progressEvents().takeEvents()
+
+        brm.setPhase(1, "Running", indeterminate=True)
+        brm.setPhaseName("Post processing")
+
+        events = brm.progressEvents().takeEvents()
+        self.assertEqual([event.phase_name for event in events], ["Running", "Post processing"])
+        self.assertTrue(all(event.indeterminate for event in events))
+        self.assertEqual(events[0].phase, 1)
+        self.assertFalse(events[0].isFinished())
+
+    def test_unexpected_failure_ends_the_run(self):
+        brm = FailingRunModel('kjell', None)
+        brm.progressEvents().takeEvents()
+
+        with self.assertRaises(RuntimeError):
+            brm.startSimulations({"active_realizations": None})
+
+        self.assertFalse(brm._status_watcher.isRunning())
+        self.assertTrue(brm.hasRunFailed())
+
+        events = brm.progressEvents().takeEvents()
+        self.assertIsInstance(events[-2], RunFailedEvent)
+        self.assertEqual(events[-2].message, "Unexpected failure")
+        self.assertIsInstance(events[-1], SimulationsEndedEvent)
+        self.assertTrue(events[-1].failed)
@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import time
+
+from res.enkf import RealizationStateEnum
+
+from tests import ErtTest
+from ert_gui.ertwidgets.models.case_index import CaseIndex
+
+
+class CaseIndexTest(ErtTest):
+
+    def setUp(self):
+        self.ens_path = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.ens_path, "default", "files"))
+        self.writeCaseFile("state-map")
+
+    def tearDown(self):
+        shutil.rmtree(self.ens_path)
+
+    def writeCaseFile(self, name):
+        with open(os.path.join(self.ens_path, "default", "files", name), "w") as case_file:
+            case_file.write(name)
+
+    def createIndex(self):
+        states = [RealizationStateEnum.STATE_HAS_DATA, RealizationStateEnum.STATE_UNDEFINED]
+        stamp = CaseIndex.caseStamp(self.ens_path, "default")
+        return CaseIndex("default", states, True, ["FOPR", "FOPT"], ("2000-01-01", "2000-02-01"), 2, stamp)
+
+    def test_save_and_load(self):
+        self.assertIsNone(CaseIndex.load(self.ens_path, "default"))
+
+        self.createIndex().save(self.ens_path)
+        index = CaseIndex.load(self.ens_path, "default")
+
+        self.assertIsNotNone(index)
+        self.assertEqual(index.states, (RealizationStateEnum.STATE_HAS_DATA, RealizationStateEnum.STATE_UNDEFINED))
+        self.assertTrue(index.hasData())
+        self.assertTrue(index.initialized)
+        self.assertEqual(index.summary_keys, ["FOPR", "FOPT"])
+        self.assertEqual(index.time_span, ("2000-01-01", "2000-02-01"))
+        self.assertEqual(index.report_step_count, 2)
+        self.assertEqual(index.state_counts[RealizationStateEnum.STATE_HAS_DATA], 1)
+
+    def test_modified_case_invalidates_index(self):
+        self.createIndex().save(self.ens_path)
+
+        self.writeCaseFile("time-map")
+        os.utime(os.path.join(self.ens_path, "default", "files", "time-map"), (time.time() + 10, time.time() + 10))
+
+        self.assertIsNone(CaseIndex.load(self.ens_path, "default"))
+
+    def test_stamp_uses_size_and_only_the_case_files(self):
+        self.createIndex().save(self.ens_path)
+
+        self.writeCaseFile("other-file")
+        self.assertIsNotNone(CaseIndex.load(self.ens_path, "default"))
+
+        path = os.path.join(self.ens_path, "default", "files", "state-map")
+        mtime = os.path.getmtime(path)
+        with open(path, "a") as state_map:
+            state_map.write("more")
+        os.utime(path, (mtime, mtime))
+
+        self.assertIsNone(CaseIndex.load(self.ens_path, "default"))
+
+    def test_stamp_of_missing_files(self):
+        self.assertEqual(CaseIndex.caseStamp(self.ens_path, "missing"), [[0, 0]] * len(CaseIndex.STAMPED_FILES))
+
+    def test_corrupt_index(self):
+        with open(CaseIndex.indexPath(self.ens_path, "default"), "w") as index_file:
+            index_file.write("{not json")
+
+        self.assertIsNone(CaseIndex.load(self.ens_path, "default"))
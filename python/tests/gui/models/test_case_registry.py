@@ -0,0 +1,198 @@
+import os
+import shutil
+import tempfile
+
+from res.enkf import RealizationStateEnum
+
+from tests import ErtTest
+from ert_gui.ertwidgets.models.case_index import CaseIndex
+from ert_gui.ertwidgets.models.case_registry import CaseRegistry
+
+
+class MockSummaryKeySet(object):
+    def keys(self):
+        return ["FOPR"]
+
+
+class MockFileSystem(object):
+    def __init__(self, name):
+        self._name = name
+
+    def getCaseName(self):
+        return self._name
+
+    def getSummaryKeySet(self):
+        return MockSummaryKeySet()
+
+
+class MockFsManager(object):
+    def __init__(self):
+        self.cases = {"default": [RealizationStateEnum.STATE_HAS_DATA] * 3,
+                      "empty": [RealizationStateEnum.STATE_UNDEFINED] * 3,
+                      ".hidden": [RealizationStateEnum.STATE_INITIALIZED] * 3}
+        self.running = set()
+        self.current = "default"
+        self.state_map_reads = []
+        self.mounted = []
+
+    def getCurrentFileSystem(self):
+        return MockFileSystem(self.current)
+
+    def getCaseList(self):
+        return sorted(self.cases)
+
+    def isCaseHidden(self, case):
+        return case.startswith(".")
+
+    def isCaseRunning(self, case):
+        return case in self.running
+
+    def isCaseInitialized(self, case):
+        return RealizationStateEnum.STATE_UNDEFINED not in self.cases[case]
+
+    def getStateMapForCase(self, case):
+        self.state_map_reads.append(case)
+        return self.cases[case]
+
+    def getTimeMapForCase(self, case):
+        return []
+
+    def getFileSystem(self, case):
+        self.mounted.append(case)
+        return MockFileSystem(case)
+
+
+class MockModelConfig(object):
+    def __init__(self, ens_path):
+        self.ens_path = ens_path
+
+    def getEnspath(self):
+        return self.ens_path
+
+
+class MockErt(object):
+    def __init__(self):
+        self.fs_manager = MockFsManager()
+        self.model_config = MockModelConfig(None)
+
+    def getEnkfFsManager(self):
+        return self.fs_manager
+
+    def getModelConfig(self):
+        return self.model_config
+
+
+class MockSignal(object):
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *arguments):
+        for slot in self.slots:
+            slot(*arguments)
+
+
+class MockNotifier(object):
+    def __init__(self):
+        self.ert = MockErt()
+        self.generation = 0
+        self.caseDataChanged = MockSignal()
+
+
+class CaseRegistryTest(ErtTest):
+
+    def test_metadata(self):
+        notifier = MockNotifier()
+        registry = CaseRegistry(notifier, use_case_index=False)
+
+        self.assertEqual(registry.caseNames(), ["default", "empty"])
+        self.assertEqual(registry.caseNames(include_hidden=True), [".hidden", "default", "empty"])
+
+        default = registry.metadata("default")
+        self.assertTrue(default.hasData())
+        self.assertTrue(default.initialized)
+        self.assertEqual(default.state_counts[RealizationStateEnum.STATE_HAS_DATA], 3)
+
+        empty = registry.metadata("empty")
+        self.assertFalse(empty.hasData())
+        self.assertFalse(empty.initialized)
+        self.assertIsNone(registry.metadata("missing"))
+
+    def test_incremental_refresh(self):
+        notifier = MockNotifier()
+        fs_manager = notifier.ert.fs_manager
+        registry = CaseRegistry(notifier, use_case_index=False)
+
+        registry.caseNames()
+        registry.caseNames()
+        self.assertEqual(registry.refresh_count, 1)
+        self.assertEqual(sorted(fs_manager.state_map_reads), [".hidden", "default", "empty"])
+
+        fs_manager.state_map_reads = []
+        fs_manager.cases["new"] = [RealizationStateEnum.STATE_HAS_DATA]
+        fs_manager.running.add("empty")
+        notifier.generation += 1
+        notifier.generation += 1
+
+        self.assertEqual(registry.caseNames(), ["default", "empty", "new"])
+        self.assertEqual(registry.refresh_count, 2)
+        self.assertEqual(sorted(fs_manager.state_map_reads), ["default", "empty", "new"])
+
+        fs_manager.state_map_reads = []
+        fs_manager.running.remove("empty")
+        registry.invalidateCase(".hidden")
+
+        self.assertFalse(registry.metadata("empty").running)
+        self.assertEqual(sorted(fs_manager.state_map_reads), [".hidden", "default", "empty"])
+
+        fs_manager.state_map_reads = []
+        registry.invalidateAll()
+        registry.cases()
+        self.assertEqual(len(fs_manager.state_map_reads), 4)
+
+    def test_case_data_changes_are_reloaded(self):
+        notifier = MockNotifier()
+        fs_manager = notifier.ert.fs_manager
+        registry = CaseRegistry(notifier, use_case_index=False)
+        registry.cases()
+
+        fs_manager.state_map_reads = []
+        fs_manager.cases["empty"] = [RealizationStateEnum.STATE_HAS_DATA] * 3
+        notifier.caseDataChanged.emit("empty")
+
+        self.assertTrue(registry.metadata("empty").hasData())
+        self.assertEqual(sorted(fs_manager.state_map_reads), ["default", "empty"])
+
+        fs_manager.state_map_reads = []
+        notifier.caseDataChanged.emit("")
+        registry.cases()
+        self.assertEqual(sorted(fs_manager.state_map_reads), [".hidden", "default", "empty"])
+
+    def test_index_is_only_written_for_written_cases(self):
+        notifier = MockNotifier()
+        fs_manager = notifier.ert.fs_manager
+        ens_path = tempfile.mkdtemp()
+        notifier.ert.model_config.ens_path = ens_path
+
+        try:
+            for case in fs_manager.cases:
+                os.makedirs(os.path.join(ens_path, case))
+
+            registry = CaseRegistry(notifier)
+            registry.cases()
+            self.assertEqual(fs_manager.mounted, ["default"])
+            self.assertIsNone(CaseIndex.load(ens_path, "empty"))
+
+            notifier.caseDataChanged.emit("empty")
+            registry.cases()
+            self.assertEqual(fs_manager.mounted, ["default", "empty"])
+
+            fs_manager.state_map_reads = []
+            notifier.caseDataChanged.emit("")
+            registry.cases()
+            self.assertEqual(sorted(fs_manager.state_map_reads), [".hidden", "default"])
+            self.assertEqual(fs_manager.mounted, ["default", "empty"])
+        finally:
+            shutil.rmtree(ens_path)
@@ -0,0 +1,31 @@
+import numpy
+
+from tests import ErtTest
+from ert_gui.simulation.detailed_progress import DetailedProgress
+
+
+class DetailedProgressTest(ErtTest):
+
+    def test_layout_status_image(self):
+        # Three realizations with three jobs each, on a 2 x 2 grid of 2 x 2 pixel cells
+        statuses = numpy.array([[1, 2, 3],
+                                [4, 5, 6],
+                                [7, 8, 9]], dtype=numpy.uint8)
+
+        image = DetailedProgress.layoutStatusImage(statuses, 2, 2, 2)
+
+        expected = numpy.array([[1, 2, 4, 5],
+                                [3, 0, 6, 0],
+                                [7, 8, 0, 0],
+                                [9, 0, 0, 0]], dtype=numpy.uint8)
+
+        numpy.testing.assert_array_equal(image, expected)
+
+    def test_layout_with_more_cells_than_realizations(self):
+        statuses = numpy.ones((5, 1), dtype=numpy.uint8)
+
+        image = DetailedProgress.layoutStatusImage(statuses, 3, 2, 1)
+
+        self.assertEqual(image.shape, (2, 3))
+        self.assertEqual(int(image.sum()), 5)
+        self.assertEqual(image[1, 2], 0)
@@ -0,0 +1,150 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from tests import ErtTest
+from ert_gui.simulation.models.forward_model_status_watcher import ForwardModelStatusWatcher
+
+
+class Job(object):
+    def __init__(self, status):
+        self.status = status
+
+
+class Status(object):
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+
+class ForwardModelStatusWatcherTest(ErtTest):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.loaded = []
+        self.published = []
+        self.watcher = ForwardModelStatusWatcher(self.publish, thread_count=2, load_status=self.loadStatus)
+
+    def tearDown(self):
+        self.watcher.stop()
+        shutil.rmtree(self.root)
+
+    def publish(self, iteration, deltas):
+        self.published.append((iteration, deltas))
+
+    def loadStatus(self, runpath):
+        self.loaded.append(runpath)
+        with open(os.path.join(runpath, ForwardModelStatusWatcher.STATUS_FILE)) as status_file:
+            return Status([Job(status) for status in json.load(status_file)])
+
+    def runpath(self, iens):
+        return os.path.join(self.root, "realization-%d" % iens)
+
+    def writeStatus(self, iens, statuses):
+        runpath = self.runpath(iens)
+        if not os.path.isdir(runpath):
+            os.makedirs(runpath)
+
+        with open(os.path.join(runpath, ForwardModelStatusWatcher.STATUS_FILE), "w") as status_file:
+            json.dump(statuses, status_file)
+
+    def test_only_changed_files_are_parsed(self):
+        self.watcher.setIteration(0)
+        for iens in range(3):
+            self.watcher.watch(iens, self.runpath(iens))
+
+        self.writeStatus(0, ["Running"])
+        self.writeStatus(1, ["Waiting"])
+
+        self.assertEqual(self.watcher.poll(), 2)
+        self.assertEqual(len(self.loaded), 2)
+        iteration, deltas = self.published[-1]
+        self.assertEqual(iteration, 0)
+        self.assertEqual(sorted(deltas), [0, 1])
+
+        self.assertEqual(self.watcher.poll(), 0)
+        self.assertEqual(len(self.loaded), 2)
+        self.assertEqual(len(self.published), 1)
+
+        self.writeStatus(1, ["Running", "Waiting"])
+        self.assertEqual(self.watcher.poll(), 1)
+        self.assertEqual(self.loaded[-1], self.runpath(1))
+        self.assertEqual([job.status for job in self.published[-1][1][1]], ["Running", "Waiting"])
+
+    def test_finished_realizations_are_not_watched(self):
+        self.watcher.setIteration(0)
+        self.watcher.watch(0, self.runpath(0))
+        self.writeStatus(0, ["Success", "Success"])
+
+        self.watcher.poll()
+        self.assertTrue(self.watcher.isKnown(0))
+        self.assertEqual(self.watcher.watchedCount(), 0)
+
+        self.watcher.watch(0, self.runpath(0))
+        self.writeStatus(0, ["Success", "Success", "Success"])
+        self.assertEqual(self.watcher.poll(), 0)
+        self.assertEqual(len(self.loaded), 1)
+
+    def test_new_iteration_forgets_realizations(self):
+        self.watcher.setIteration(0)
+        self.watcher.watch(0, self.runpath(0))
+        self.writeStatus(0, ["Success"])
+        self.watcher.poll()
+
+        self.watcher.setIteration(1)
+        self.assertFalse(self.watcher.isKnown(0))
+
+        self.watcher.watch(0, self.runpath(0))
+        self.watcher.poll()
+        self.assertEqual(self.published[-1][0], 1)
+
+    def test_background_polling(self):
+        self.watcher = ForwardModelStatusWatcher(self.publish, interval=0.01, load_status=self.loadStatus)
+        self.watcher.setIteration(0)
+        self.watcher.watch(0, self.runpath(0))
+        self.writeStatus(0, ["Running"])
+
+        self.watcher.start()
+        self.assertTrue(self.watcher.isRunning())
+        self.watcher.stop()
+        self.assertFalse(self.watcher.isRunning())
+
+        self.assertEqual(len(self.published), 1)
+        self.assertEqual(list(self.published[0][1]), [0])
+
+    def test_background_polling_continues_after_an_error(self):
+        polls = []
+
+        def pollCallback():
+            polls.append(len(polls))
+            if len(polls) == 1:
+                raise ValueError("Failing poll")
+
+        self.watcher = ForwardModelStatusWatcher(self.publish, interval=0.01, thread_count=2, load_status=self.loadStatus, poll_callback=pollCallback)
+        self.watcher.setIteration(0)
+        for iens in range(3):
+            self.watcher.watch(iens, self.runpath(iens))
+            self.writeStatus(iens, ["Running"])
+
+        stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            self.watcher.start()
+            for _ in range(500):
+                if len(polls) >= 3:
+                    break
+                time.sleep(0.01)
+            self.watcher.stop()
+        finally:
+            sys.stderr = stderr
+
+        self.assertFalse(self.watcher.isRunning())
+        self.assertEqual(sorted(self.published[0][1]), [0, 1, 2])
+        self.assertEqual(len(self.loaded), 3)
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from tests import ErtTest
+from ert_gui.simulation.models.job_status_table import JobStatusTable
+
+
+class Job(object):
+    def __init__(self, name, status, start_time=None, end_time=None):
+        self.name = name
+        self.status = status
+        self.start_time = start_time
+        self.end_time = end_time
+
+
+class JobStatusTableTest(ErtTest):
+
+    def test_update(self):
+        table = JobStatusTable(2)
+        self.assertEqual(len(table), 0)
+        self.assertFalse(0 in table)
+
+        start = datetime(2018, 1, 1, 12, 0, 0)
+        table.update(3, [Job("COPY", "Success", start, start), Job("ECLIPSE", "Running", start)])
+        table.update(1, [Job("COPY", "Waiting"), Job("ECLIPSE", "Waiting")])
+
+        self.assertEqual(list(table.realizations()), [1, 3])
+        self.assertTrue(3 in table)
+        self.assertFalse(2 in table)
+        self.assertEqual(table.jobNames(), ["COPY", "ECLIPSE"])
+        self.assertEqual(table.statusNames(), ["Success", "Running", "Waiting"])
+
+        codes = table.statusCodes()
+        self.assertEqual(codes.shape, (4, 2))
+        self.assertEqual(list(codes[3]), [1, 2])
+        self.assertEqual(list(codes[1]), [3, 3])
+        self.assertEqual(list(codes[0]), [0, 0])
+
+        self.assertTrue(table.startTimes(3)[0] > 0)
+        self.assertEqual(table.endTimes(3)[1], 0)
+
+    def test_versions_and_finished(self):
+        table = JobStatusTable(0)
+        self.assertEqual(table.version(0), 0)
+
+        table.update(0, [Job("COPY", "Running")])
+        self.assertEqual(table.version(0), 1)
+        self.assertFalse(table.isFinished(0))
+
+        table.update(0, [Job("COPY", "Success")])
+        self.assertEqual(table.version(0), 2)
+        self.assertTrue(table.isFinished(0))
+        self.assertFalse(table.isFinished(1))
+
+    def test_snapshot(self):
+        table = JobStatusTable(0)
+        table.update(1, [Job("COPY", "Success"), Job("ECLIPSE", "Running")])
+
+        status_names, status_codes, versions = table.snapshot()
+        self.assertEqual(status_names, ["Success", "Running"])
+        self.assertEqual(status_codes.shape, (2, 2))
+        self.assertEqual(list(status_codes[1]), [1, 2])
+        self.assertEqual(list(versions), [0, 1])
+
+        table.update(2, [Job("COPY", "Failed")])
+        self.assertEqual(status_names, ["Success", "Running"])
+        self.assertEqual(status_codes.shape, (2, 2))
+        self.assertEqual(list(versions), [0, 1])
+
+    def test_load_jobs_without_runpath(self):
+        table = JobStatusTable(0)
+        table.update(0, [Job("COPY", "Running")])
+        self.assertEqual(table.loadJobs(0), [])
@@ -0,0 +1,35 @@
+from threading import Thread
+
+from tests import ErtTest
+from ert_gui.simulation.models.progress_events import ProgressEventQueue, PhaseChangedEvent, RunFailedEvent
+
+
+class ProgressEventsTest(ErtTest):
+
+    def test_events_are_taken_in_order(self):
+        events = ProgressEventQueue()
+        self.assertEqual(events.takeEvents(), [])
+
+        for phase in range(3):
+            events.publish(PhaseChangedEvent(phase, 2, "Phase %d" % phase, False))
+
+        first = events.takeEvents(max_count=2)
+        self.assertEqual([event.phase for event in first], [0, 1])
+
+        rest = events.takeEvents()
+        self.assertEqual(len(rest), 1)
+        self.assertTrue(rest[0].isFinished())
+        self.assertEqual(events.takeEvents(), [])
+
+    def test_wait_for_events(self):
+        events = ProgressEventQueue()
+        self.assertEqual(events.waitForEvents(0.01), [])
+
+        publisher = Thread(target=lambda: events.publish(RunFailedEvent("Failed")))
+        publisher.start()
+
+        received = events.waitForEvents(5.0)
+        publisher.join()
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].message, "Failed")
@@ -0,0 +1,72 @@
+from tests import ErtTest
+from res.job_queue import JobStatusType
+from ert_gui.simulation.models import QueueStatusSnapshot, SimulationsTracker
+
+
+class FakeJobQueue(object):
+    def __init__(self, statuses, running=True):
+        self.statuses = statuses
+        self.running = running
+        self.status_calls = 0
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def isRunning(self):
+        return self.running
+
+    def getJobStatus(self, job_number):
+        self.status_calls += 1
+        return self.statuses[job_number]
+
+
+class QueueStatusSnapshotTest(ErtTest):
+
+    def setUp(self):
+        self.statuses = [JobStatusType.JOB_QUEUE_WAITING,
+                         JobStatusType.JOB_QUEUE_RUNNING,
+                         JobStatusType.JOB_QUEUE_RUNNING,
+                         JobStatusType.JOB_QUEUE_SUCCESS,
+                         JobStatusType.JOB_QUEUE_FAILED,
+                         JobStatusType.JOB_QUEUE_DONE]
+
+    def test_from_queue_reads_each_job_once(self):
+        job_queue = FakeJobQueue(self.statuses)
+        snapshot = QueueStatusSnapshot.fromQueue(job_queue)
+
+        self.assertEqual(job_queue.status_calls, len(self.statuses))
+        self.assertEqual(snapshot.queue_size, len(self.statuses))
+        self.assertEqual(list(snapshot.statuses), [int(status) for status in self.statuses])
+
+    def test_stopped_queue_gives_empty_snapshot(self):
+        job_queue = FakeJobQueue(self.statuses, running=False)
+        snapshot = QueueStatusSnapshot.fromQueue(job_queue)
+
+        self.assertEqual(job_queue.status_calls, 0)
+        self.assertEqual(len(snapshot.statuses), 0)
+        self.assertEqual(snapshot.queue_size, len(self.statuses))
+        self.assertEqual(snapshot.statusCounts(), {})
+
+    def test_counts(self):
+        snapshot = QueueStatusSnapshot(self.statuses)
+
+        self.assertEqual(snapshot.count(JobStatusType.JOB_QUEUE_RUNNING), 2)
+        self.assertEqual(snapshot.count(JobStatusType.JOB_QUEUE_DONE | JobStatusType.JOB_QUEUE_SUCCESS), 2)
+
+        counts = snapshot.statusCounts()
+        self.assertEqual(counts[JobStatusType.JOB_QUEUE_RUNNING], 2)
+        self.assertEqual(counts[JobStatusType.JOB_QUEUE_WAITING], 1)
+        self.assertEqual(sum(counts.values()), len(self.statuses))
+
+    def test_tracker_state_counts(self):
+        snapshot = QueueStatusSnapshot(self.statuses)
+        states = SimulationsTracker().getStates()
+
+        state_counts = snapshot.countStates([state.state for state in states])
+
+        expected = []
+        for state in states:
+            expected.append(len([status for status in self.statuses if status in state.state]))
+
+        self.assertEqual(state_counts, expected)
+        self.assertEqual(sum(state_counts), len(self.statuses))
@@ -0,0 +1,44 @@
+try:
+  from PyQt4.QtCore import Qt
+except ImportError:
+  from PyQt5.QtCore import Qt
+
+from tests import ErtTest
+from ert_gui.simulation.realization_list_model import RealizationListModel
+
+
+class RealizationListModelTest(ErtTest):
+
+    def test_failed_mask(self):
+        failed = RealizationListModel.failedMask([True, True, False, True], [True, False, False])
+        self.assertEqual(list(failed), [False, True, False])
+
+    def test_rows_and_filters(self):
+        model = RealizationListModel()
+        model.setMasks([True, True, False, True], [True, False, False, True])
+
+        self.assertEqual(model.rowCount(), 4)
+        self.assertEqual(model.data(model.index(0, 0)), "0")
+        self.assertEqual(model.data(model.index(0, 0), Qt.CheckStateRole), Qt.Checked)
+        self.assertEqual(model.data(model.index(1, 0), Qt.CheckStateRole), Qt.Unchecked)
+
+        model.setFilter(RealizationListModel.SHOW_FAILED)
+        self.assertEqual([model.realization(row) for row in range(model.rowCount())], [1])
+        self.assertEqual(model.rowForRealization(1), 0)
+        self.assertEqual(model.rowForRealization(0), -1)
+
+        model.setFilter(RealizationListModel.SHOW_SUCCESSFUL)
+        self.assertEqual([model.realization(row) for row in range(model.rowCount())], [0, 3])
+        self.assertEqual(model.rowForRealization(3), 1)
+
+    def test_restart_keeps_successful_realizations(self):
+        model = RealizationListModel()
+        model.setMasks([True, True, True], [True, False, False])
+        model.setMasks([False, True, True], [False, True, False])
+
+        self.assertTrue(model.isSuccessful(0))
+        self.assertTrue(model.isSuccessful(1))
+        self.assertFalse(model.isSuccessful(2))
+
+        model.setFilter(RealizationListModel.SHOW_FAILED)
+        self.assertEqual([model.realization(row) for row in range(model.rowCount())], [2])
@@ -0,0 +1,60 @@
+"""
+Compares the wide matrix path of SummaryMatrixLoader with the previous
+reset_index/duplicated/drop_duplicates/pivot path.
+
+Usage: python -m tests.gui.plottery.summary_matrix_benchmark [realizations] [timesteps]
+"""
+from __future__ import print_function
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from ert_gui.plottery import SummaryMatrixLoader
+from tests.gui.plottery.test_summary_matrix_loader import createLongFormatData
+from pandas import date_range
+
+
+def pivotPath(data, key):
+    data = data.reset_index()
+
+    if any(data.duplicated()):
+        data = data.drop_duplicates()
+
+    return data.pivot(index="Date", columns="Realization", values=key)
+
+
+def measure(function, *arguments):
+    if tracemalloc is not None:
+        tracemalloc.start()
+
+    start = time.time()
+    function(*arguments)
+    elapsed = time.time() - start
+
+    peak = None
+    if tracemalloc is not None:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main(realization_count=500, timestep_count=5000):
+    key = "FOPR"
+    data = createLongFormatData(range(realization_count), date_range("2000-01-01", periods=timestep_count, freq="D"), key)
+
+    print("Realizations: %d Timesteps: %d" % (realization_count, timestep_count))
+    for name, function in [("pivot", pivotPath), ("matrix", SummaryMatrixLoader.toMatrix)]:
+        elapsed, peak = measure(function, data, key)
+        if peak is None:
+            print("%-8s %8.3f s" % (name, elapsed))
+        else:
+            print("%-8s %8.3f s %10.1f MB peak" % (name, elapsed, peak / (1024.0 * 1024.0)))
+
+
+if __name__ == "__main__":
+    main(*[int(argument) for argument in sys.argv[1:3]])
@@ -0,0 +1,81 @@
+import numpy
+
+from tests import ErtTest
+from ert_gui.plottery import MinMaxDecimator
+
+
+class MinMaxDecimatorTest(ErtTest):
+
+    def test_min_and_max_are_kept_per_bucket(self):
+        x = numpy.arange(100, dtype=numpy.float64)
+        y = numpy.vstack((numpy.sin(x / 5.0), numpy.random.RandomState(1).normal(size=100)))
+        decimator = MinMaxDecimator(x, y, 10)
+        self.assertTrue(decimator.isDecimationNeeded())
+
+        x_decimated, y_decimated = decimator.decimate()
+        self.assertEqual(x_decimated.shape, (2, 22))
+        self.assertEqual(y_decimated.shape, (2, 22))
+
+        for series in range(2):
+            self.assertEqual(x_decimated[series, 0], 0.0)
+            self.assertEqual(x_decimated[series, -1], 99.0)
+            self.assertTrue(numpy.all(numpy.diff(x_decimated[series]) >= 0))
+
+            for bucket in range(10):
+                values = y[series, bucket * 10:(bucket + 1) * 10]
+                kept = y_decimated[series, 1 + 2 * bucket:3 + 2 * bucket]
+                self.assertEqual(sorted(kept), sorted([values.min(), values.max()]))
+
+            self.assertEqual(y_decimated[series].max(), y[series].max())
+            self.assertEqual(y_decimated[series].min(), y[series].min())
+
+    def test_nan_gaps(self):
+        x = numpy.arange(40, dtype=numpy.float64)
+        y = numpy.arange(40, dtype=numpy.float64).reshape(1, 40)
+        y[0, 12] = numpy.nan
+        y[0, 20:30] = numpy.nan
+
+        x_decimated, y_decimated = MinMaxDecimator(x, y, 4).decimate()
+
+        self.assertEqual(list(y_decimated[0, 3:5]), [10.0, 19.0])
+        self.assertTrue(numpy.all(numpy.isnan(y_decimated[0, 5:7])))
+        self.assertEqual(list(y_decimated[0, 7:9]), [30.0, 39.0])
+
+    def test_decimate_zoomed_range(self):
+        x = numpy.arange(1000, dtype=numpy.float64)
+        y = numpy.cos(x / 50.0).reshape(1, 1000)
+        decimator = MinMaxDecimator(x, y, 20)
+
+        x_decimated, y_decimated = decimator.decimate()
+        self.assertEqual(x_decimated.shape, (1, 42))
+
+        x_zoomed, y_zoomed = decimator.decimate(100.0, 500.0)
+        self.assertEqual(x_zoomed[0, 0], 99.0)
+        self.assertEqual(x_zoomed[0, -1], 501.0)
+        self.assertEqual(x_zoomed.shape, (1, 42))
+        self.assertTrue(numpy.all((x_zoomed[0] >= 99.0) & (x_zoomed[0] <= 501.0)))
+        numpy.testing.assert_array_equal(y_zoomed[0], y[0, x_zoomed[0].astype(int)])
+
+        x_narrow, y_narrow = decimator.decimate(100.0, 110.0)
+        numpy.testing.assert_array_equal(x_narrow[0], numpy.arange(99.0, 112.0))
+        numpy.testing.assert_array_equal(y_narrow[0], y[0, 99:112])
+
+    def test_series_shorter_than_the_bucket_count(self):
+        x = numpy.array([0.0, 1.0, 2.0])
+        y = numpy.array([[1.0, 3.0, 2.0], [4.0, 5.0, 6.0]])
+        decimator = MinMaxDecimator(x, y, 10)
+        self.assertFalse(decimator.isDecimationNeeded())
+
+        x_decimated, y_decimated = decimator.decimate()
+        numpy.testing.assert_array_equal(x_decimated, [x, x])
+        numpy.testing.assert_array_equal(y_decimated, y)
+
+        y_decimated[0, 0] = 10.0
+        self.assertEqual(y[0, 0], 1.0)
+
+    def test_min_max_indexes_with_uneven_buckets(self):
+        y = numpy.array([[5.0, 1.0, 9.0, 2.0, 7.0, 3.0, 8.0]])
+        indexes = MinMaxDecimator.minMaxIndexes(y, 3)
+
+        self.assertEqual(indexes.shape, (1, 6))
+        self.assertEqual(list(indexes[0]), [1, 2, 3, 4, 6, 6])
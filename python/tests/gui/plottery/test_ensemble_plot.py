@@ -0,0 +1,97 @@
+import numpy
+from pandas import DataFrame, date_range
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from tests import ErtTest
+from ert_gui.plottery import PlotStyle
+from ert_gui.plottery.plots import ensemble
+
+
+class MockPlotConfig(object):
+    def __init__(self, line_style="-", marker=""):
+        self.style = PlotStyle("Default", color="#386CB0", alpha=0.8, line_style=line_style, marker=marker)
+        self.legend_items = []
+
+    def defaultStyle(self):
+        return self.style
+
+    def addLegendItem(self, label, item):
+        self.legend_items.append((label, item))
+
+
+class EnsemblePlotTest(ErtTest):
+
+    def createData(self, realization_count, point_count=50, dates=True):
+        values = numpy.random.RandomState(0).normal(size=(point_count, realization_count)).cumsum(axis=0)
+
+        if dates:
+            return DataFrame(values, index=date_range("2010-01-01", periods=point_count, freq="D"))
+
+        return DataFrame(values, index=numpy.arange(point_count))
+
+    def createAxes(self):
+        figure = Figure(figsize=(4, 3), dpi=50)
+        FigureCanvasAgg(figure)
+        return figure.add_subplot(111)
+
+    def test_line_collection_above_threshold(self):
+        data = self.createData(ensemble.LINE_COLLECTION_THRESHOLD + 1)
+        config = MockPlotConfig()
+        self.assertTrue(ensemble._useLineCollection(config, data))
+
+        axes = self.createAxes()
+        ensemble._plotLineCollection(axes, config, data, "default", True, 200)
+
+        self.assertEqual(len(axes.collections), 1)
+        self.assertEqual(len(axes.lines), 0)
+
+        collection = axes.collections[0]
+        self.assertIsInstance(collection, LineCollection)
+        self.assertEqual(len(collection.get_segments()), ensemble.LINE_COLLECTION_THRESHOLD + 1)
+
+        label, legend_line = config.legend_items[0]
+        self.assertEqual(label, "default")
+        self.assertIsInstance(legend_line, Line2D)
+        self.assertEqual(len(legend_line.get_xdata()), 0)
+        self.assertEqual(legend_line.get_color(), "#386CB0")
+        self.assertEqual(legend_line.get_linestyle(), "-")
+        self.assertFalse(legend_line in axes.lines)
+
+    def test_lines_below_threshold(self):
+        data = self.createData(ensemble.LINE_COLLECTION_THRESHOLD, dates=False)
+        config = MockPlotConfig()
+        self.assertFalse(ensemble._useLineCollection(config, data))
+
+        axes = self.createAxes()
+        ensemble._plotLines(axes, config, data, "default", False, 200)
+
+        self.assertEqual(len(axes.collections), 0)
+        self.assertEqual(len(axes.lines), ensemble.LINE_COLLECTION_THRESHOLD)
+        self.assertTrue(all(isinstance(line, Line2D) for line in axes.lines))
+        self.assertIs(config.legend_items[0][1], axes.lines[0])
+
+    def test_marker_and_line_style_fallback(self):
+        data = self.createData(ensemble.LINE_COLLECTION_THRESHOLD + 1)
+
+        self.assertFalse(ensemble._useLineCollection(MockPlotConfig(marker="o"), data))
+        self.assertFalse(ensemble._useLineCollection(MockPlotConfig(line_style=""), data))
+        self.assertTrue(ensemble._useLineCollection(MockPlotConfig(line_style="--"), data))
+
+    def test_line_collection_is_decimated_again_on_zoom(self):
+        data = self.createData(ensemble.LINE_COLLECTION_THRESHOLD + 1, point_count=1000, dates=False)
+        axes = self.createAxes()
+        ensemble._plotLineCollection(axes, MockPlotConfig(), data, "default", False, 20)
+
+        segments = axes.collections[0].get_segments()
+        self.assertEqual(len(segments[0]), 42)
+        self.assertEqual(segments[0][0][0], 0.0)
+        self.assertEqual(segments[0][-1][0], 999.0)
+
+        axes.set_xlim(100.0, 200.0)
+        segments = axes.collections[0].get_segments()
+        self.assertEqual(segments[0][0][0], 99.0)
+        self.assertEqual(segments[0][-1][0], 201.0)
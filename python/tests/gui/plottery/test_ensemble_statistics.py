@@ -0,0 +1,50 @@
+import numpy
+from pandas import DataFrame, Series
+
+from tests import ErtTest
+from ert_gui.plottery import EnsembleStatistics
+
+
+class EnsembleStatisticsTest(ErtTest):
+
+    def test_frame_statistics_match_pandas(self):
+        random = numpy.random.RandomState(42)
+        data = DataFrame(random.normal(size=(20, 50)))
+        data.iloc[3, 7] = numpy.nan
+
+        statistics = EnsembleStatistics.compute(data)
+
+        self.assertEqual(list(statistics.columns), ["Minimum", "Maximum", "Mean", "Std", "p10", "p33", "p50", "p67", "p90"])
+        numpy.testing.assert_allclose(statistics["Minimum"].values, data.min(axis=1).values)
+        numpy.testing.assert_allclose(statistics["Maximum"].values, data.max(axis=1).values)
+        numpy.testing.assert_allclose(statistics["Mean"].values, data.mean(axis=1).values)
+        numpy.testing.assert_allclose(statistics["Std"].values, data.std(axis=1).values)
+
+        for quantile in EnsembleStatistics.DEFAULT_QUANTILES:
+            name = EnsembleStatistics.quantileName(quantile)
+            numpy.testing.assert_allclose(statistics[name].values, data.quantile(quantile, axis=1).values)
+
+    def test_series_statistics(self):
+        data = Series([1.0, 2.0, 3.0, 4.0, "5"])
+
+        statistics = EnsembleStatistics.compute(data, quantiles=(0.25, 0.5))
+
+        self.assertEqual(statistics["Minimum"], 1.0)
+        self.assertEqual(statistics["Maximum"], 5.0)
+        self.assertEqual(statistics["Mean"], 3.0)
+        self.assertEqual(statistics["p25"], 2.0)
+        self.assertEqual(statistics["p50"], 3.0)
+        self.assertNotIn("p10", statistics)
+
+    def test_quantile_names_are_unique(self):
+        self.assertEqual(EnsembleStatistics.quantileName(0.1), "p10")
+        self.assertEqual(EnsembleStatistics.quantileName(0.105), "p10.5")
+        self.assertEqual(EnsembleStatistics.quantileName(0.11), "p11")
+        self.assertEqual(EnsembleStatistics.quantileName(0.001), "p0.1")
+        self.assertEqual(EnsembleStatistics.quantileName(0.004), "p0.4")
+
+        statistics = EnsembleStatistics.compute(Series(numpy.arange(1000.0)), quantiles=(0.105, 0.11, 0.001, 0.004))
+        self.assertEqual(list(statistics.index[4:]), ["p10.5", "p11", "p0.1", "p0.4"])
+
+        with self.assertRaises(ValueError):
+            EnsembleStatistics.compute(Series([1.0, 2.0]), quantiles=(0.5, 0.5))
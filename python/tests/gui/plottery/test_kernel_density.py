@@ -0,0 +1,43 @@
+import numpy
+from pandas import Series
+
+from tests import ErtTest
+from ert_gui.plottery import KernelDensity
+
+
+def directDensity(values, grid, bandwidth_factor):
+    std = bandwidth_factor * numpy.std(values, ddof=1)
+    distances = (grid[:, numpy.newaxis] - values[numpy.newaxis, :]) / std
+    return numpy.exp(-0.5 * distances ** 2).sum(axis=1) / (len(values) * std * numpy.sqrt(2.0 * numpy.pi))
+
+
+class KernelDensityTest(ErtTest):
+
+    def test_density_matches_direct_evaluation(self):
+        values = numpy.random.RandomState(42).normal(loc=10.0, scale=2.0, size=500)
+
+        for bandwidth in KernelDensity.BANDWIDTH_RULES:
+            density = KernelDensity.evaluate(Series(values), bandwidth)
+            factor = KernelDensity.bandwidthFactor(len(values), bandwidth)
+            expected = directDensity(values, density.index.values, factor)
+
+            self.assertEqual(len(density), KernelDensity.DEFAULT_GRID_SIZE)
+            numpy.testing.assert_allclose(density.values, expected, atol=1e-3)
+            spacing = density.index[1] - density.index[0]
+            self.assertAlmostEqual(density.values.sum() * spacing, 1.0, places=2)
+
+    def test_grid_extends_half_the_range(self):
+        density = KernelDensity.evaluate(Series([0.0, 1.0, 4.0]), grid_size=11)
+
+        self.assertEqual(density.index[0], -2.0)
+        self.assertEqual(density.index[-1], 6.0)
+
+    def test_degenerate_and_non_numeric_data(self):
+        self.assertTrue(KernelDensity.evaluate(Series([1.0, 1.0, numpy.nan])).empty)
+        self.assertTrue(KernelDensity.evaluate(Series([], dtype=numpy.float64)).empty)
+        self.assertFalse(KernelDensity.evaluate(Series(["1", "2", "x"])).empty)
+
+        with self.assertRaises(ValueError):
+            KernelDensity.bandwidthFactor(10, "unknown")
+
+        self.assertEqual(KernelDensity.bandwidthFactor(10, 0.5), 0.5)
@@ -0,0 +1,49 @@
+import fnmatch
+
+from tests import ErtTest
+from ert_gui.plottery import KeySearchIndex
+
+
+class KeySearchIndexTest(ErtTest):
+
+    def setUp(self):
+        wells = ["OP%d" % number for number in range(1, 30)] + ["WI1"]
+        self.keys = ["%s:%s" % (vector, well) for vector in ["WOPR", "WWCT", "WOPT"] for well in wells]
+        self.keys += ["FOPR", "FOPT", "BPR:1,2,3", "SNAKE_OIL_PARAM:OP1_PERSISTENCE"]
+
+    def expected(self, query):
+        query = query.lower()
+
+        if KeySearchIndex.hasWildcards(query):
+            return [key for key in self.keys if fnmatch.fnmatchcase(key.lower(), query)]
+
+        return [key for key in self.keys if query in key.lower()]
+
+    def test_matches_scan(self):
+        index = KeySearchIndex(self.keys)
+        queries = ["", "w", "wop", "WOPR:OP1", "op1", "1,2", "zzz", "WOPR:*", "*:OP1", "*:op1*", "w?pr:op2*", "*PERSIST*"]
+
+        for query in queries:
+            self.assertEqual(index.match(query), self.expected(query), query)
+
+    def test_incremental_search(self):
+        index = KeySearchIndex(self.keys)
+        typed = ["o", "op", "op1", "op", "opt", "wopr:*", "wopr:*1", "*:op1"]
+
+        for query in typed:
+            self.assertEqual(index.match(query), self.expected(query), query)
+
+        self.assertTrue(KeySearchIndex.isNarrowing("op", "op1"))
+        self.assertTrue(KeySearchIndex.isNarrowing("wopr:*", "wopr:*1"))
+        self.assertFalse(KeySearchIndex.isNarrowing("wopr", "wopr:*"))
+        self.assertFalse(KeySearchIndex.isNarrowing("*:op1", "*:op12"))
+
+    def test_completions_and_mask(self):
+        index = KeySearchIndex(self.keys)
+
+        self.assertEqual(index.completions("wopr:op2"), ["WOPR:OP2"] + ["WOPR:OP%d" % number for number in range(20, 30)])
+        self.assertEqual(index.completions("X"), [])
+        self.assertEqual(len(index.completions("")), len(self.keys))
+
+        mask = index.searchMask("FOP")
+        self.assertEqual([key for key, selected in zip(self.keys, mask) if selected], ["FOPR", "FOPT"])
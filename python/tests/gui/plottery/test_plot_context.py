@@ -0,0 +1,38 @@
+from pandas import DataFrame, Series
+
+from tests import ErtTest
+from ert_gui.plottery import PlotContext
+
+
+class MockDataGatherer(object):
+    def __init__(self):
+        self.cases = []
+
+    def gatherDataBatch(self, ert, cases, keys):
+        case, key = cases[0], keys[0]
+        self.cases.append(case)
+
+        if case == "empty":
+            return DataFrame()
+
+        return DataFrame({(case, key): Series([1.0, 2.0])})
+
+
+class PlotContextTest(ErtTest):
+
+    def test_gather_case_data(self):
+        cases = ["default", "empty", "other", "third"]
+        gatherer = MockDataGatherer()
+        plot_context = PlotContext(None, None, None, cases, "FOPR", gatherer)
+
+        data = plot_context.gatherCaseData("FOPR")
+
+        self.assertEqual(list(data.columns), [("default", "FOPR"), ("other", "FOPR"), ("third", "FOPR")])
+        self.assertEqual(gatherer.cases, cases)
+        self.assertEqual(list(plot_context.caseLoadTimes().keys()), cases)
+        self.assertEqual(list(PlotContext.lastCaseLoadTimes().keys()), cases)
+
+    def test_gather_without_cases(self):
+        gatherer = MockDataGatherer()
+        self.assertTrue(PlotContext(None, None, None, [], "FOPR", gatherer).gatherCaseData("FOPR").empty)
+        self.assertEqual(gatherer.cases, [])
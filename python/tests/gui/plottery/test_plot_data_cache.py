@@ -0,0 +1,104 @@
+from threading import Thread
+
+from pandas import DataFrame
+
+from tests import ErtTest
+from ert_gui.plottery import PlotDataCache
+
+
+class SizedValue(object):
+    def __init__(self, nbytes):
+        self.nbytes = nbytes
+
+
+class PlotDataCacheTest(ErtTest):
+
+    def test_hits_and_misses(self):
+        cache = PlotDataCache()
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return SizedValue(10)
+
+        first = cache.get("default", "FOPR", "data", loader)
+        second = cache.get("default", "FOPR", "data", loader)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.memory_usage, 10)
+
+        cache.get("default", "FOPR", "history", loader)
+        self.assertEqual(len(loads), 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = PlotDataCache(memory_limit=25)
+
+        cache.insert("default", "A", "data", SizedValue(10))
+        cache.insert("default", "B", "data", SizedValue(10))
+        cache.get("default", "A", "data", lambda: None)
+        cache.insert("default", "C", "data", SizedValue(10))
+
+        self.assertIn(("default", "A", "data"), cache)
+        self.assertNotIn(("default", "B", "data"), cache)
+        self.assertIn(("default", "C", "data"), cache)
+        self.assertEqual(cache.memory_usage, 20)
+
+        cache.insert("default", "D", "data", SizedValue(100))
+        self.assertNotIn(("default", "D", "data"), cache)
+
+    def test_invalidation(self):
+        cache = PlotDataCache()
+        cache.insert("default", "A", "data", SizedValue(10))
+        cache.insert("other", "A", "data", SizedValue(10))
+
+        cache.validateCaseStamp("default", (1, 1))
+        cache.validateCaseStamp("default", (1, 1))
+        self.assertIn(("default", "A", "data"), cache)
+
+        cache.validateCaseStamp("default", (1, 2))
+        self.assertNotIn(("default", "A", "data"), cache)
+        self.assertIn(("other", "A", "data"), cache)
+        self.assertEqual(cache.memory_usage, 10)
+
+        owner = object()
+        cache.validateOwner(owner)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.memory_usage, 0)
+
+    def test_shared_instance(self):
+        self.assertIs(PlotDataCache.sharedInstance(), PlotDataCache.sharedInstance())
+
+    def test_values_are_returned_as_copies(self):
+        cache = PlotDataCache()
+        first = cache.get("default", "FOPR", "data", lambda: DataFrame({"FOPR": [1.0, 2.0]}))
+        first["FOPR"] = 10.0
+
+        second = cache.get("default", "FOPR", "data", lambda: None)
+        self.assertIsNot(first, second)
+        self.assertEqual(list(second["FOPR"]), [1.0, 2.0])
+
+        self.assertIs(cache.get("default", "FOPR", "data", lambda: None, copy=False), cache.get("default", "FOPR", "data", lambda: None, copy=False))
+
+    def test_loaded_bytes_are_counted_per_thread(self):
+        cache = PlotDataCache()
+        cache.get("default", "A", "data", lambda: SizedValue(10))
+        cache.get("default", "A", "data", lambda: SizedValue(10))
+        cache.insert("default", "B", "data", SizedValue(5))
+        self.assertEqual(cache.loadedBytes(), 15)
+
+        loaded_bytes = []
+
+        def load():
+            cache.get("default", "C", "data", lambda: SizedValue(20))
+            loaded_bytes.append(cache.loadedBytes())
+
+        thread = Thread(target=load)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(loaded_bytes, [20])
+        self.assertEqual(cache.loadedBytes(), 15)
@@ -0,0 +1,111 @@
+from threading import Thread
+
+from pandas import Series
+
+from tests import ErtTest
+from ert_gui.plottery import PlotDataCache, PlotDataGatherer
+
+
+class MockFsManager(object):
+    def __init__(self):
+        self.state_map_reads = []
+        self.state_map = [1, 1, 1]
+
+    def getStateMapForCase(self, case):
+        self.state_map_reads.append(case)
+        return self.state_map
+
+
+class MockErt(object):
+    def __init__(self):
+        self.fs_manager = MockFsManager()
+
+    def getEnkfFsManager(self):
+        return self.fs_manager
+
+
+class PlotDataGathererTest(ErtTest):
+
+    def setUp(self):
+        self.batch_calls = []
+        self.single_calls = []
+
+    def gatherData(self, ert, case, key):
+        self.assertLocked()
+        self.single_calls.append((case, key))
+        return Series([1.0, 2.0], name=key)
+
+    def gatherDataBatch(self, ert, case, keys):
+        self.assertLocked()
+        self.batch_calls.append((case, list(keys)))
+        realizations = [0, 1, 2] if case == "default" else [0, 1]
+        return {key: Series([float(index) for index in realizations], index=realizations) for key in keys}
+
+    def assertLocked(self):
+        acquired = []
+
+        def tryLock():
+            if PlotDataGatherer.STORAGE_LOCK.acquire(False):
+                PlotDataGatherer.STORAGE_LOCK.release()
+                acquired.append(True)
+            else:
+                acquired.append(False)
+
+        thread = Thread(target=tryLock)
+        thread.start()
+        thread.join()
+
+        self.assertFalse(acquired[0], "The storage is accessed without holding the storage lock")
+
+    def createGatherer(self, batch=True):
+        batch_function = self.gatherDataBatch if batch else None
+        return PlotDataGatherer(self.gatherData, lambda key: True, batchGatherFunc=batch_function, cache=PlotDataCache())
+
+    def test_one_load_per_case(self):
+        ert = MockErt()
+        gatherer = self.createGatherer()
+
+        data = gatherer.gatherDataBatch(ert, ["default", "other"], ["A", "B"])
+
+        self.assertEqual(self.batch_calls, [("default", ["A", "B"]), ("other", ["A", "B"])])
+        self.assertEqual(self.single_calls, [])
+        self.assertEqual(list(data.columns), [("default", "A"), ("default", "B"), ("other", "A"), ("other", "B")])
+        self.assertEqual(len(data["other", "A"].dropna()), 2)
+        self.assertEqual(len(data["default", "B"]), 3)
+
+        gatherer.gatherData(ert, "other", "B")
+        gatherer.gatherDataBatch(ert, ["default", "other"], ["A", "C"])
+
+        self.assertEqual(self.batch_calls[2:], [("default", ["C"]), ("other", ["C"])])
+        self.assertEqual(self.single_calls, [])
+
+    def test_without_batch_function(self):
+        gatherer = self.createGatherer(batch=False)
+
+        data = gatherer.gatherDataBatch(MockErt(), ["default"], ["A", "B"])
+
+        self.assertEqual(self.single_calls, [("default", "A"), ("default", "B")])
+        self.assertEqual(list(data.columns), [("default", "A"), ("default", "B")])
+        self.assertTrue(gatherer.gatherDataBatch(MockErt(), [], ["A"]).empty)
+
+    def test_written_case_is_gathered_again(self):
+        ert = MockErt()
+        gatherer = self.createGatherer(batch=False)
+
+        gatherer.gatherData(ert, "default", "A")
+        gatherer.gatherData(ert, "default", "A")
+        self.assertEqual(ert.fs_manager.state_map_reads, ["default", "default"])
+        self.assertEqual(self.single_calls, [("default", "A")])
+
+        ert.fs_manager.state_map = [1, 1, 2]
+        gatherer.gatherData(ert, "default", "A")
+        self.assertEqual(self.single_calls, [("default", "A"), ("default", "A")])
+
+    def test_gathered_data_is_a_copy(self):
+        ert = MockErt()
+        gatherer = self.createGatherer(batch=False)
+
+        data = gatherer.gatherData(ert, "default", "A")
+        data[0] = 100.0
+
+        self.assertEqual(gatherer.gatherData(ert, "default", "A")[0], 1.0)
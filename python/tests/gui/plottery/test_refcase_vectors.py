@@ -0,0 +1,58 @@
+import numpy
+
+from tests import ErtTest
+from ert_gui.plottery import RefcaseVectors
+
+
+class MockRefcase(object):
+    def __init__(self):
+        self.load_count = 0
+        self.numpy_dates = numpy.arange("2000-01-01", "2000-01-05", dtype="datetime64[D]")
+
+    def __contains__(self, key):
+        return key == "FOPR"
+
+    def numpy_vector(self, key, report_only=False):
+        self.load_count += 1
+        return numpy.array([0.0, 1.0, 2.0, 3.0])
+
+
+class MockEclConfig(object):
+    def __init__(self, refcase):
+        self._refcase = refcase
+
+    def getRefcase(self):
+        return self._refcase
+
+
+class MockErt(object):
+    def __init__(self, refcase):
+        self._ecl_config = MockEclConfig(refcase)
+
+    def eclConfig(self):
+        return self._ecl_config
+
+
+class RefcaseVectorsTest(ErtTest):
+
+    def tearDown(self):
+        RefcaseVectors.clear()
+
+    def test_vector_is_cached_per_ert(self):
+        refcase = MockRefcase()
+        ert = MockErt(refcase)
+
+        dates, values = RefcaseVectors.getVector(ert, "FOPR")
+        self.assertEqual(list(values), [1.0, 2.0, 3.0])
+        self.assertEqual(len(dates), 3)
+        self.assertEqual(dates[0], numpy.datetime64("2000-01-02"))
+
+        RefcaseVectors.getVector(ert, "FOPR")
+        self.assertEqual(refcase.load_count, 1)
+
+        RefcaseVectors.getVector(MockErt(refcase), "FOPR")
+        self.assertEqual(refcase.load_count, 2)
+
+    def test_missing_vector(self):
+        self.assertIsNone(RefcaseVectors.getVector(MockErt(MockRefcase()), "WOPR:OP1"))
+        self.assertIsNone(RefcaseVectors.getVector(MockErt(None), "FOPR"))
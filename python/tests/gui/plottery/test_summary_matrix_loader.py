@@ -0,0 +1,60 @@
+import numpy
+from pandas import DataFrame, MultiIndex, date_range
+
+from tests import ErtTest
+from ert_gui.plottery import SummaryMatrixLoader
+
+
+def createLongFormatData(realizations, dates, key):
+    index = MultiIndex.from_product([realizations, dates], names=["Realization", "Date"])
+    values = numpy.arange(len(index), dtype=numpy.float64)
+    return DataFrame({key: values}, index=index)
+
+
+class SummaryMatrixLoaderTest(ErtTest):
+
+    def test_matrix_equals_pivot(self):
+        data = createLongFormatData([0, 2, 5], date_range("2000-01-01", periods=4), "FOPR")
+
+        matrix = SummaryMatrixLoader.toMatrix(data, "FOPR")
+        pivot = data.reset_index().pivot(index="Date", columns="Realization", values="FOPR")
+
+        self.assertEqual(matrix.shape, (4, 3))
+        self.assertEqual(list(matrix.columns), [0, 2, 5])
+        self.assertEqual(matrix.index.name, "Date")
+        self.assertTrue(matrix.equals(pivot))
+
+    def test_identical_duplicate_dates_are_dropped(self):
+        dates = list(date_range("2000-01-01", periods=3))
+        dates.append(dates[-1])
+        data = createLongFormatData([0, 1], dates, "FOPR")
+        data.iloc[3, 0] = data.iloc[2, 0]
+        data.iloc[7, 0] = data.iloc[6, 0]
+
+        matrix = SummaryMatrixLoader.toMatrix(data, "FOPR")
+        pivot = data.reset_index().drop_duplicates().pivot(index="Date", columns="Realization", values="FOPR")
+
+        self.assertEqual(matrix.shape, (3, 2))
+        self.assertEqual(list(matrix[1].values), [4.0, 5.0, 6.0])
+        self.assertTrue(matrix.equals(pivot))
+
+    def test_conflicting_duplicate_dates_fail_as_the_pivot(self):
+        dates = list(date_range("2000-01-01", periods=3))
+        dates.append(dates[-1])
+        data = createLongFormatData([0, 1], dates, "FOPR")
+        data.iloc[3, 0] = data.iloc[2, 0]
+
+        with self.assertRaises(ValueError):
+            data.reset_index().drop_duplicates().pivot(index="Date", columns="Realization", values="FOPR")
+
+        with self.assertRaises(ValueError):
+            SummaryMatrixLoader.toMatrix(data, "FOPR")
+
+    def test_non_product_layout_falls_back_to_pivot(self):
+        data = createLongFormatData([0, 1], date_range("2000-01-01", periods=3), "FOPR")
+        data = data.iloc[[0, 1, 2, 4, 3, 5]]
+
+        matrix = SummaryMatrixLoader.toMatrix(data, "FOPR")
+        pivot = data.reset_index().pivot(index="Date", columns="Realization", values="FOPR")
+
+        self.assertTrue(matrix.equals(pivot))
@@ -0,0 +1,105 @@
+try:
+  from PyQt4.QtCore import QCoreApplication, QEventLoop, QTimer
+except ImportError:
+  from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from tests import ErtTest
+from ert_gui.ertnotifier import ErtNotifier
+
+
+class SignalRecorder(object):
+
+    def __init__(self, notifier):
+        self.emitted = []
+        notifier.configChanged.connect(lambda: self.emitted.append("config"))
+        notifier.caseListChanged.connect(lambda: self.emitted.append("case_list"))
+        notifier.currentCaseChanged.connect(lambda: self.emitted.append("current_case"))
+        notifier.caseDataChanged.connect(lambda case: self.emitted.append("case_data:%s" % case))
+        notifier.ertChanged.connect(lambda: self.emitted.append("ert"))
+
+
+class ErtNotifierTest(ErtTest):
+    application = None
+
+    def createNotifier(self):
+        notifier = ErtNotifier(object(), "config_file")
+        return notifier, SignalRecorder(notifier)
+
+    def requireApplication(self):
+        if QCoreApplication.instance() is None:
+            ErtNotifierTest.application = QCoreApplication([])
+
+    def runEventLoop(self):
+        loop = QEventLoop()
+        QTimer.singleShot(10, loop.quit)
+        loop.exec_()
+
+    def test_changes_are_emitted_immediately_without_application(self):
+        if QCoreApplication.instance() is not None:
+            self.skipTest("An application has already been created")
+
+        notifier, recorder = self.createNotifier()
+        notifier.emitErtChange(ErtNotifier.CONFIG)
+        self.assertEqual(recorder.emitted, ["config", "ert"])
+
+        notifier.emitErtChange(ErtNotifier.CASE_DATA, case="default")
+        self.assertEqual(recorder.emitted, ["config", "ert", "case_data:default", "ert"])
+        self.assertEqual(notifier.counters()["flushes"], 2)
+
+    def test_changes_are_deferred_to_the_event_loop(self):
+        self.requireApplication()
+        notifier, recorder = self.createNotifier()
+
+        notifier.emitErtChange(ErtNotifier.CURRENT_CASE)
+        self.assertEqual(recorder.emitted, [])
+
+        self.runEventLoop()
+        self.assertEqual(recorder.emitted, ["current_case", "ert"])
+
+    def test_coalesced_changes_are_emitted_once_per_flag(self):
+        self.requireApplication()
+        notifier, recorder = self.createNotifier()
+
+        notifier.emitErtChange(ErtNotifier.CONFIG)
+        notifier.emitErtChange(ErtNotifier.CASE_LIST | ErtNotifier.CONFIG)
+        notifier.emitErtChange(ErtNotifier.CASE_DATA, case="default")
+        notifier.emitErtChange(ErtNotifier.CASE_DATA, case="default")
+        notifier.emitErtChange(ErtNotifier.CASE_DATA, case="other")
+        self.runEventLoop()
+
+        self.assertEqual(recorder.emitted, ["config", "case_list", "case_data:default", "case_data:other", "ert"])
+        self.assertEqual(notifier.counters(), {"changes": 5, "flushes": 1})
+
+        recorder.emitted = []
+        notifier.emitErtChange(ErtNotifier.CASE_DATA, case="default")
+        notifier.emitErtChange(ErtNotifier.CASE_DATA)
+        notifier.emitErtChange(ErtNotifier.CASE_DATA, case="other")
+        self.runEventLoop()
+
+        self.assertEqual(recorder.emitted, ["case_data:", "ert"])
+
+    def test_generation(self):
+        notifier = ErtNotifier(object(), "config_file")
+        self.assertEqual(notifier.generation, 0)
+
+        notifier.emitErtChange(ErtNotifier.CONFIG)
+        notifier.emitErtChange(ErtNotifier.CASE_LIST)
+        self.assertEqual(notifier.generation, 2)
+
+        notifier.flushErtChanges()
+        self.assertEqual(notifier.generation, 2)
+
+        notifier.countRepopulate("Model")
+        self.assertEqual(notifier.counters()["repopulate:Model"], 1)
+
+        notifier.resetCounters()
+        self.assertEqual(notifier.counters(), {})
+        self.assertEqual(notifier.generation, 2)
+
+    def test_undefined_ert(self):
+        notifier = ErtNotifier(None, None)
+
+        with self.assertRaises(ValueError):
+            notifier.emitErtChange()
+
+        self.assertEqual(notifier.generation, 0)